@@ -0,0 +1,249 @@
+"""Skrypt umożliwiający nieinteraktywne obliczenie 'własnej' inflacji dla wszystkich plików z wagami
+znajdujących się w podanym katalogu
+
+Pliki z wagami muszą mieć format taki sam jak pliki zapisywane przez program (linie 'kategoria -> waga').
+Wagi walidowane są tak samo jak w skrypcie weights_import.py, a niepoprawne pliki są pomijane i wypisywane
+na standardowe wyjście błędów.
+Zamiast katalogu można podać plik bazy danych z zestawami wag (klasa WeightsStore) - zestawy wag odczytywane są
+wtedy z bazy danych porcjami bezpośrednio do macierzy.
+Wyniki zapisywane są do pliku .csv lub do pliku JSON Lines. Przykład użycia:
+
+    python batch_mode.py katalog_z_wagami --start I.2021 --end III.2022 --output wyniki.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import numpy as np
+from dataset_registry import get_inflation_data
+from own_inflation_engine import OwnInflationEngine
+from weights_import import import_weight_files
+from weights_store import WeightsStore
+
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def parse_month(value):
+    """Zamienia miesiąc zapisany w postaci 'miesiąc.rok' (np. 'III.2022') na tuplę z miesiącem i rokiem
+
+    Parameters
+    ----------
+    value : str
+        miesiąc zapisany jako cyfra rzymska oraz rok oddzielone kropką
+
+    Returns
+    -------
+    tupla zawierająca miesiąc i rok
+
+    Raises
+    -------
+    argparse.ArgumentTypeError
+        Jeśli wartość nie jest zapisana w formacie 'miesiąc.rok'
+    """
+
+    month, separator, year = value.partition('.')
+    if not separator or not month or not year:
+        raise argparse.ArgumentTypeError(f"Miesiąc należy podać w formacie 'miesiąc.rok', np. 'III.2022': {value}")
+
+    return month, year
+
+
+def iter_weight_files(directory, chunk_size):
+    """Zwraca kolejne porcje ścieżek do plików z wagami znajdujących się w katalogu
+
+    Parameters
+    ----------
+    directory : str
+        katalog z plikami tekstowymi z wagami
+    chunk_size : int
+        maksymalna liczba plików w jednej porcji
+
+    Yields
+    -------
+    lista ścieżek do plików .txt
+    """
+
+    chunk = []
+    for entry in sorted(os.scandir(directory), key=lambda item: item.name):
+        if entry.is_file() and entry.name.endswith('.txt'):
+            chunk.append(entry.path)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_profiles(paths, engine):
+    """Odczytuje i waliduje wagi z plików i zamienia je na macierz (zestawy wag x kategorie)
+
+    Wagi walidowane są tak samo jak przy imporcie plików z wagami (funkcja import_weight_files) - pliki z błędami
+    odczytu, brakującymi lub nieznanymi kategoriami, wagami spoza zakresu 0-100 lub sumą wag różną od 100 są pomijane,
+    a informacja o błędzie wypisywana jest na standardowe wyjście błędów.
+
+    Parameters
+    ----------
+    paths : list
+        lista ścieżek do plików z wagami
+    engine : obiekt klasy OwnInflationEngine
+        silnik wykorzystywany do uporządkowania wag według kategorii
+
+    Returns
+    -------
+    names : list
+        lista nazw poprawnych zestawów wag
+    weights : numpy.ndarray
+        macierz z wagami
+    """
+
+    names, weights, errors = import_weight_files(paths, engine.categories, workers=1)
+    for error in errors:
+        print(f"Pominięto plik {error['path']}: {error['message']}", file=sys.stderr)
+
+    return names, weights
+
+
+def iter_profile_chunks(source, engine, chunk_size):
+    """Zwraca kolejne porcje zestawów wag z katalogu z plikami .txt lub z bazy danych z zestawami wag
+
+    Parameters
+    ----------
+    source : str
+        katalog z plikami tekstowymi z wagami lub plik bazy danych z zestawami wag
+    engine : obiekt klasy OwnInflationEngine
+        silnik wykorzystywany do uporządkowania wag według kategorii
+    chunk_size : int
+        maksymalna liczba zestawów wag w jednej porcji
+
+    Yields
+    -------
+    names : list
+        lista nazw zestawów wag
+    weights : numpy.ndarray
+        macierz z wagami
+
+    Raises
+    -------
+    ValueError
+        Jeśli kategorie w bazie danych różnią się od kategorii w pliku z danymi
+    """
+
+    if os.path.isfile(source):
+        with WeightsStore(source, engine.categories) as store:
+            yield from store.iter_matrices(chunk_size)
+    else:
+        for paths in iter_weight_files(source, chunk_size):
+            yield read_profiles(paths, engine)
+
+
+def run_batch(directory, start, end, output, output_format='csv', chunk_size=1024,
+              data_path="dane_inflacja.csv"):
+    """Oblicza 'własną' inflację dla wszystkich plików z wagami z katalogu i zapisuje wyniki do pliku
+
+    Parameters
+    ----------
+    directory : str
+        katalog z plikami tekstowymi z wagami lub plik bazy danych z zestawami wag
+    start : tuple
+        tupla z miesiącem i rokiem rozpoczynającymi zakres obliczeń
+    end : tuple
+        tupla z miesiącem i rokiem kończącymi zakres obliczeń
+    output : str
+        ścieżka do pliku wynikowego
+    output_format : str
+        format pliku wynikowego - 'csv' lub 'jsonl'
+    chunk_size : int
+        liczba zestawów wag przetwarzanych jednocześnie
+    data_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+
+    Returns
+    -------
+    profiles_count : int
+        liczba przetworzonych zestawów wag
+
+    Raises
+    -------
+    ValueError
+        Jeśli dane nie obejmują podanych miesięcy lub początek zakresu jest późniejszy niż jego koniec
+    """
+
+    data = get_inflation_data(data_path)
+    engine = OwnInflationEngine(data)
+
+    first_row = data.get_row_index(*start)
+    last_row = data.get_row_index(*end)
+    if first_row > last_row:
+        raise ValueError("Początek zakresu musi być wcześniejszy niż jego koniec!")
+
+    months = data.get_available_months()[first_row:last_row + 1]
+    gus_inflation = np.round(data.values[first_row:last_row + 1, 0] - 100, 4).tolist()
+    profiles_count = 0
+
+    with open(output, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as file:
+        writer = csv.writer(file, delimiter=';')
+        if output_format == 'csv':
+            writer.writerow(['Profil', 'Miesiac', 'Rok', 'Inflacja wlasna', 'Inflacja GUS'])
+
+        for names, weights in iter_profile_chunks(directory, engine, chunk_size):
+            own_inflation = engine.calculate(weights)[:, first_row:last_row + 1] - 100
+
+            for name, series in zip(names, own_inflation.tolist()):
+                if output_format == 'csv':
+                    writer.writerows([name, month, year, round(own, 4), gus]
+                                     for (month, year), own, gus in zip(months, series, gus_inflation))
+                else:
+                    file.writelines(json.dumps({'profile': name, 'month': month, 'year': year,
+                                                'own_inflation': round(own, 4), 'gus_inflation': gus},
+                                               ensure_ascii=False) + '\n'
+                                    for (month, year), own, gus in zip(months, series, gus_inflation))
+
+            profiles_count += len(names)
+
+    return profiles_count
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń i uruchamia obliczenia
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Oblicza 'własną' inflację dla wszystkich plików z wagami z katalogu.")
+    parser.add_argument('directory', help="katalog z plikami .txt z wagami lub plik bazy danych z zestawami wag")
+    parser.add_argument('--start', type=parse_month, required=True, help="pierwszy miesiąc, np. I.2021")
+    parser.add_argument('--end', type=parse_month, required=True, help="ostatni miesiąc, np. III.2022")
+    parser.add_argument('--output', required=True, help="ścieżka do pliku wynikowego")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help="format pliku wynikowego")
+    parser.add_argument('--chunk-size', type=int, default=1024, help="liczba zestawów wag w jednej porcji")
+    parser.add_argument('--data', default="dane_inflacja.csv", help="plik .csv z danymi dotyczącymi inflacji")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    try:
+        profiles_count = run_batch(args.directory, args.start, args.end, args.output, args.format,
+                                   args.chunk_size, args.data)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Przetworzono {profiles_count} zestawów wag w {elapsed:.3f} s "
+          f"({profiles_count / elapsed if elapsed else 0:.0f} zestawów wag/s).", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Skrypt z zestawem testów wydajności podstawowych operacji programu
+
+Testy nie wymagają podawania danych przez użytkownika - dane generowane są syntetycznie w formacie takim samym
+jak format pliku 'dane_inflacja.csv' (liczba miesięcy, kategorii oraz zestawów wag jest konfigurowalna).
+Dla każdej operacji mierzone są percentyle czasu wykonania, przepustowość oraz szczytowe zużycie pamięci.
+Wyniki zapisywane są do pliku JSON, dzięki czemu można porównywać kolejne uruchomienia. Przykład użycia:
+
+    python benchmark.py --months 1200 --categories 100 --profiles 10000 --output wyniki.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+from inflation_data import InflationData, ROMAN_MONTHS
+from own_inflation_engine import OwnInflationEngine
+from savings_engine import calculate_real_savings
+from show_savings_on_graph import ShowSavingsOnGraph
+
+
+def generate_synthetic_csv(file_path, months=180, categories=12, seed=0):
+    """Zapisuje syntetyczne dane dotyczące inflacji w formacie pliku 'dane_inflacja.csv'
+
+    Inflacja w każdej kategorii jest błądzeniem losowym wokół wartości 100, a inflacja ogółem jest średnią
+    ważoną inflacji w kategoriach z losowymi wagami.
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do tworzonego pliku .csv
+    months : int
+        liczba miesięcy (pierwszy miesiąc to styczeń 2000 roku)
+    categories : int
+        liczba kategorii towarów i usług
+    seed : int
+        ziarno generatora liczb losowych
+    """
+
+    generator = np.random.default_rng(seed)
+    category_values = 100 + np.cumsum(generator.normal(0, 0.4, size=(months, categories)), axis=0)
+    basket = generator.dirichlet(np.ones(categories))
+    total_values = category_values @ basket
+
+    with open(file_path, 'w') as file:
+        file.write(';'.join(['Miesiac', 'Rok', 'Ogolem'] + [f"Kategoria {i + 1}" for i in range(categories)]) + '\n')
+        for row in range(months):
+            month, year = ROMAN_MONTHS[row % 12 + 1], 2000 + row // 12
+            values = ';'.join(f"{value:.1f}" for value in [total_values[row], *category_values[row]])
+            file.write(f"{month};{year};{values}\n")
+
+
+def generate_weight_profiles(profiles=1000, categories=12, seed=0):
+    """Tworzy losowe zestawy wag (liczby całkowite sumujące się do 100)
+
+    Parameters
+    ----------
+    profiles : int
+        liczba zestawów wag
+    categories : int
+        liczba kategorii towarów i usług
+    seed : int
+        ziarno generatora liczb losowych
+
+    Returns
+    -------
+    macierz (zestawy wag x kategorie) z wagami
+    """
+
+    generator = np.random.default_rng(seed)
+    return generator.multinomial(100, np.full(categories, 1 / categories), size=profiles).astype(np.float64)
+
+
+def measure(operation, repeats, items=1):
+    """Mierzy czas wykonania, przepustowość oraz szczytowe zużycie pamięci operacji
+
+    Parameters
+    ----------
+    operation : callable
+        mierzona operacja (funkcja bez argumentów)
+    repeats : int
+        liczba pomiarów czasu wykonania
+    items : int
+        liczba elementów (np. zestawów wag) przetwarzanych w jednym wykonaniu operacji
+
+    Returns
+    -------
+    result : dict
+        słownik z percentylami czasu wykonania w ms, przepustowością (elementy/s) oraz szczytowym zużyciem
+        pamięci w bajtach
+    """
+
+    operation()
+
+    latencies = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    operation()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies = np.array(latencies) * 1000
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]).tolist()
+    result = {'repeats': repeats, 'mean_ms': float(latencies.mean()), 'p50_ms': p50, 'p90_ms': p90, 'p99_ms': p99,
+              'throughput_per_s': items / (p50 / 1000) if p50 else float('inf'), 'peak_memory_bytes': peak_memory}
+
+    return result
+
+
+def run_benchmarks(months=180, categories=12, profiles=1000, repeats=20, seed=0):
+    """Uruchamia testy wydajności wszystkich podstawowych operacji
+
+    Parameters
+    ----------
+    months : int
+        liczba miesięcy w syntetycznych danych
+    categories : int
+        liczba kategorii w syntetycznych danych
+    profiles : int
+        liczba zestawów wag w teście obliczania 'własnej' inflacji dla wielu zestawów wag
+    repeats : int
+        liczba pomiarów każdej operacji
+    seed : int
+        ziarno generatora liczb losowych
+
+    Returns
+    -------
+    słownik, którego kluczami są nazwy operacji, a wartościami wyniki pomiarów
+    """
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'dane_inflacja.csv')
+        generate_synthetic_csv(csv_path, months, categories, seed)
+
+        results['load_csv'] = measure(lambda: InflationData(csv_path), repeats)
+        InflationData(csv_path, use_binary_cache=True)
+        results['load_binary_cache'] = measure(lambda: InflationData(csv_path, use_binary_cache=True), repeats)
+
+        data = InflationData(csv_path)
+        engine = OwnInflationEngine(data)
+        weights = generate_weight_profiles(profiles, categories, seed)
+        last_month = data.get_available_months()[-1]
+
+        results['get_category_inflation'] = measure(lambda: data.get_category_inflation(categories // 2), repeats)
+        results['total_inflation_in_specific_month'] = measure(
+            lambda: data.total_inflation_in_specific_month(*last_month), repeats)
+        results['own_inflation_single_profile'] = measure(lambda: engine.calculate(weights[0]), repeats)
+        results['own_inflation_batch'] = measure(lambda: engine.calculate(weights), repeats, items=profiles)
+
+        savings = ShowSavingsOnGraph.__new__(ShowSavingsOnGraph)
+        savings.inflation = [2.5, 5.0, 10.0]
+        savings.money_amount = 10000
+        savings.savings_period = 30
+        savings.compounding = 'annual'
+
+        def show_savings_graph():
+            with contextlib.redirect_stdout(io.StringIO()):
+                savings.show_graph()
+            plt.close('all')
+
+        results['savings_show_graph'] = measure(show_savings_graph, max(1, repeats // 4))
+
+        rates = np.linspace(0, 20, 500)
+        results['savings_engine_grid'] = measure(
+            lambda: calculate_real_savings(10000, rates, 100, 'monthly'), repeats, items=rates.size)
+
+    return results
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń, uruchamia testy wydajności i zapisuje wyniki
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Testy wydajności podstawowych operacji programu.")
+    parser.add_argument('--months', type=int, default=180, help="liczba miesięcy w syntetycznych danych")
+    parser.add_argument('--categories', type=int, default=12, help="liczba kategorii w syntetycznych danych")
+    parser.add_argument('--profiles', type=int, default=1000, help="liczba zestawów wag")
+    parser.add_argument('--repeats', type=int, default=20, help="liczba pomiarów każdej operacji")
+    parser.add_argument('--seed', type=int, default=0, help="ziarno generatora liczb losowych")
+    parser.add_argument('--output', default='benchmark_results.json', help="plik JSON z wynikami")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.months, args.categories, args.profiles, args.repeats, args.seed)
+
+    print(f"{'operacja':<36}{'p50 [ms]':>12}{'p99 [ms]':>12}{'przepustowość [1/s]':>22}{'pamięć [KiB]':>14}")
+    for name, result in results.items():
+        print(f"{name:<36}{result['p50_ms']:>12.3f}{result['p99_ms']:>12.3f}"
+              f"{result['throughput_per_s']:>22.1f}{result['peak_memory_bytes'] / 1024:>14.1f}")
+
+    report = {'parameters': vars(args), 'python': platform.python_version(), 'numpy': np.__version__,
+              'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"\nWyniki zapisano w pliku {args.output}.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Moduł obsługujący binarną pamięć podręczną (plik '<nazwa pliku .csv>.cache') z odczytanymi danymi dotyczącymi
+inflacji
+
+Plik pamięci podręcznej ma następujący format:
+- 8 bajtów - sygnatura b'INFLBIN\\x00';
+- 4 bajty - wersja formatu (liczba całkowita bez znaku, little-endian);
+- 4 bajty - długość nagłówka JSON w bajtach (liczba całkowita bez znaku, little-endian);
+- nagłówek JSON - skrót SHA-256, rozmiar i czas modyfikacji pliku .csv, nazwy kolumn oraz liczba wierszy;
+- tablica kluczy okresów (rrrrmm) typu int64 wyrównana do 64 bajtów;
+- macierz wartości typu float64 (wiersze x kolumny) wyrównana do 64 bajtów.
+
+Tablice odczytywane są bez kopiowania przy użyciu funkcji numpy.memmap, dzięki czemu wiele procesów korzysta
+z tych samych stron pamięci podręcznej systemu operacyjnego.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import numpy as np
+from instrumentation import instrumented
+
+
+CACHE_MAGIC = b'INFLBIN\x00'
+CACHE_VERSION = 1
+CACHE_ALIGNMENT = 64
+_PREAMBLE = struct.Struct('<8sII')
+
+
+def calculate_file_hash(file_path, size=None, hexdigest=True):
+    """Liczy skrót SHA-256 zawartości pliku
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do pliku
+    size : int
+        liczba początkowych bajtów pliku, z których liczony jest skrót (domyślnie cały plik)
+    hexdigest : bool
+        określa, czy zwrócić skrót w postaci szesnastkowej, czy obiekt hashlib umożliwiający dalsze obliczenia
+
+    Returns
+    -------
+    skrót SHA-256 zawartości pliku zapisany w postaci szesnastkowej lub obiekt hashlib
+    """
+
+    file_hash = hashlib.sha256()
+    remaining = size
+    with open(file_path, 'rb') as file:
+        while remaining is None or remaining > 0:
+            block = file.read(1 << 20 if remaining is None else min(1 << 20, remaining))
+            if not block:
+                break
+            file_hash.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+
+    return file_hash.hexdigest() if hexdigest else file_hash
+
+
+def get_cache_path(csv_path):
+    """
+    Returns
+    ----------
+    ścieżka do pliku pamięci podręcznej odpowiadającego danemu plikowi .csv
+    """
+    return csv_path + '.cache'
+
+
+def _align(offset):
+    """Zwraca najmniejszą wielokrotność CACHE_ALIGNMENT nie mniejszą od podanej wartości"""
+    return -(-offset // CACHE_ALIGNMENT) * CACHE_ALIGNMENT
+
+
+def write_binary_cache(csv_path, headers, period_keys, values, source_hash, source_size, source_mtime_ns):
+    """Zapisuje odczytane dane do pliku pamięci podręcznej obok pliku .csv
+
+    Plik zapisywany jest najpierw pod nazwą tymczasową, a następnie podmieniany, więc inne procesy nigdy nie
+    odczytują niekompletnego pliku. Błędy zapisu (np. brak uprawnień do katalogu) są ignorowane.
+
+    Parameters
+    ----------
+    csv_path : str
+        ścieżka do pliku .csv, z którego odczytano dane
+    headers : list
+        lista z nagłówkami danych znajdujących się w pliku .csv
+    period_keys : numpy.ndarray
+        tablica z kluczami okresów (rrrrmm)
+    values : numpy.ndarray
+        macierz z wartościami inflacji
+    source_hash : str
+        skrót SHA-256 zawartości pliku .csv
+    source_size : int
+        rozmiar pliku .csv w bajtach, który odpowiada odczytanym danym
+    source_mtime_ns : int
+        czas modyfikacji pliku .csv w nanosekundach odczytany przed odczytaniem jego zawartości (a nie w chwili
+        zapisu pamięci podręcznej, bo plik mógł się w międzyczasie zmienić)
+
+    Returns
+    -------
+    True, jeśli plik został zapisany, w przeciwnym wypadku False
+    """
+
+    cache_path = get_cache_path(csv_path)
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    rows, columns = values.shape
+
+    try:
+        header = {'source_hash': source_hash, 'source_size': source_size,
+                  'source_mtime_ns': source_mtime_ns, 'headers': headers,
+                  'rows': rows, 'columns': columns}
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        keys_offset = _align(_PREAMBLE.size + len(header_bytes))
+        values_offset = _align(keys_offset + rows * 8)
+
+        with open(temporary_path, 'wb') as file:
+            file.write(_PREAMBLE.pack(CACHE_MAGIC, CACHE_VERSION, len(header_bytes)))
+            file.write(header_bytes)
+            file.seek(keys_offset)
+            file.write(np.ascontiguousarray(period_keys, dtype='<i8').tobytes())
+            file.seek(values_offset)
+            file.write(np.ascontiguousarray(values, dtype='<f8').tobytes())
+
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return False
+
+    return True
+
+
+@instrumented
+def load_binary_cache(csv_path):
+    """Odczytuje dane z pliku pamięci podręcznej, jeśli odpowiada on aktualnej zawartości pliku .csv
+
+    Jeśli rozmiar i czas modyfikacji pliku .csv są takie same jak zapisane w nagłówku - plik .csv nie jest
+    odczytywany. W przeciwnym wypadku porównywany jest skrót SHA-256 zawartości pliku .csv.
+
+    Parameters
+    ----------
+    csv_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+
+    Returns
+    -------
+    cache : dict
+        słownik z nagłówkami, skrótem i rozmiarem pliku .csv oraz tablicami 'period_keys' i 'values'
+        (tablice są mapowane do pamięci w trybie tylko do odczytu)
+        Jeśli pliku pamięci podręcznej nie ma, ma on inny format lub jest nieaktualny - zwracane jest None
+    """
+
+    cache_path = get_cache_path(csv_path)
+
+    try:
+        with open(cache_path, 'rb') as file:
+            magic, version, header_length = _PREAMBLE.unpack(file.read(_PREAMBLE.size))
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                return None
+            header = json.loads(file.read(header_length).decode('utf-8'))
+
+        source_stat = os.stat(csv_path)
+        if (source_stat.st_size, source_stat.st_mtime_ns) != (header['source_size'], header['source_mtime_ns']):
+            if calculate_file_hash(csv_path) != header['source_hash']:
+                return None
+
+        rows, columns = header['rows'], header['columns']
+        keys_offset = _align(_PREAMBLE.size + header_length)
+        values_offset = _align(keys_offset + rows * 8)
+
+        if rows:
+            period_keys = np.memmap(cache_path, dtype='<i8', mode='r', offset=keys_offset, shape=(rows,))
+            values = np.memmap(cache_path, dtype='<f8', mode='r', offset=values_offset, shape=(rows, columns))
+        else:
+            period_keys = np.empty(0, dtype=np.int64)
+            values = np.empty((0, columns), dtype=np.float64)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+    return {'headers': header['headers'], 'source_hash': header['source_hash'],
+            'source_size': header['source_size'], 'period_keys': period_keys, 'values': values}
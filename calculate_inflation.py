@@ -3,12 +3,21 @@ na podstawie danych Głównego Urzędu Statystycznego
 
 Moduł importuje klasy wspomagające działanie klasy CalculateInflation, które umożliwiają:
 - klasa GetUserWeights - podanie przez użytkownika 'własnych' wag w poszczególnych kategoriach wydatków;
-- klasa InflationData - odczytywanie danych dotyczących inflacji zapisanych w pliku .csv.
+- funkcja get_inflation_data - dostęp do współdzielonych danych dotyczących inflacji zapisanych w pliku .csv;
+- klasa OwnInflationEngine - obliczenie 'własnej' inflacji na podstawie podanych wag;
+- funkcja get_own_inflation_cache - dostęp do współdzielonej pamięci podręcznej wyników 'własnej' inflacji;
+- klasa PriceLevelIndex - obliczenie skumulowanej inflacji między dwoma miesiącami;
+- funkcja get_index_transformer - przedstawienie inflacji rok do roku, miesiąc do miesiąca oraz od początku roku.
 """
 
-from inflation_data import InflationData
+from dataset_registry import get_inflation_data
 from get_user_weights import GetUserWeights
+from index_transformation import BASES, ESTIMATED_BASES, get_index_transformer, has_consecutive_months
+from own_inflation_cache import get_own_inflation_cache
+from own_inflation_engine import OwnInflationEngine
+from price_level_index import PriceLevelIndex
 from exceptions import UnavailableChoice
+import math
 import time
 
 
@@ -22,8 +31,18 @@ class CalculateInflation:
         wybór użytkownika z listy możliwych operacji
     user_expenses_weights : dict
         słownik przechowujący wagi podane przez użytkownika
+    dataset : str
+        nazwa zbioru danych lub ścieżka do pliku .csv, na którym wykonywane są obliczenia
     data : obiekt klasy InflationData
         obiekt umożlwiajacy wykonywanie operacji na danych dotyczących inflacji
+    engine : obiekt klasy OwnInflationEngine
+        obiekt obliczający 'własną' inflację na podstawie podanych wag
+    cache : obiekt klasy OwnInflationCache
+        współdzielona pamięć podręczna wyników 'własnej' inflacji
+    price_level_index : obiekt klasy PriceLevelIndex
+        obiekt obliczający skumulowaną inflację między dwoma miesiącami
+    transformer : obiekt klasy IndexTransformer
+        obiekt przedstawiający inflację w różnych ujęciach (rok do roku, miesiąc do miesiąca, od początku roku)
     available_choices : list
         lista z możliwymi operacjami
 
@@ -35,17 +54,32 @@ class CalculateInflation:
         odczytuje i waliduje wybór użytkownika
     operation()
         zapewnia działanie wybranej przez użytkownika opcji
+    validate_month()
+        odczytuje i waliduje miesiąc oraz rok podane przez użytkownika
     calculate_inflation()
         odpowiada za obliczenie 'własnej' inflacji użytkownika w danym miesiącu na podstawie podanych wag
+    cumulative_inflation()
+        odpowiada za obliczenie skumulowanej inflacji między dwoma miesiącami podanymi przez użytkownika
     """
 
-    def __init__(self):
-        """Odpowiada za działanie komponentu programu w pętli while"""
+    def __init__(self, dataset=None):
+        """Odpowiada za działanie komponentu programu w pętli while
+
+        Parameters
+        ----------
+        dataset : str
+            nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv (domyślnie 'dane_inflacja.csv')
+        """
 
         self.user_choice = None
         self.user_expenses_weights = {}
-        self.data = InflationData()
-        self.available_choices = [0, 1, 2, 3]
+        self.dataset = dataset
+        self.data = get_inflation_data(dataset)
+        self.engine = OwnInflationEngine(self.data)
+        self.cache = get_own_inflation_cache()
+        self.price_level_index = PriceLevelIndex(self.data)
+        self.transformer = get_index_transformer(self.data)
+        self.available_choices = [0, 1, 2, 3, 4]
 
         print()
         print("Teraz możesz obliczyć inflację dla twoich wydatków na podstawie danych Głównego Urzędu Statystycznego.\n"
@@ -69,7 +103,8 @@ class CalculateInflation:
         0. Wróć do menu głównego programu,
         1. Podaj wagi twoich wydatków w poszczególnych kategoriach towarów i usług,
         2. Oblicz najaktualniejszą 'własną' inflację w miesiącu, dla którego dostępne są ostatnie dane GUS,
-        3. Oblicz 'własną' inflację w dowolnym miesiącu z okresu {self.data.get_data_time_range()}.""")
+        3. Oblicz 'własną' inflację w dowolnym miesiącu z okresu {self.data.get_data_time_range()},
+        4. Oblicz, o ile wzrosły ceny między dwoma miesiącami.""")
 
     def validate_input(self):
         """Odczytuje wybór użytkownika
@@ -111,12 +146,47 @@ class CalculateInflation:
         """Odpowiada za działanie opcji wybranej przez użytkownika"""
 
         if self.user_choice == 1:
-            instance = GetUserWeights()
+            instance = GetUserWeights(self.dataset)
             self.user_expenses_weights = instance.user_expenses_weights
         elif self.user_choice == 2:
             self.calculate_inflation()
         elif self.user_choice == 3:
             self.calculate_inflation()
+        elif self.user_choice == 4:
+            self.cumulative_inflation()
+
+    def validate_month(self):
+        """Odczytuje i waliduje podany przez użytkownika miesiąc oraz rok
+
+        Returns
+        -------
+        validated_month : tuple
+            zwracana po zwalidowaniu tupla zawierająca podany przez użytkownika miesiąc i rok
+        """
+
+        available_years = self.data.get_available_years()
+
+        print("Podaj rok oraz miesiąc jako cyfrę rzymską.")
+
+        while True:
+            year = input('Podaj rok: ')
+            if year in available_years:
+                print("Podano poprawny rok.")
+                break
+            else:
+                print(f"Brak danych dla podanej wartości. Wybierz jeden z następujących roków: {available_years}.")
+
+        while True:
+            month = input('Podaj miesiąc: ')
+            if self.data.has_month(month, year):
+                validated_month = (month, year)
+                print("Podano poprawny miesiąc oraz poprawny rok.")
+                break
+            else:
+                print("Brak danych dla podanego miesiąca oraz roku. Spróbuj jeszcze raz podać miesiąc "
+                      f"zapisany cyfrą rzymską z okresu {self.data.get_data_time_range()}.")
+
+        return validated_month
 
     def calculate_inflation(self):
         """Odpowiada za obliczenie 'własnej' inflacji użytkownika na podstawie wczesniej podanych wag
@@ -129,42 +199,14 @@ class CalculateInflation:
         Jeśli atrybut 'user_choice' jest równy 3 - liczy inflację dla dowolnego miesiąca wskazanego przez użytkownika
         """
 
-        def validate_month():
-            """Waliduje podany przez użytkownika miesiąc, dla którego obliczona ma zostać 'własna' inflacja
+        def available_bases():
+            """Zwraca ujęcia, w których można przedstawić inflację - jeśli w danych brakuje miesięcy, dostępne jest
+            tylko ujęcie rok do roku"""
 
-            Returns
-            -------
-            validated_month : tuple
-                zwracana po zwalidowaniu tupla zawierająca podany przez użytkownika miesiąc i rok
-            """
+            if has_consecutive_months(self.data.period_keys):
+                return 'yoy', 'mom', 'ytd'
 
-            available_years = self.data.get_available_years()
-            available_months = self.data.get_available_months()
-
-            print()
-            print(f"'Własna' inflacja może zostać obliczona dla dowolnego miesiąca z okresu"
-                  f" {self.data.get_data_time_range()}.")
-            print("Podaj rok oraz miesiąc jako cyfrę rzymską.")
-
-            while True:
-                year = input('Podaj rok: ')
-                if year in available_years:
-                    print("Podano poprawny rok.")
-                    break
-                else:
-                    print(f"Brak danych dla podanej wartości. Wybierz jeden z następujących roków: {available_years}.")
-
-            while True:
-                month = input('Podaj miesiąc: ')
-                if (month, year) in available_months:
-                    validated_month = (month, year)
-                    print("Podano poprawny miesiąc oraz poprawny rok.")
-                    break
-                else:
-                    print("Brak danych dla podanego miesiąca oraz roku. Spróbuj jeszcze raz podać miesiąc "
-                          f"zapisany cyfrą rzymską z okresu {self.data.get_data_time_range()}.")
-
-            return validated_month
+            return 'yoy',
 
         def calculate_own_inflation(month):
             """Liczy 'własną' inflację we wskazanym miesiącu na podstawie wcześniej podanych wag
@@ -176,22 +218,48 @@ class CalculateInflation:
 
             Returns
             -------
-            inflation : float
-                obliczona inflacja rok do roku wyrażona w procentach
+            inflation : dict
+                słownik, którego kluczami są ujęcia ('yoy', 'mom', 'ytd'), a wartościami obliczona inflacja
+                wyrażona w procentach
             """
 
-            categories = self.data.get_headers()[3:]
-            weights_list = []
-            for category in categories:
-                weights_list.append(self.user_expenses_weights[category])
+            weights = self.engine.weights_to_vector(self.user_expenses_weights)
+            own_inflation = self.cache.calculate(self.data, weights)
+            row = self.data.get_row_index(*month)
+            inflation = {basis: float(self.transformer.transform(own_inflation, basis, percent=True)[row])
+                         for basis in available_bases()}
+
+            return inflation
 
-            for element in self.data.inflation_data:
-                if (element[0], element[1]) == month:
-                    inflation = sum([weight/100 * float(category_inflation) for weight, category_inflation
-                                     in zip(weights_list, element[3:])]) - 100
+        def calculate_gus_inflation(month):
+            """Zwraca inflację według wag GUS we wskazanym miesiącu
+
+            Parameters
+            ----------
+            month : tuple
+                tupla zawierająca miesiąc i rok
+
+            Returns
+            -------
+            inflation : dict
+                słownik, którego kluczami są ujęcia ('yoy', 'mom', 'ytd'), a wartościami inflacja wyrażona w procentach
+            """
+
+            row = self.data.get_row_index(*month)
+            inflation = {basis: float(self.transformer.view(basis, percent=True)[row, 0])
+                         for basis in available_bases()}
 
             return inflation
 
+        def describe(inflation):
+            """Zwraca opis inflacji w kolejnych ujęciach (ujęcia, dla których brakuje danych są pomijane,
+            a szacunki są oznaczane)"""
+
+            descriptions = [f"{value:.1f}% {BASES[basis]}{' (szacunek)' if basis in ESTIMATED_BASES else ''}"
+                            for basis, value in inflation.items() if not math.isnan(value)]
+
+            return ', '.join(descriptions)
+
         if not self.user_expenses_weights:
             print('*' * 80)
             print("Nie można obliczyć inflacji, ponieważ nie podałeś wag twoich wydatków.")
@@ -220,26 +288,66 @@ class CalculateInflation:
             else:
                 print("Możesz wpisać tylko wartości 'tak' lub 'nie'!")
 
+        if not has_consecutive_months(self.data.period_keys):
+            print("W danych brakuje niektórych miesięcy, więc inflacja zostanie podana tylko rok do roku.")
+
         if self.user_choice == 2:
-            last_month = self.data.get_available_months()[-1][0]
-            last_year = self.data.get_available_months()[-1][1]
+            last_month, last_year = self.data.get_available_months()[-1]
             calculated_inflation = calculate_own_inflation((last_month, last_year))
 
             print()
             print(f"Ostatnim miesiącem, dla którego dane są dostępne jest {self.data.month_map[last_month]}"
                   f" w {last_year} roku.")
-            print(f"W tym miesiącu 'własna' inflacja, dla podanych wag wyniosła {calculated_inflation:.1f}%"
-                  f" rok do roku.")
+            print(f"W tym miesiącu 'własna' inflacja, dla podanych wag wyniosła {describe(calculated_inflation)}.")
             print(f"Inflacja ogólna liczona według wag GUS wyniosła wtedy"
-                  f" {float(self.data.last_total_inflation()) - 100}% rok do roku.")
+                  f" {describe(calculate_gus_inflation((last_month, last_year)))}.")
 
         elif self.user_choice == 3:
-            user_month, user_year = validate_month()
+            print()
+            print(f"'Własna' inflacja może zostać obliczona dla dowolnego miesiąca z okresu"
+                  f" {self.data.get_data_time_range()}.")
+            user_month, user_year = self.validate_month()
             calculated_inflation = calculate_own_inflation((user_month, user_year))
 
             print(f"W miesiącu {self.data.month_map[user_month]} w {user_year} roku 'własna' inflacja obliczona "
-                  f"dla podanych wag wyniosła {calculated_inflation:.1f}%.")
+                  f"dla podanych wag wyniosła {describe(calculated_inflation)}.")
             print(f"Inflacja ogólna liczona według wag GUS wyniosła wtedy "
-                  f"{float(self.data.total_inflation_in_specific_month(user_month, user_year)) - 100:.1f}%.")
+                  f"{describe(calculate_gus_inflation((user_month, user_year)))}.")
+
+        print('-' * 80)
+
+    def cumulative_inflation(self):
+        """Odpowiada za obliczenie skumulowanej inflacji między dwoma miesiącami podanymi przez użytkownika
+
+        Liczy wzrost cen według wag GUS, a jeśli użytkownik podał wcześniej wagi - również według 'własnych' wag
+        """
+
+        print()
+        print("Skumulowana inflacja to wzrost cen od końca miesiąca początkowego do końca miesiąca końcowego.\n"
+              "Jest ona obliczana na podstawie poziomu cen odtworzonego z inflacji rok do roku. Jeśli miesiące\n"
+              "nie są odległe o pełną liczbę lat, wynik jest szacunkiem.")
+        print()
+        print("Miesiąc początkowy:")
+        start_month = self.validate_month()
+        print()
+        print("Miesiąc końcowy:")
+        end_month = self.validate_month()
+
+        try:
+            gus_inflation = self.price_level_index.cumulative_inflation(start_month, end_month, index=0)
+            own_inflation = None
+            if self.user_expenses_weights:
+                self.price_level_index.add_own_inflation('user', self.user_expenses_weights)
+                own_inflation = self.price_level_index.cumulative_inflation(start_month, end_month, name='user')
+        except ValueError as error:
+            print(error)
+            return
+
+        print()
+        print(f"Między {self.data.month_map[start_month[0]]} {start_month[1]} a {self.data.month_map[end_month[0]]}"
+              f" {end_month[1]} ceny według wag GUS wzrosły o {gus_inflation:.1f}%.")
+
+        if own_inflation is not None:
+            print(f"Według podanych wag ceny wzrosły w tym czasie o {own_inflation:.1f}%.")
 
         print('-' * 80)
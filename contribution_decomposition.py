@@ -0,0 +1,71 @@
+"""Moduł zawierający funkcję rozkładającą 'własną' inflację na wkłady poszczególnych kategorii towarów i usług
+
+Wkład kategorii k w 'własną' inflację w danym miesiącu to w_k/100 * (I_k - 100), gdzie w_k to waga kategorii,
+a I_k to indeks cen w kategorii (analogiczny okres poprzedniego roku = 100). Suma wkładów wszystkich kategorii
+jest równa 'własnej' inflacji.
+
+Wkład kategorii w inflację ogółem (kolumna 'Ogolem') obliczany jest na jeden z dwóch sposobów:
+- jeśli podano wagi odniesienia (np. koszyk GUS) - tak samo jak wkład w 'własną' inflację, ale z wagami odniesienia;
+- w przeciwnym razie inflacja ogółem jest dzielona między kategorie proporcjonalnie do wag użytkownika,
+  tzn. w_k/100 * (I_0 - 100). Różnica wkładów w_k/100 * (I_k - I_0) pokazuje wtedy, o ile dana kategoria
+  podnosi lub obniża 'własną' inflację względem inflacji ogółem, a suma różnic jest równa różnicy obu inflacji.
+
+Wszystkie wkłady obliczane są jednym działaniem z rozgłaszaniem (broadcasting) na macierzy z inflacją
+w kategoriach, dla jednego lub wielu zestawów wag jednocześnie.
+"""
+
+import numpy as np
+from instrumentation import instrumented
+from own_inflation_engine import OwnInflationEngine
+
+
+@instrumented
+def decompose_own_inflation(data, weights, reference_weights=None):
+    """Oblicza wkłady kategorii w 'własną' inflację i w inflację ogółem oraz ich różnicę
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    weights : dict, numpy.ndarray
+        wagi wydatków wyrażone w procentach (słownik, tablica w kolejności 'get_categories()' lub macierz
+        (zestawy wag x kategorie))
+    reference_weights : dict, numpy.ndarray
+        wagi odniesienia dla inflacji ogółem wyrażone w procentach (domyślnie brak - inflacja ogółem jest dzielona
+        proporcjonalnie do wag użytkownika)
+
+    Returns
+    -------
+    contributions : dict
+        słownik z kluczami 'own', 'headline' oraz 'difference', którego wartościami są macierze
+        (miesiące x kategorie) lub tablice (zestawy wag x miesiące x kategorie) z wkładami wyrażonymi
+        w punktach procentowych
+
+    Raises
+    -------
+    ValueError
+        Jeśli liczba wag nie jest równa liczbie kategorii lub w słowniku brakuje wagi dla którejś z kategorii
+    """
+
+    engine = OwnInflationEngine(data)
+    if isinstance(weights, dict):
+        weights = engine.weights_to_vector(weights)
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape[-1] != len(engine.categories):
+        raise ValueError(f"Liczba wag musi być równa liczbie kategorii ({len(engine.categories)})!")
+
+    shares = weights[..., np.newaxis, :] / 100
+    category_inflation = data.get_category_matrix() - 100
+
+    own = shares * category_inflation
+    if reference_weights is None:
+        headline = shares * (data.values[:, :1] - 100)
+    else:
+        if isinstance(reference_weights, dict):
+            reference_weights = engine.weights_to_vector(reference_weights)
+        headline = np.asarray(reference_weights, dtype=np.float64) / 100 * category_inflation
+        headline = np.broadcast_to(headline, own.shape)
+
+    contributions = {'own': own, 'headline': headline, 'difference': own - headline}
+
+    return contributions
@@ -0,0 +1,164 @@
+"""Moduł umożliwiający porównanie inflacji w wielu zbiorach danych (np. w regionach lub typach gospodarstw domowych)
+
+Zbiory danych są wyrównywane do wspólnych miesięcy (klucze okresów 'period_keys' występujące we wszystkich
+zbiorach) i składane w jedną tablicę (zbiory danych x miesiące x kolumny). Porównania - inflacja ogółem,
+inflacja w wybranej kategorii oraz 'własna' inflacja dla jednego lub wielu zestawów wag - obliczane są jednym
+działaniem na tej tablicy, a nie osobno dla każdego pliku. Przykład użycia:
+
+    python dataset_comparison.py --datasets zbiory_danych.txt --weights wagi.txt
+"""
+
+import argparse
+import sys
+import numpy as np
+from dataset_registry import get_registry
+from get_user_weights import read_weights_file
+from inflation_data import months_from_keys
+from instrumentation import instrumented
+from own_inflation_engine import OwnInflationEngine
+
+
+@instrumented
+def stack_datasets(datasets):
+    """Składa zbiory danych w jedną tablicę wyrównaną do wspólnych miesięcy
+
+    Parameters
+    ----------
+    datasets : dict
+        słownik, którego kluczami są nazwy zbiorów danych, a wartościami obiekty klasy InflationData
+
+    Returns
+    -------
+    names : list
+        lista nazw zbiorów danych w kolejności pierwszego wymiaru tablicy
+    months : list
+        lista tupli z miesiącem i rokiem wspólnych dla wszystkich zbiorów danych (w porządku chronologicznym)
+    stacked : numpy.ndarray
+        tablica (zbiory danych x miesiące x kolumny) z inflacją ogółem w kolumnie 0 oraz inflacją w kategoriach
+        w kolejnych kolumnach
+
+    Raises
+    -------
+    ValueError
+        Jeśli nie podano żadnego zbioru danych lub zbiory danych mają różne kategorie
+    """
+
+    if not datasets:
+        raise ValueError("Nie podano żadnego zbioru danych!")
+
+    names = list(datasets)
+    headers = datasets[names[0]].get_headers()
+    for name in names[1:]:
+        if datasets[name].get_headers() != headers:
+            raise ValueError(f"Kategorie w zbiorze danych {name} różnią się od kategorii w zbiorze {names[0]}!")
+
+    common_keys = datasets[names[0]].period_keys
+    for name in names[1:]:
+        common_keys = np.intersect1d(common_keys, datasets[name].period_keys)
+    common_keys = np.sort(common_keys)
+
+    stacked = np.empty((len(names), len(common_keys), len(headers) - 2), dtype=np.float64)
+    for position, name in enumerate(names):
+        data = datasets[name]
+        _, _, rows = np.intersect1d(common_keys, data.period_keys, assume_unique=True, return_indices=True)
+        stacked[position] = data.values[rows]
+
+    months = months_from_keys(common_keys)
+
+    return names, months, stacked
+
+
+@instrumented
+def compare_own_inflation(stacked, weights):
+    """Oblicza 'własną' inflację we wszystkich zbiorach danych jednocześnie
+
+    Parameters
+    ----------
+    stacked : numpy.ndarray
+        tablica (zbiory danych x miesiące x kolumny) zwrócona przez funkcję stack_datasets
+    weights : numpy.ndarray
+        tablica z wagami (kategorie) lub macierz z wagami (zestawy wag x kategorie) wyrażonymi w procentach
+
+    Returns
+    -------
+    own_inflation : numpy.ndarray
+        macierz (zbiory danych x miesiące) lub tablica (zbiory danych x zestawy wag x miesiące) z 'własną' inflacją
+        w postaci indeksów (analogiczny okres poprzedniego roku = 100)
+
+    Raises
+    -------
+    ValueError
+        Jeśli liczba wag nie jest równa liczbie kategorii
+    """
+
+    weights = np.asarray(weights, dtype=np.float64)
+    categories = stacked.shape[2] - 1
+
+    if weights.shape[-1] != categories:
+        raise ValueError(f"Liczba wag musi być równa liczbie kategorii ({categories})!")
+
+    if weights.ndim == 1:
+        return stacked[:, :, 1:] @ (weights / 100)
+
+    return np.einsum('dmc,pc->dpm', stacked[:, :, 1:], weights / 100)
+
+
+def load_and_stack(datasets=None, workers=None):
+    """Wczytuje jednocześnie zbiory danych z rejestru współdzielonego w całym procesie i składa je w jedną tablicę
+
+    Parameters
+    ----------
+    datasets : list
+        lista nazw zbiorów danych lub ścieżek do plików .csv (domyślnie wszystkie zarejestrowane zbiory danych)
+    workers : int
+        liczba wątków wczytujących dane
+
+    Returns
+    -------
+    tupla zwrócona przez funkcję stack_datasets
+    """
+
+    return stack_datasets(get_registry().load_all(datasets, workers, parse_in_processes=True))
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń i wypisuje porównanie inflacji w zbiorach danych
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Porównanie inflacji w wielu zbiorach danych.")
+    parser.add_argument('--datasets', default="zbiory_danych.txt",
+                        help="plik tekstowy z wierszami 'nazwa -> ścieżka do pliku .csv'")
+    parser.add_argument('--weights', help="plik .txt z wagami - porównywana jest wtedy 'własna' inflacja")
+    parser.add_argument('--workers', type=int, help="liczba wątków wczytujących dane")
+    args = parser.parse_args(argv)
+
+    try:
+        names = get_registry().register_from_file(args.datasets)
+        names, months, stacked = load_and_stack(names, args.workers)
+        if args.weights:
+            engine = OwnInflationEngine(get_registry().get(names[0]))
+            inflation = compare_own_inflation(stacked, engine.weights_to_vector(read_weights_file(args.weights)))
+        else:
+            inflation = stacked[:, :, 0]
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(f"{'miesiąc':<10}" + ''.join(f"{name:>16}" for name in names))
+    for (month, year), row in zip(months, (inflation - 100).T.tolist()):
+        print(f"{month + '.' + year:<10}" + ''.join(f"{value:>16.1f}" for value in row))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Moduł zawierający definicję klasy DatasetRegistry, która przechowuje współdzielone w całym procesie instancje
+klasy InflationData
+
+Dzięki rejestrowi wszystkie komponenty programu korzystają z tej samej, raz odczytanej instancji danych.
+Plik .csv jest odczytywany ponownie tylko wtedy, gdy zmieni się jego czas modyfikacji oraz skrót jego zawartości.
+Jeśli do pliku dopisano jedynie nowe wiersze - wczytywana jest tylko nowa część pliku (metoda InflationData.refresh).
+Rejestr współdzielony w całym procesie korzysta z binarnej pamięci podręcznej (moduł binary_cache, pliki
+'<file_path>.cache' zapisywane obok plików .csv) tylko wtedy, gdy ustawiono zmienną środowiskową
+INFLATION_BINARY_CACHE=1.
+
+Zbiory danych (np. dla poszczególnych regionów lub typów gospodarstw domowych) można zarejestrować pod nazwami -
+metodą register lub z pliku tekstowego, w którym każdy wiersz ma postać 'nazwa -> ścieżka do pliku .csv'.
+Wszędzie tam, gdzie podawana jest ścieżka do pliku .csv, można wtedy podać nazwę zbioru danych. Metoda load_all
+wczytuje wiele zbiorów danych jednocześnie w puli wątków, tak aby odczyty z dysku się nakładały. Jeśli rejestr
+korzysta z binarnej pamięci podręcznej, przetwarzanie plików .csv, dla których brakuje aktualnej pamięci podręcznej,
+może zostać przeniesione do puli procesów - wątki mapują wtedy do pamięci gotowe pliki '<file_path>.cache'.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from binary_cache import calculate_file_hash, load_binary_cache
+from inflation_data import InflationData
+from instrumentation import instrumented
+
+
+class DatasetRegistry:
+    """
+    Klasa reprezentująca rejestr współdzielonych instancji klasy InflationData
+
+    Attributes
+    ----------
+    hits : int
+        liczba odwołań obsłużonych przez już wczytaną instancję danych
+    misses : int
+        liczba odwołań, które wymagały odczytania danych z dysku
+    refreshes : int
+        liczba odwołań, w których do wczytanej instancji dopisano nowe wiersze z końca pliku
+    use_binary_cache : bool
+        określa, czy dane są wczytywane z binarnej pamięci podręcznej
+
+    Methods
+    ----------
+    register(name, file_path)
+        rejestruje zbiór danych pod podaną nazwą
+    register_from_file(file_path)
+        rejestruje zbiory danych wymienione w pliku tekstowym
+    names()
+        zwraca listę nazw zarejestrowanych zbiorów danych
+    resolve(dataset)
+        zwraca ścieżkę do pliku .csv dla podanej nazwy zbioru danych lub ścieżki
+    get(dataset)
+        zwraca współdzieloną instancję klasy InflationData dla podanego zbioru danych lub pliku
+    load_all(datasets, workers, parse_in_processes)
+        wczytuje jednocześnie wiele zbiorów danych
+    get_stats()
+        zwraca słownik ze statystykami działania rejestru
+    clear()
+        usuwa z rejestru wszystkie wczytane dane i zeruje statystyki
+    """
+
+    def __init__(self, use_binary_cache=False):
+        """Tworzy pusty rejestr
+
+        Parameters
+        ----------
+        use_binary_cache : bool
+            określa, czy dane są wczytywane z binarnej pamięci podręcznej
+        """
+
+        self.use_binary_cache = use_binary_cache
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._datasets = {}
+        self._paths = {}
+        self._file_locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, file_path):
+        """Rejestruje zbiór danych pod podaną nazwą
+
+        Parameters
+        ----------
+        name : str
+            nazwa zbioru danych (np. region lub typ gospodarstwa domowego)
+        file_path : str
+            ścieżka do pliku .csv z danymi dotyczącymi inflacji
+        """
+
+        with self._lock:
+            self._paths[name] = file_path
+
+    def register_from_file(self, file_path):
+        """Rejestruje zbiory danych wymienione w pliku tekstowym
+
+        Każdy niepusty wiersz pliku ma postać 'nazwa -> ścieżka do pliku .csv'. Ścieżki względne są rozwijane
+        względem katalogu, w którym znajduje się plik tekstowy.
+
+        Parameters
+        ----------
+        file_path : str
+            ścieżka do pliku tekstowego ze zbiorami danych
+
+        Returns
+        -------
+        names : list
+            lista nazw zarejestrowanych zbiorów danych
+
+        Raises
+        -------
+        ValueError
+            Jeśli któryś z wierszy nie ma postaci 'nazwa -> ścieżka'
+        """
+
+        directory = os.path.dirname(os.path.abspath(file_path))
+        datasets = []
+        with open(file_path, encoding='utf-8') as file:
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                name, separator, path = line.partition('->')
+                if not separator or not name.strip() or not path.strip():
+                    raise ValueError(f"Wiersz {number} pliku {file_path} musi mieć postać 'nazwa -> ścieżka'!")
+                datasets.append((name.strip(), os.path.join(directory, path.strip())))
+
+        for name, path in datasets:
+            self.register(name, path)
+
+        return [name for name, _ in datasets]
+
+    def names(self):
+        """
+        Returns
+        ----------
+        lista nazw zarejestrowanych zbiorów danych w kolejności rejestracji
+        """
+
+        with self._lock:
+            return list(self._paths)
+
+    def resolve(self, dataset=None):
+        """Zwraca ścieżkę do pliku .csv dla podanej nazwy zbioru danych lub ścieżki
+
+        Parameters
+        ----------
+        dataset : str
+            nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv (domyślnie 'dane_inflacja.csv')
+
+        Returns
+        -------
+        ścieżka do pliku .csv
+        """
+
+        if dataset is None:
+            return "dane_inflacja.csv"
+
+        with self._lock:
+            return self._paths.get(dataset, dataset)
+
+    @instrumented
+    def get(self, dataset="dane_inflacja.csv"):
+        """Zwraca współdzieloną instancję klasy InflationData dla podanego zbioru danych lub pliku
+
+        Jeśli czas modyfikacji pliku się nie zmienił - zwracana jest wczytana wcześniej instancja.
+        Jeśli czas modyfikacji się zmienił, ale skrót zawartości pliku jest taki sam - również zwracana jest
+        wczytana wcześniej instancja. Jeśli do pliku dopisano jedynie nowe wiersze - są one dopisywane do wczytanej
+        wcześniej instancji - jeśli ostatnia dopisana linia jest jeszcze niekompletna, zapamiętany czas modyfikacji
+        się nie zmienia, więc przy następnym odwołaniu plik jest sprawdzany ponownie. W pozostałych przypadkach plik
+        jest wczytywany ponownie.
+
+        Różne pliki mogą być wczytywane jednocześnie w wielu wątkach - blokada obejmuje tylko jeden plik.
+
+        Parameters
+        ----------
+        dataset : str
+            nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv z danymi dotyczącymi inflacji
+
+        Returns
+        -------
+        data : obiekt klasy InflationData
+            współdzielona instancja danych dotyczących inflacji
+        """
+
+        file_path = self.resolve(dataset)
+        key = os.path.abspath(file_path)
+
+        with self._lock:
+            file_lock = self._file_locks.setdefault(key, threading.Lock())
+
+        with file_lock:
+            modification_time = os.stat(key).st_mtime_ns
+            entry = self._datasets.get(key)
+            counter = 'misses'
+
+            if entry is not None:
+                data = entry['data']
+                if entry['modification_time'] == modification_time:
+                    counter = 'hits'
+                elif calculate_file_hash(key) == data.source_hash:
+                    counter = 'hits'
+                elif (os.stat(key).st_size > data.source_size
+                        and calculate_file_hash(key, data.source_size) == data.source_hash):
+                    data.refresh()
+                    counter = 'refreshes'
+                    if data.source_size != os.stat(key).st_size:
+                        modification_time = entry['modification_time']
+
+            if counter == 'misses':
+                data = InflationData(file_path, self.use_binary_cache)
+
+            with self._lock:
+                self._datasets[key] = {'modification_time': modification_time, 'data': data}
+                setattr(self, counter, getattr(self, counter) + 1)
+
+            return data
+
+    def load_all(self, datasets=None, workers=None, parse_in_processes=False):
+        """Wczytuje jednocześnie wiele zbiorów danych w puli wątków
+
+        Parameters
+        ----------
+        datasets : list
+            lista nazw zbiorów danych lub ścieżek do plików .csv (domyślnie wszystkie zarejestrowane zbiory danych)
+        workers : int
+            liczba wątków (domyślnie liczba zbiorów danych, nie więcej niż 32)
+        parse_in_processes : bool
+            określa, czy pliki .csv bez aktualnej binarnej pamięci podręcznej są przetwarzane w puli procesów
+            (tylko gdy rejestr korzysta z binarnej pamięci podręcznej)
+
+        Returns
+        -------
+        loaded : dict
+            słownik, którego kluczami są nazwy zbiorów danych lub ścieżki, a wartościami obiekty klasy InflationData
+            (w kolejności podanej listy)
+        """
+
+        datasets = self.names() if datasets is None else list(datasets)
+        if not datasets:
+            return {}
+        workers = workers or min(32, len(datasets))
+
+        if parse_in_processes and self.use_binary_cache:
+            stale = [path for path in dict.fromkeys(self.resolve(dataset) for dataset in datasets)
+                     if os.path.isfile(path) and load_binary_cache(path) is None]
+            if len(stale) > 1:
+                with ProcessPoolExecutor(max_workers=min(workers, os.cpu_count() or 1, len(stale))) as executor:
+                    list(executor.map(_write_binary_cache, stale))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = dict(zip(datasets, executor.map(self.get, datasets)))
+
+        return loaded
+
+    def get_stats(self):
+        """
+        Returns
+        ----------
+        stats : dict
+            słownik z liczbą trafień, chybień i dopisań, udziałem trafień oraz liczbą wczytanych plików
+        """
+
+        with self._lock:
+            requests = self.hits + self.misses + self.refreshes
+            stats = {'hits': self.hits, 'misses': self.misses, 'refreshes': self.refreshes,
+                     'hit_rate': self.hits / requests if requests else 0.0,
+                     'datasets': len(self._datasets)}
+
+        return stats
+
+    def clear(self):
+        """Usuwa z rejestru wszystkie wczytane dane i zeruje statystyki"""
+
+        with self._lock:
+            self._datasets.clear()
+            self._file_locks.clear()
+            self.hits = 0
+            self.misses = 0
+            self.refreshes = 0
+
+
+def _write_binary_cache(file_path):
+    """Odczytuje plik .csv i zapisuje jego binarną pamięć podręczną (funkcja wykonywana w puli procesów)"""
+
+    InflationData(file_path, use_binary_cache=True)
+
+
+_registry = DatasetRegistry(use_binary_cache=os.environ.get('INFLATION_BINARY_CACHE', '') not in ('', '0'))
+
+
+def get_registry():
+    """
+    Returns
+    ----------
+    rejestr danych współdzielony w całym procesie
+    """
+    return _registry
+
+
+def get_inflation_data(dataset="dane_inflacja.csv"):
+    """Zwraca współdzieloną w całym procesie instancję klasy InflationData dla podanego zbioru danych lub pliku
+
+    Parameters
+    ----------
+    dataset : str
+        nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv z danymi dotyczącymi inflacji
+
+    Returns
+    -------
+    obiekt klasy InflationData
+    """
+    return _registry.get(_registry.resolve(dataset))
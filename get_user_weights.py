@@ -1,24 +1,111 @@
 """Moduł zawierający definicję klasy GetUserWeights, która umożliwia użytkownikowi podanie wag dotyczących jego wydatków
 w poszczególnych kategoriach towarów i usług
 
-Moduł importuje klasę InflationData, która służy odczytywaniu danych dotyczących inflacji zapisanych w pliku .csv
+Moduł importuje funkcję get_inflation_data, która udostępnia współdzielone dane dotyczące inflacji zapisane
+w pliku .csv. Zestawy wag zapisywane są w bazie danych SQLite (klasa WeightsStore z modułu weights_store,
+importowana dopiero w momencie użycia) lub - jeśli podana nazwa ma rozszerzenie .txt - w pliku tekstowym.
 """
 
 
+import os
 from exceptions import NumberOutOfRange
-from inflation_data import InflationData
+from dataset_registry import get_inflation_data
+
+
+def read_weights_file(file_path):
+    """Odczytuje wagi z pliku tekstowego zapisanego w formacie 'kategoria -> waga'
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do pliku tekstowego z wagami
+
+    Returns
+    -------
+    weights : dict
+        słownik, którego kluczami są nazwy kategorii, a wartościami wagi
+
+    Raises
+    -------
+    FileNotFoundError
+        Jeśli plik nie istnieje
+    ValueError
+        Jeśli któraś z linii pliku nie jest zapisana w formacie 'kategoria -> waga'
+    """
+
+    weights = {}
+    with open(file_path, 'r') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            x = line.split('->')
+            if len(x) != 2:
+                raise ValueError(f"Niepoprawny format linii w pliku {file_path}: {line.strip()}")
+            weights[x[0].strip()] = int(x[1].strip())
+
+    return weights
+
+
+def validate_weights(weights, categories):
+    """Sprawdza, czy wagi odpowiadają kategoriom z pliku z danymi, mieszczą się w zakresie 0-100 i sumują się do 100
+
+    Parameters
+    ----------
+    weights : dict
+        słownik, którego kluczami są nazwy kategorii, a wartościami wagi
+    categories : list
+        lista z nazwami kategorii towarów i usług
+
+    Raises
+    -------
+    ValueError
+        Jeśli brakuje wagi dla którejś z kategorii, podano wagę dla nieznanej kategorii lub wagi nie sumują się do 100
+    NumberOutOfRange
+        Jeśli któraś z wag jest mniejsza od 0 lub większa od 100
+    """
+
+    missing = [category for category in categories if category not in weights]
+    if missing:
+        raise ValueError(f"Brak wag dla kategorii: {missing}")
+    if len(weights) != len(categories):
+        known = set(categories)
+        unknown = [category for category in weights if category not in known]
+        raise ValueError(f"Nieznane kategorie: {unknown}")
+    if any(weight < 0 or weight > 100 for weight in weights.values()):
+        raise NumberOutOfRange("Wagi muszą być większe lub równe 0 oraz mniejsze lub równe 100!")
+    if sum(weights.values()) != 100:
+        raise ValueError("Suma wag nie jest równa 100!")
+
+
+def write_weights_file(file_path, weights):
+    """Zapisuje wagi do pliku tekstowego w formacie 'kategoria -> waga'
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do pliku tekstowego
+    weights : dict
+        słownik, którego kluczami są nazwy kategorii, a wartościami wagi
+    """
+
+    with open(file_path, 'w') as file:
+        for category, weight in weights.items():
+            file.write(f"{category} -> {weight}\n")
 
 
 class GetUserWeights:
     """
     Klasa umożliwająca użytkownikowi podanie wag dotyczących jego wydatków w poszczególnych kategoriach towarów i usług
 
-    Oprócz manualnego podawania wag klasa umożliwia również odczytywanie i zapisywanie wag do pliku tekstowego
+    Oprócz manualnego podawania wag klasa umożliwia również odczytywanie i zapisywanie wag w bazie danych
+    z zestawami wag lub w pliku tekstowym
 
     Attributes
     ----------
     user_expenses_weights : dict
         słownik przechowujący wagi podane przez użytkownika
+    dataset : str
+        nazwa zbioru danych lub ścieżka do pliku .csv, na którym wykonywane są obliczenia
     data : obiekt klasy InfaltionData
         obiekt umożliwiający wykonywanie operacji na danych dotyczących inflacji
 
@@ -26,15 +113,41 @@ class GetUserWeights:
     ----------
     get_user_weights()
         metoda umożliwiająca użytkownikowi manualne podanie wag, odczytanie wag z pliku oraz zapisanie wag do pliku
+    open_store()
+        otwiera bazę danych z zestawami wag
     """
 
-    def __init__(self):
-        """Odpowiada za działanie całego komponentu programu umożliwiającego podawanie wag"""
+    def __init__(self, dataset=None):
+        """Odpowiada za działanie całego komponentu programu umożliwiającego podawanie wag
+
+        Parameters
+        ----------
+        dataset : str
+            nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv (domyślnie 'dane_inflacja.csv')
+        """
 
         self.user_expenses_weights = {}
-        self.data = InflationData()
+        self.dataset = dataset
+        self.data = get_inflation_data(dataset)
         self.get_user_weights()
 
+    def open_store(self):
+        """Otwiera bazę danych z zestawami wag znajdującą się w katalogu roboczym
+
+        Returns
+        -------
+        obiekt klasy WeightsStore
+
+        Raises
+        -------
+        ValueError
+            Jeśli kategorie w bazie danych różnią się od kategorii w pliku z danymi
+        """
+
+        from weights_store import WeightsStore
+
+        return WeightsStore(categories=self.data.get_categories())
+
     def get_user_weights(self):
         """Umożliwia użytkownikowi manualne podanie wag, odczytanie wag z pliku oraz zapisanie wag do pliku"""
 
@@ -96,18 +209,25 @@ class GetUserWeights:
                 return False
 
         def save_expenses_to_file():
-            """Umożliwia zapisanie wcześniej wprowadzonych wag do pliku tekstowego w katalogu roboczym"""
+            """Umożliwia zapisanie wcześniej wprowadzonych wag w bazie danych z zestawami wag lub w pliku tekstowym
+            w katalogu roboczym"""
 
             while True:
-                choice = input("Czy chcesz zapisać wagi do pliku tekstowego? Wpisz 'tak' lub 'nie': ")
+                choice = input("Czy chcesz zapisać wagi? Wpisz 'tak' lub 'nie': ")
                 if choice == 'tak':
-                    file_name = input("Podaj nazwę pliku (nie musisz dodawać rozszerzenia .txt): ")
-                    if not file_name.endswith('.txt'):
-                        file_name = file_name + '.txt'
-                    with open(file_name, 'w') as file:
-                        for category, weight in self.user_expenses_weights.items():
-                            file.write(f"{category} -> {weight}\n")
-                    print(f"Plik {file_name} został zapisany w katalogu roboczym.")
+                    name = input("Podaj nazwę zestawu wag (dodaj rozszerzenie .txt, aby zapisać wagi do pliku "
+                                 "tekstowego): ")
+                    if name.endswith('.txt'):
+                        write_weights_file(name, self.user_expenses_weights)
+                        print(f"Plik {name} został zapisany w katalogu roboczym.")
+                    else:
+                        try:
+                            with self.open_store() as store:
+                                store.save(name, self.user_expenses_weights)
+                        except ValueError as error:
+                            print(error)
+                            continue
+                        print(f"Zestaw wag {name} został zapisany w bazie danych.")
                     print("*"*80)
                     break
                 elif choice == 'nie':
@@ -116,9 +236,34 @@ class GetUserWeights:
                 else:
                     print("Możesz wpisać 'tak' lub 'nie'!")
 
+        def read_weights_from_store(name):
+            """Odczytuje zestaw wag z bazy danych
+
+            Parameters
+            ----------
+            name : str
+                nazwa zestawu wag
+
+            Returns
+            -------
+            słownik z wagami lub None, jeśli w bazie danych nie ma zestawu wag o podanej nazwie
+            """
+
+            from weights_store import DEFAULT_STORE_PATH
+
+            if not os.path.exists(DEFAULT_STORE_PATH):
+                return None
+            with self.open_store() as store:
+                try:
+                    return store.load(name)
+                except KeyError:
+                    return None
+
         def read_expenses_from_file():
-            """Umożliwia odczytanie wag z pliku tekstowego znajdującego się w katalogu roboczym
+            """Umożliwia odczytanie wag z bazy danych z zestawami wag lub z pliku tekstowego znajdującego się
+            w katalogu roboczym
 
+            Jeśli w bazie danych nie ma zestawu wag o podanej nazwie, wagi odczytywane są z pliku tekstowego.
             Format zapisu danych w odczytywanym pliku musi być taki sam jak format danych zapiswanych do pliku
             w metodzie 'save_expenses_to_file()'
 
@@ -130,22 +275,26 @@ class GetUserWeights:
             """
             while True:
                 print()
-                file_name = input("Plik tekstowy z wagami musi znajdować się w katalogu roboczym.\n"
-                                  "Plik musi być sforamtowany tak samo jak pliki z wagami tworzone prez program.\n"
-                                  "Podaj nazwę pliku (nie musisz dodawać rozszerzenia .txt): ")
-                if not file_name.endswith('.txt'):
-                    file_name = file_name + '.txt'
+                name = input("Plik tekstowy z wagami musi znajdować się w katalogu roboczym.\n"
+                             "Plik musi być sforamtowany tak samo jak pliki z wagami tworzone prez program.\n"
+                             "Podaj nazwę zestawu wag zapisanego w bazie danych lub nazwę pliku (nie musisz "
+                             "dodawać rozszerzenia .txt): ")
+                file_name = name if name.endswith('.txt') else name + '.txt'
                 try:
-                    with open(file_name, 'r') as file:
-                        lines = file.readlines()
-                        for line in lines:
-                            x = line.split('->')
-                            self.user_expenses_weights[x[0].strip()] = int(x[1].strip())
-                    print(f"Wagi zostały pomyślnie odczytane z pliku {file_name}")
+                    weights = None if name.endswith('.txt') else read_weights_from_store(name)
+                    source = f"z bazy danych (zestaw wag {name})"
+                    if weights is None:
+                        weights = read_weights_file(file_name)
+                        source = f"z pliku {file_name}"
+                    validate_weights(weights, self.data.get_categories())
+                    self.user_expenses_weights.update(weights)
+                    print(f"Wagi zostały pomyślnie odczytane {source}")
                     print('*'*80)
                     break
                 except FileNotFoundError:
-                    print(f"W katalogu roboczym nie ma pliku {file_name}!")
+                    print(f"W bazie danych nie ma zestawu wag {name}, a w katalogu roboczym nie ma pliku {file_name}!")
+                except (ValueError, NumberOutOfRange) as error:
+                    print(error)
 
         def ask_user_for_expenses():
             """Umożliwia użytkownikowi manualne podanie wag w konsoli
@@ -157,7 +306,7 @@ class GetUserWeights:
             while True:
                 print()
                 print("Wpisz wagi twoich wydatków w poszczególych kategoriach:")
-                for expense_category in self.data.get_headers()[3:]:
+                for expense_category in self.data.get_categories():
                     print()
                     expense_weight = validate_expense_weight(expense_category)
                     self.user_expenses_weights[expense_category] = expense_weight
@@ -176,13 +325,15 @@ class GetUserWeights:
                     print('*' * 80)
 
         print('-'*80)
-        print("Teraz zostaniesz poproszony o podanie wag twoich wydatków w dwunastu kategoriach towarów i usług.\n"
-              "Wagi możesz odczytać z zapisanego wcześniej przez program pliku tekstowego lub podać je ręcznie."
+        print(f"Teraz zostaniesz poproszony o podanie wag twoich wydatków w {len(self.data.get_categories())} "
+              "kategoriach towarów i usług.\n"
+              "Wagi możesz odczytać z zapisanego wcześniej przez program zestawu wag (w bazie danych lub w pliku\n"
+              "tekstowym) lub podać je ręcznie. "
               "Podawane wagi muszą być liczbami całkowitymi. Jeżeli suma wag nie będzie równa 100 zostaniesz\n"
               "poproszony o ponowne podanie wszystkich wag. Dla każdej z kategorii wpisz wagę i wciśnij 'enter'.")
 
         while True:
-            user_choice = input("Czy chcesz odczytać wagi z pliku tekstowego? Wpisz 'tak' lub 'nie': ")
+            user_choice = input("Czy chcesz odczytać zapisane wcześniej wagi? Wpisz 'tak' lub 'nie': ")
             if user_choice == 'tak':
                 read_expenses_from_file()
                 break
@@ -0,0 +1,248 @@
+"""Moduł umożliwiający wyznaczenie wag kategorii, które najlepiej odtwarzają zadany przebieg inflacji
+
+Wagi w (nieujemne, sumujące się do 100) wyznaczane są metodą najmniejszych kwadratów z ograniczeniami:
+minimalizowana jest suma kwadratów różnic między 'własną' inflacją obliczoną dla wag w a zadanym przebiegiem
+inflacji. Domyślnie zadanym przebiegiem jest inflacja ogółem (kolumna 'Ogolem'), co pozwala oszacować koszyk,
+któremu odpowiada inflacja raportowana przez GUS. Można jednak podać dowolną liczbę innych przebiegów jednocześnie.
+
+Zadanie rozwiązywane jest przyspieszoną metodą gradientu z rzutowaniem na sympleks (FISTA z adaptacyjnym
+restartem) jednocześnie dla wszystkich przebiegów. Obliczenia wykorzystują jedynie macierz Grama kategorii
+(kategorie x kategorie), więc ich koszt nie zależy od liczby miesięcy. W oknach kroczących macierz Grama
+aktualizowana jest przy przesunięciu okna o jeden miesiąc, a rozwiązanie z poprzedniego okna jest punktem startowym
+dla następnego. Przykład użycia:
+
+    python implied_weights.py --window 12
+"""
+
+import argparse
+import sys
+import numpy as np
+from dataset_registry import get_inflation_data
+from instrumentation import instrumented
+
+
+def project_to_simplex(vectors):
+    """Rzutuje kolumny macierzy na sympleks (nieujemne wartości sumujące się do 1)
+
+    Parameters
+    ----------
+    vectors : numpy.ndarray
+        macierz (kategorie x przebiegi), której kolumny są rzutowane
+
+    Returns
+    -------
+    macierz z rzutami kolumn
+    """
+
+    size, columns = vectors.shape
+    ordered = -np.sort(-vectors, axis=0)
+    cumulative = np.cumsum(ordered, axis=0) - 1
+    positive = ordered - cumulative / np.arange(1, size + 1)[:, np.newaxis] > 0
+    last = size - 1 - np.argmax(positive[::-1], axis=0)
+    threshold = cumulative[last, np.arange(columns)] / (last + 1)
+
+    return np.maximum(vectors - threshold, 0)
+
+
+def _solve(gram, cross, initial, tolerance, max_iterations):
+    """Rozwiązuje zadanie min ||A w - b||^2 na sympleksie metodą FISTA dla wszystkich przebiegów jednocześnie
+
+    Jeśli krok z pędem oddala rozwiązanie od poprzedniego punktu, pęd jest zerowany (adaptacyjny restart),
+    co znacznie przyspiesza zbieżność dla silnie skorelowanych kategorii.
+
+    Parameters
+    ----------
+    gram : numpy.ndarray
+        macierz A^T A (kategorie x kategorie)
+    cross : numpy.ndarray
+        macierz A^T B (kategorie x przebiegi)
+    initial : numpy.ndarray
+        punkt startowy (kategorie x przebiegi) - udziały sumujące się do 1
+    tolerance : float
+        największa dopuszczalna zmiana udziałów w ostatniej iteracji
+    max_iterations : int
+        maksymalna liczba iteracji
+
+    Returns
+    -------
+    shares : numpy.ndarray
+        macierz (kategorie x przebiegi) z udziałami kategorii
+    iterations : int
+        liczba wykonanych iteracji
+    """
+
+    lipschitz = np.linalg.eigvalsh(gram)[-1]
+    step = 1 / lipschitz if lipschitz > 0 else 1.0
+
+    shares = initial
+    momentum = initial
+    t = 1.0
+    for iteration in range(1, max_iterations + 1):
+        updated = project_to_simplex(momentum - step * (gram @ momentum - cross))
+        if np.sum((momentum - updated) * (updated - shares)) > 0:
+            momentum, t = shares, 1.0
+            updated = project_to_simplex(momentum - step * (gram @ momentum - cross))
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        momentum = updated + ((t - 1) / t_next) * (updated - shares)
+        change = np.abs(updated - shares).max()
+        shares = updated
+        t = t_next
+        if change < tolerance:
+            break
+
+    return shares, iteration
+
+
+def _prepare(data, targets):
+    """Zwraca odchylenia inflacji w kategoriach i zadanych przebiegów od 100 (macierze miesiące x ...)"""
+
+    deviations = data.get_category_matrix() - 100
+    if targets is None:
+        targets = data.values[:, 0]
+    targets = np.asarray(targets, dtype=np.float64)
+    single = targets.ndim == 1
+    targets = targets.reshape(len(targets), -1) - 100
+
+    if len(targets) != len(deviations):
+        raise ValueError(f"Przebiegi muszą obejmować {len(deviations)} miesięcy!")
+
+    return deviations, targets, single
+
+
+@instrumented
+def implied_weights(data, targets=None, tolerance=1e-9, max_iterations=10000):
+    """Wyznacza wagi kategorii, które najlepiej odtwarzają zadane przebiegi inflacji we wszystkich miesiącach
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    targets : numpy.ndarray
+        tablica (miesiące) lub macierz (miesiące x przebiegi) z przebiegami inflacji w postaci indeksów
+        (analogiczny okres poprzedniego roku = 100); domyślnie inflacja ogółem
+    tolerance : float
+        największa dopuszczalna zmiana udziałów w ostatniej iteracji
+    max_iterations : int
+        maksymalna liczba iteracji
+
+    Returns
+    -------
+    tablica (kategorie) lub macierz (przebiegi x kategorie) z wagami wyrażonymi w procentach
+
+    Raises
+    -------
+    ValueError
+        Jeśli przebiegi obejmują inną liczbę miesięcy niż dane
+    """
+
+    deviations, targets, single = _prepare(data, targets)
+    categories = deviations.shape[1]
+
+    initial = np.full((categories, targets.shape[1]), 1 / categories)
+    shares, _ = _solve(deviations.T @ deviations, deviations.T @ targets, initial, tolerance, max_iterations)
+
+    weights = 100 * shares.T
+    return weights[0] if single else weights
+
+
+@instrumented
+def rolling_implied_weights(data, window, targets=None, tolerance=1e-9, max_iterations=10000):
+    """Wyznacza wagi kategorii w kolejnych oknach kroczących o zadanej liczbie miesięcy
+
+    Macierz Grama jest aktualizowana przy przesunięciu okna (dodanie nowego i usunięcie najstarszego miesiąca),
+    a rozwiązanie z poprzedniego okna jest punktem startowym dla następnego.
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    window : int
+        liczba miesięcy w oknie
+    targets : numpy.ndarray
+        tablica (miesiące) lub macierz (miesiące x przebiegi) z przebiegami inflacji w postaci indeksów;
+        domyślnie inflacja ogółem
+    tolerance : float
+        największa dopuszczalna zmiana udziałów w ostatniej iteracji
+    max_iterations : int
+        maksymalna liczba iteracji w jednym oknie
+
+    Returns
+    -------
+    weights : numpy.ndarray
+        macierz (okna x kategorie) lub tablica (okna x przebiegi x kategorie) z wagami wyrażonymi w procentach;
+        okno i kończy się w miesiącu i + window - 1
+    iterations : numpy.ndarray
+        tablica z liczbą iteracji wykonanych w kolejnych oknach
+
+    Raises
+    -------
+    ValueError
+        Jeśli okno jest krótsze niż 1 miesiąc lub dłuższe niż liczba miesięcy w danych albo przebiegi obejmują
+        inną liczbę miesięcy niż dane
+    """
+
+    deviations, targets, single = _prepare(data, targets)
+    months, categories = deviations.shape
+
+    if not 1 <= window <= months:
+        raise ValueError(f"Długość okna musi być z zakresu 1-{months}!")
+
+    windows = months - window + 1
+    weights = np.empty((windows, targets.shape[1], categories))
+    iterations = np.empty(windows, dtype=np.int64)
+
+    gram = deviations[:window].T @ deviations[:window]
+    cross = deviations[:window].T @ targets[:window]
+    shares = np.full((categories, targets.shape[1]), 1 / categories)
+
+    for start in range(windows):
+        if start:
+            old, new = start - 1, start + window - 1
+            gram += np.outer(deviations[new], deviations[new]) - np.outer(deviations[old], deviations[old])
+            cross += np.outer(deviations[new], targets[new]) - np.outer(deviations[old], targets[old])
+        shares, iterations[start] = _solve(gram, cross, shares, tolerance, max_iterations)
+        weights[start] = 100 * shares.T
+
+    return (weights[:, 0] if single else weights), iterations
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń i wypisuje wagi odtwarzające inflację ogółem
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Wagi kategorii odtwarzające inflację ogółem (koszyk GUS).")
+    parser.add_argument('--window', type=int, help="liczba miesięcy w oknach kroczących (domyślnie cały okres)")
+    parser.add_argument('--data', default="dane_inflacja.csv", help="plik .csv z danymi dotyczącymi inflacji")
+    args = parser.parse_args(argv)
+
+    try:
+        data = get_inflation_data(args.data)
+        if args.window:
+            weights, _ = rolling_implied_weights(data, args.window)
+            months = data.get_available_months()[args.window - 1:]
+        else:
+            weights = implied_weights(data)[np.newaxis, :]
+            months = data.get_available_months()[-1:]
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    for (month, year), row in zip(months, weights):
+        print(f"Okno kończące się w miesiącu {month}.{year}:")
+        for category, weight in zip(data.get_categories(), row.tolist()):
+            print(f"    {category} -> {weight:.2f}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
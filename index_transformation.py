@@ -0,0 +1,300 @@
+"""Moduł zawierający definicję klasy IndexTransformer, która przedstawia dane dotyczące inflacji w różnych ujęciach
+
+Dane w pliku .csv to indeksy rok do roku (analogiczny okres poprzedniego roku = 100). Na ich podstawie odtwarzany
+jest poziom cen w kolejnych miesiącach (iloczyny łańcuchowe) - dla inflacji ogółem, każdej kategorii lub dowolnej
+serii 'własnej' inflacji. Poziom cen w danym miesiącu to poziom sprzed 12 miesięcy pomnożony przez indeks rok do roku.
+Poziomy cen w 12 miesiącach poprzedzających okres objęty przez dane nie są znane, więc przyjmuje się, że rosły one
+w stałym tempie miesięcznym równym pierwiastkowi 12. stopnia z pierwszego indeksu. Dzięki temu indeksy rok do roku
+obliczone z poziomów cen są dokładnie takie same jak w pliku .csv.
+
+Indeksy rok do roku nie wyznaczają jednoznacznie przebiegu cen w ciągu roku, więc ujęcia 'mom', 'ytd' oraz 'base'
+(gdy miesiąc bazowy nie jest odległy o wielokrotność 12 miesięcy) są szacunkami - przenoszą założony przebieg cen
+z okresu poprzedzającego dane. Wartości, których okres odniesienia przypada na ten założony okres (ujęcie 'mom'
+w pierwszych 12 miesiącach danych i ujęcie 'ytd' w pierwszym roku kalendarzowym danych), są równe NaN.
+
+Iloczyny łańcuchowe obliczane są jednym wywołaniem numpy.cumprod dla wszystkich serii jednocześnie (miesiące
+odległe o 12 są kolejnymi wierszami tablicy 'lata x 12 x serie'), a poszczególne ujęcia są ilorazami poziomów cen:
+- 'yoy' - rok do roku (analogiczny miesiąc poprzedniego roku = 100);
+- 'mom' - miesiąc do miesiąca (poprzedni miesiąc = 100);
+- 'ytd' - od początku roku (grudzień poprzedniego roku = 100);
+- 'base' - względem wybranego miesiąca bazowego (miesiąc bazowy = 100).
+Każde ujęcie może zostać zwrócone jako indeks lub jako zmiana cen w procentach. Ujęcia macierzy 'values' są
+przechowywane w pamięci podręcznej do czasu zmiany danych (dopisania nowych miesięcy).
+"""
+
+import threading
+import weakref
+import numpy as np
+from inflation_data import period_key
+from instrumentation import instrumented
+
+
+BASES = {'yoy': 'rok do roku', 'mom': 'miesiąc do miesiąca', 'ytd': 'od początku roku',
+         'base': 'względem miesiąca bazowego'}
+
+ESTIMATED_BASES = ('mom', 'ytd', 'base')
+
+
+def _month_numbers(period_keys):
+    """Zwraca numery kolejnych miesięcy (rok * 12 + miesiąc - 1) dla kluczy okresów rrrrmm
+
+    Raises
+    -------
+    ValueError
+        Jeśli miesiące objęte przez dane nie następują bezpośrednio po sobie
+    """
+
+    period_keys = np.asarray(period_keys, dtype=np.int64)
+    numbers = period_keys // 100 * 12 + period_keys % 100 - 1
+    if np.any(np.diff(numbers) != 1):
+        raise ValueError("Miesiące objęte przez dane muszą następować bezpośrednio po sobie!")
+
+    return numbers
+
+
+def has_consecutive_months(period_keys):
+    """Sprawdza, czy miesiące objęte przez dane następują bezpośrednio po sobie (tylko wtedy dostępne są ujęcia
+    inne niż rok do roku)
+
+    Parameters
+    ----------
+    period_keys : numpy.ndarray
+        tablica z kluczami okresów rrrrmm
+
+    Returns
+    -------
+    True, jeśli w danych nie brakuje żadnego miesiąca, w przeciwnym razie False
+    """
+
+    try:
+        _month_numbers(period_keys)
+    except ValueError:
+        return False
+
+    return True
+
+
+@instrumented
+def price_levels(indices):
+    """Odtwarza poziom cen w kolejnych miesiącach na podstawie indeksów rok do roku
+
+    Parameters
+    ----------
+    indices : numpy.ndarray
+        tablica (miesiące) lub macierz (miesiące x serie) z indeksami rok do roku
+
+    Returns
+    -------
+    levels : numpy.ndarray
+        tablica lub macierz z poziomem cen, o jeden wiersz dłuższa niż 'indices' - wiersz 0 to poziom cen
+        w miesiącu poprzedzającym okres objęty przez dane (równy 1), a wiersz i to poziom cen w i-tym miesiącu
+    """
+
+    factors = np.asarray(indices, dtype=np.float64) / 100
+    months = len(factors)
+    series_shape = factors.shape[1:]
+    if not months:
+        return np.ones((1,) + series_shape)
+
+    exponents = np.arange(-11, 1, dtype=np.float64).reshape((12,) + (1,) * len(series_shape))
+    years = -(-months // 12) + 1
+    chained = np.ones((years * 12,) + series_shape)
+    chained[:12] = (factors[0] ** (1 / 12)) ** exponents
+    chained[12:12 + months] = factors
+    chained = chained.reshape((years, 12) + series_shape)
+    np.cumprod(chained, axis=0, out=chained)
+
+    levels = chained.reshape((years * 12,) + series_shape)[11:12 + months]
+
+    return levels
+
+
+def _transform(indices, period_keys, basis, base, levels=None):
+    """Zamienia indeksy rok do roku na indeksy w podanym ujęciu (wspólna część metod klasy IndexTransformer)"""
+
+    if basis not in BASES:
+        raise ValueError(f"Nieznane ujęcie '{basis}'. Dostępne ujęcia to: {list(BASES)}.")
+
+    indices = np.asarray(indices, dtype=np.float64)
+    if basis == 'yoy':
+        return indices.copy()
+
+    numbers = _month_numbers(period_keys)
+    if levels is None:
+        levels = price_levels(indices)
+
+    if basis == 'mom':
+        result = 100 * levels[1:] / levels[:-1]
+        result[:12] = np.nan
+        return result
+
+    if basis == 'ytd':
+        rows = numbers - numbers % 12 - numbers[0]
+        shape = (len(rows),) + (1,) * (indices.ndim - 1)
+        reference = np.where((rows >= 1).reshape(shape), levels[np.maximum(rows, 0)], np.nan)
+        return 100 * levels[1:] / reference
+
+    if base is None:
+        raise ValueError("Dla ujęcia 'base' należy podać miesiąc bazowy!")
+    row = np.flatnonzero(numbers == _month_numbers([period_key(*base)])[0])
+    if not len(row):
+        raise ValueError(f"Brak danych dla miesiąca bazowego {base[0]}.{base[1]}!")
+
+    return 100 * levels[1:] / levels[row[0] + 1]
+
+
+class IndexTransformer:
+    """
+    Klasa reprezentująca dane dotyczące inflacji w różnych ujęciach (rok do roku, miesiąc do miesiąca,
+    od początku roku oraz względem miesiąca bazowego)
+
+    Attributes
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+
+    Methods
+    ----------
+    view(basis, base, percent)
+        zwraca macierz 'values' w podanym ujęciu
+    transform(indices, basis, base, percent)
+        zamienia dowolną serię indeksów rok do roku (np. 'własną' inflację) na podane ujęcie
+    """
+
+    def __init__(self, data):
+        """
+        Parameters
+        ----------
+        data : obiekt klasy InflationData
+            dane dotyczące inflacji
+        """
+
+        self._data = weakref.ref(data)
+        self._version = None
+        self._levels = None
+        self._views = {}
+        self._lock = threading.Lock()
+
+    @property
+    def data(self):
+        """
+        Returns
+        ----------
+        dane dotyczące inflacji (przechowywane przez słabe odwołanie, aby współdzielona instancja klasy
+        IndexTransformer nie przedłużała czasu życia danych)
+        """
+        return self._data()
+
+    @instrumented
+    def view(self, basis='yoy', base=None, percent=False):
+        """Zwraca macierz 'values' (miesiące x kolumny 'data_field_map') w podanym ujęciu
+
+        Zwracana macierz jest współdzielona z pamięcią podręczną, więc jest tylko do odczytu. Ujęcia 'mom', 'ytd'
+        oraz 'base' są szacunkami opartymi na założonym przebiegu cen przed okresem objętym przez dane (dokładne są
+        tylko ilorazy poziomów cen w miesiącach odległych o wielokrotność 12 miesięcy).
+
+        Parameters
+        ----------
+        basis : str
+            ujęcie - 'yoy', 'mom', 'ytd' lub 'base'
+        base : tuple
+            tupla z miesiącem i rokiem miesiąca bazowego (tylko dla ujęcia 'base')
+        percent : bool
+            określa, czy zwrócić zmianę cen w procentach zamiast indeksu
+
+        Returns
+        -------
+        view : numpy.ndarray
+            macierz z indeksami (okres odniesienia = 100) lub zmianami cen w procentach; dla miesięcy, dla których
+            okres odniesienia nie jest objęty przez dane (ujęcie 'mom' w pierwszych 12 miesiącach i ujęcie 'ytd'
+            w pierwszym roku kalendarzowym), wartości są równe NaN
+
+        Raises
+        -------
+        ValueError
+            Jeśli ujęcie jest nieznane, miesiąc bazowy nie jest objęty przez dane lub miesiące nie następują
+            bezpośrednio po sobie
+        """
+
+        data = self.data
+        key = (basis, tuple(base) if basis == 'base' and base is not None else None, percent)
+
+        with self._lock:
+            version = (data.data_version, len(data.months))
+            if version != self._version:
+                self._version = version
+                self._levels = None
+                self._views.clear()
+
+            view = self._views.get(key)
+            if view is not None:
+                return view
+
+            if basis in ('mom', 'ytd', 'base') and self._levels is None:
+                self._levels = price_levels(data.values)
+
+            view = _transform(data.values, data.period_keys, basis, base, self._levels)
+            if percent:
+                view -= 100
+            view.setflags(write=False)
+            self._views[key] = view
+
+        return view
+
+    def transform(self, indices, basis='yoy', base=None, percent=False):
+        """Zamienia serię indeksów rok do roku obejmującą wszystkie miesiące (np. 'własną' inflację) na podane ujęcie
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            tablica (miesiące) lub macierz (miesiące x serie) z indeksami rok do roku
+        basis : str
+            ujęcie - 'yoy', 'mom', 'ytd' lub 'base'
+        base : tuple
+            tupla z miesiącem i rokiem miesiąca bazowego (tylko dla ujęcia 'base')
+        percent : bool
+            określa, czy zwrócić zmianę cen w procentach zamiast indeksu
+
+        Returns
+        -------
+        tablica lub macierz z indeksami lub zmianami cen w procentach (szacunki i wartości NaN tak jak w metodzie view)
+
+        Raises
+        -------
+        ValueError
+            Jeśli ujęcie jest nieznane, seria obejmuje inną liczbę miesięcy niż dane, miesiąc bazowy nie jest
+            objęty przez dane lub miesiące nie następują bezpośrednio po sobie
+        """
+
+        indices = np.asarray(indices, dtype=np.float64)
+        if len(indices) != len(self.data.months):
+            raise ValueError(f"Seria musi obejmować {len(self.data.months)} miesięcy!")
+
+        result = _transform(indices, self.data.period_keys, basis, base)
+
+        return result - 100 if percent else result
+
+
+_transformers = weakref.WeakKeyDictionary()
+_transformers_lock = threading.Lock()
+
+
+def get_index_transformer(data):
+    """Zwraca współdzieloną w całym procesie instancję klasy IndexTransformer dla podanych danych
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+
+    Returns
+    -------
+    obiekt klasy IndexTransformer
+    """
+
+    with _transformers_lock:
+        transformer = _transformers.get(data)
+        if transformer is None:
+            transformer = _transformers[data] = IndexTransformer(data)
+
+    return transformer
@@ -1,11 +1,74 @@
 """Moduł zawierający definicję klasy InlfationData umożliwiającej wykonywanie operacji na danych dotyczących inflacji
 zapisanych w pliku .csv w katalogu roboczym
 
-W celu odczytania danych z pliku .csv importowany jest moduł csv z biblioteki standardowej
+W celu odczytania danych z pliku .csv importowany jest moduł csv z biblioteki standardowej.
+Odczytane dane przechowywane są w macierzy biblioteki numpy.
+Opcjonalnie dane mogą być odczytywane z binarnej pamięci podręcznej obsługiwanej przez moduł binary_cache.
 """
 
 
+import bisect
 import csv
+import hashlib
+import os
+import numpy as np
+from binary_cache import calculate_file_hash, load_binary_cache, write_binary_cache
+from instrumentation import instrumented
+
+
+MONTH_NUMBERS = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5, 'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10,
+                 'XI': 11, 'XII': 12}
+ROMAN_MONTHS = {number: month for month, number in MONTH_NUMBERS.items()}
+
+
+def period_key(month, year):
+    """Zamienia miesiąc zapisany jako cyfra rzymska oraz rok na klucz okresu w postaci liczby rrrrmm
+
+    Parameters
+    ----------
+    month : str
+        miesiąc zapisany jako cyfra rzymska
+    year : str, int
+        rok
+
+    Returns
+    -------
+    klucz okresu jako liczba całkowita, np. 202203 dla marca 2022 roku
+
+    Raises
+    -------
+    ValueError
+        Jeśli miesiąc nie jest poprawną cyfrą rzymską lub rok nie jest liczbą całkowitą
+    """
+
+    try:
+        return int(year) * 100 + MONTH_NUMBERS[month]
+    except (KeyError, TypeError):
+        raise ValueError(f"Niepoprawny miesiąc: {month}.")
+
+
+def months_from_keys(period_keys):
+    """Zamienia klucze okresów rrrrmm na listę tupli z miesiącem zapisanym jako cyfra rzymska i rokiem
+
+    Etykiety miesięcy i lat wybierane są z tablic numpy (napis roku tworzony jest raz dla każdego roku), a nie
+    obliczane osobno dla każdego klucza.
+
+    Parameters
+    ----------
+    period_keys : numpy.ndarray
+        tablica z kluczami okresów
+
+    Returns
+    -------
+    lista tupli zawierających miesiąc i rok, np. ('III', '2022') dla klucza 202203
+    """
+
+    period_keys = np.asarray(period_keys, dtype=np.int64)
+    labels = np.array([None] + list(MONTH_NUMBERS), dtype=object)[period_keys % 100]
+    unique_years, year_rows = np.unique(period_keys // 100, return_inverse=True)
+    years = np.array([str(year) for year in unique_years.tolist()], dtype=object)[year_rows.reshape(-1)]
+
+    return list(zip(labels.tolist(), years.tolist()))
 
 
 class InflationData:
@@ -13,18 +76,52 @@ class InflationData:
 
     Attributes
     ----------
-    inflation_data : list
-        lista zawierająca listy z danymi z poszczególnych wierszy pliku .csv
+    file_path : str
+        ścieżka do pliku .csv, z którego odczytano dane
+    source_hash : str
+        skrót SHA-256 zawartości pliku .csv, z którego odczytano dane
+    source_size : int
+        rozmiar w bajtach odczytanej części pliku .csv
+    data_version : int
+        licznik zwiększany przy każdej zmianie danych (np. po dopisaniu miesięcy)
+    load_version : int
+        licznik zwiększany przy każdym wczytaniu wszystkich danych na nowo - jeśli nie zmienił się, to dane
+        różnią się od poprzednich tylko miesiącami dopisanymi na końcu
+    headers : list
+        lista z nagłówkami danych znajdujących się w pliku .csv
+    months : list
+        lista tupli zawierających miesiąc i rok - kolejne tuple odpowiadają kolejnym wierszom macierzy 'values'
+    values : numpy.ndarray
+        macierz typu float64 o wymiarach (liczba miesięcy) x (liczba kategorii) zawierająca inflację ogółem
+        oraz inflację w poszczególnych kategoriach towarów i usług
+    period_keys : numpy.ndarray
+        tablica z kluczami okresów (rrrrmm) odpowiadającymi kolejnym wierszom macierzy 'values'
+    period_index : dict
+        słownik mapujący klucz okresu (rrrrmm) na numer wiersza macierzy 'values'
     month_map : dict
         słownik mapujący poszczególne miesiące roku zapisane jako cyfry rzymskie na ich słowne odpowiedniki
     data_field_map : dict
         słownik mapujący indeks poszczególnych kategorii towrów i usług na ich słowne odpowiedniki
+    categories : list
+        lista z nazwami kategorii towarów i usług (nagłówki kolumn pliku .csv po kolumnie 'Ogolem')
     Methods
     ----------
+    append_rows(lines)
+        dopisuje na końcu danych kolejne miesiące
+    refresh()
+        wczytuje miesiące dopisane na końcu pliku .csv od czasu jego ostatniego odczytania
     get_headers()
         zwraca listę z nagłówkami danych znajdujących się w pliku .csv
+    get_categories()
+        zwraca listę z nazwami kategorii towarów i usług
     get_inflation_in_specific_month(month, year)
-        zwraca listę z danymi dotyczącymi inflacji w danym miesiącu i roku
+        zwraca tablicę z danymi dotyczącymi inflacji w danym miesiącu i roku
+    get_row_index(month, year)
+        zwraca numer wiersza macierzy 'values' odpowiadający danemu miesiącowi i rokowi
+    has_month(month, year)
+        sprawdza, czy dane obejmują dany miesiąc i rok
+    get_category_matrix()
+        zwraca macierz z inflacją w poszczególnych kategoriach towarów i usług (bez inflacji ogółem)
     get_category_inflation(index)
         zwraca słownik z danymi dotyczącymi inflacji w określonej kategorii towarów i usług w okresie czasu
         objętym przez dane
@@ -41,29 +138,222 @@ class InflationData:
         zwraca wartość inflacji obliczonej według wag Głównego Urzędu Statystycznego w określonym miesiącu i roku
     """
 
-    def __init__(self):
-        """Odpowiada za wczytanie danych dotyczących inflacji z pliku .csv do atrybutu 'inflation_data'
+    def __init__(self, file_path="dane_inflacja.csv", use_binary_cache=False):
+        """Odpowiada za wczytanie danych dotyczących inflacji z pliku .csv do atrybutów 'months' oraz 'values'
 
-        Plik 'dane_inflacja.csv' musi znajdować się w katalogu roboczym
-        Atrybut 'inflation_data' to lista składająca się z list, które odpowiadają danym z poszczególnych wierszy
-        pliku .csv
+        Domyślnie plik 'dane_inflacja.csv' musi znajdować się w katalogu roboczym
         Dane w każdym wierszu pliku .csv zapisane są w natępującej kolejności: miesiąc, rok, inflacja ogółem
         oraz inflacje w poszczególnych kategoriach towarów i usług
+        Wartości liczbowe są zamieniane na liczby zmiennoprzecinkowe tylko raz - podczas wczytywania pliku
+        Jeśli włączona jest binarna pamięć podręczna - dane są mapowane do pamięci z pliku '<file_path>.cache',
+        a gdy plik ten nie istnieje lub jest nieaktualny, zostaje on utworzony na nowo po odczytaniu pliku .csv
+
+        Parameters
+        ----------
+        file_path : str
+            ścieżka do pliku .csv z danymi dotyczącymi inflacji
+        use_binary_cache : bool
+            określa, czy korzystać z binarnej pamięci podręcznej
         """
 
-        self.inflation_data = []
+        self.file_path = file_path
+        self.use_binary_cache = use_binary_cache
+        self.data_version = 0
+        self.load_version = 0
         self.month_map = {'I': 'styczeń', 'II': 'luty', 'III': 'marzec', 'IV': 'kwiecień', 'V': 'maj', 'VI': 'czerwiec',
                           'VII': 'lipiec', 'VIII': 'sierpień', 'IX': 'wrzesień', 'X': 'październik', 'XI': 'listopad',
                           'XII': 'grudzień'}
 
-        with open("dane_inflacja.csv") as csvfile:
-            data = csv.reader(csvfile, delimiter=';')
+        self._load()
+
+    @instrumented
+    def _load(self):
+        """Wczytuje wszystkie dane z pliku .csv lub z binarnej pamięci podręcznej"""
+
+        cache = load_binary_cache(self.file_path) if self.use_binary_cache else None
+
+        if cache is not None:
+            self.source_hash = cache['source_hash']
+            self.source_size = cache['source_size']
+            self._hasher = None
+            self._set_data(cache['headers'], months_from_keys(cache['period_keys']), cache['values'],
+                           cache['period_keys'])
+            return
+
+        with open(self.file_path, 'rb') as csvfile:
+            source_mtime_ns = os.fstat(csvfile.fileno()).st_mtime_ns
+            content = csvfile.read()
+
+        self._hasher = hashlib.sha256(content)
+        self.source_hash = self._hasher.hexdigest()
+        self.source_size = len(content)
+
+        data = csv.reader(content.decode('utf-8').splitlines(), delimiter=';')
+        headers = next(data)
+        months = []
+        rows = []
+
+        for line in data:
+            months.append((line[0], line[1]))
+            rows.append(line[2:])
+
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), len(headers) - 2)
+        self._set_data(headers, months, values)
+
+        if self.use_binary_cache:
+            write_binary_cache(self.file_path, self.headers, self.period_keys, self.values, self.source_hash,
+                               self.source_size, source_mtime_ns)
+
+    def _set_data(self, headers, months, values, period_keys=None):
+        """Przypisuje odczytane dane do atrybutów instancji i tworzy na ich podstawie indeksy
+
+        Parameters
+        ----------
+        headers : list
+            lista z nagłówkami danych
+        months : list
+            lista tupli zawierających miesiąc i rok
+        values : numpy.ndarray
+            macierz z wartościami inflacji
+        period_keys : numpy.ndarray
+            tablica z kluczami okresów - jeśli nie zostanie podana, jest tworzona na podstawie listy 'months'
+        """
+
+        self.headers = headers
+        self.months = months
+
+        self.data_field_map = {key: value for key, value in enumerate(self.headers[2:])}
+        self.categories = self.headers[3:]
+
+        if period_keys is None:
+            period_keys = np.array([period_key(month, year) for month, year in self.months], dtype=np.int64)
+
+        self._values_buffer = values
+        self._keys_buffer = period_keys
+        self.values = values
+        self.period_keys = period_keys
+        self.period_index = {key: row for row, key in enumerate(self.period_keys.tolist())}
+        self.available_years = sorted(set(year for month, year in self.months))
+
+    @instrumented
+    def append_rows(self, lines):
+        """Dopisuje na końcu danych kolejne miesiące
+
+        Macierz 'values' oraz tablica 'period_keys' są widokami na bufory, których pojemność jest podwajana
+        w razie potrzeby, więc koszt dopisania jednego miesiąca nie zależy od liczby miesięcy objętych przez dane.
+        Indeks okresów oraz lista dostępnych lat są uzupełniane w miejscu.
+
+        Parameters
+        ----------
+        lines : list
+            lista list z danymi z kolejnych wierszy pliku .csv (miesiąc, rok, inflacja ogółem oraz inflacje
+            w poszczególnych kategoriach)
+
+        Returns
+        -------
+        liczba dopisanych miesięcy
+
+        Raises
+        -------
+        ValueError
+            Jeśli wiersz ma inną liczbę kolumn niż nagłówek lub dane obejmują już któryś z dopisywanych miesięcy
+        """
+
+        if not lines:
+            return 0
+
+        columns = len(self.headers) - 2
+        if any(len(line) != columns + 2 for line in lines):
+            raise ValueError(f"Każdy wiersz musi zawierać {columns + 2} kolumn!")
+
+        new_months = [(line[0], line[1]) for line in lines]
+        new_keys = [period_key(month, year) for month, year in new_months]
+        if len(set(new_keys)) != len(new_keys) or any(key in self.period_index for key in new_keys):
+            raise ValueError("Dane obejmują już któryś z dopisywanych miesięcy!")
+        new_values = np.array([line[2:] for line in lines], dtype=np.float64).reshape(len(lines), columns)
+
+        rows = len(self.months)
+        total_rows = rows + len(lines)
+
+        if total_rows > len(self._values_buffer) or not self._values_buffer.flags.writeable:
+            capacity = max(2 * len(self._values_buffer), total_rows, 16)
+            values_buffer = np.empty((capacity, columns), dtype=np.float64)
+            values_buffer[:rows] = self._values_buffer[:rows]
+            keys_buffer = np.empty(capacity, dtype=np.int64)
+            keys_buffer[:rows] = self._keys_buffer[:rows]
+            self._values_buffer = values_buffer
+            self._keys_buffer = keys_buffer
+
+        self._values_buffer[rows:total_rows] = new_values
+        self._keys_buffer[rows:total_rows] = new_keys
+
+        for row, (key, (month, year)) in enumerate(zip(new_keys, new_months), start=rows):
+            self.period_index[key] = row
+            if year not in self.available_years:
+                bisect.insort(self.available_years, year)
 
-            for line in data:
-                self.inflation_data.append(line)
+        self.months.extend(new_months)
+        self.period_keys = self._keys_buffer[:total_rows]
+        self.values = self._values_buffer[:total_rows]
+        self.data_version += 1
 
-        self.data_field_map = {key: value for key, value in zip(range(len(self.inflation_data[0]) - 2),
-                                                                self.inflation_data[0][2:])}
+        return len(lines)
+
+    def _is_complete_row(self, line):
+        """Sprawdza, czy linia pliku .csv (bez znaku końca linii) jest kompletnym wierszem z danymi"""
+
+        try:
+            row = next(csv.reader([line.decode('utf-8')], delimiter=';'))
+            period_key(row[0], row[1])
+            np.array(row[2:], dtype=np.float64)
+        except (UnicodeDecodeError, StopIteration, IndexError, ValueError):
+            return False
+
+        return len(row) == len(self.headers)
+
+    @instrumented
+    def refresh(self):
+        """Wczytuje miesiące dopisane na końcu pliku .csv od czasu jego ostatniego odczytania
+
+        Odczytywana jest tylko nowa część pliku, zaczynając od zapamiętanego przesunięcia w bajtach.
+        Ostatnia linia bez znaku końca linii jest wczytywana tylko wtedy, gdy jest kompletnym wierszem (ma tyle
+        kolumn co nagłówek, a wartości są liczbami) - w przeciwnym razie jest pomijana do czasu następnego wywołania.
+        Jeśli plik jest krótszy niż przy poprzednim odczycie - wszystkie dane wczytywane są na nowo.
+
+        Returns
+        -------
+        liczba dopisanych miesięcy (lub liczba wszystkich miesięcy, jeśli dane zostały wczytane na nowo)
+        """
+
+        with open(self.file_path, 'rb') as csvfile:
+            size = os.fstat(csvfile.fileno()).st_size
+
+            if size < self.source_size:
+                self._load()
+                self.data_version += 1
+                self.load_version += 1
+                return len(self.months)
+
+            csvfile.seek(self.source_size)
+            tail = csvfile.read(size - self.source_size)
+
+        last_line = tail[tail.rfind(b'\n') + 1:]
+        if last_line and not self._is_complete_row(last_line):
+            tail = tail[:len(tail) - len(last_line)]
+        if not tail:
+            return 0
+
+        if self._hasher is None:
+            self._hasher = calculate_file_hash(self.file_path, self.source_size, hexdigest=False)
+
+        lines = [line for line in csv.reader(tail.decode('utf-8').splitlines(), delimiter=';') if line]
+        appended = self.append_rows(lines)
+
+        self._hasher.update(tail)
+        self.source_hash = self._hasher.hexdigest()
+        self.source_size += len(tail)
+
+        return appended
 
     def get_headers(self):
         """
@@ -71,10 +361,20 @@ class InflationData:
         ----------
         lista z nagłówkami danych znajdujących się w pliku .csv
         """
-        return self.inflation_data[0]
+        return self.headers
+
+    def get_categories(self):
+        """
+        Returns
+        ----------
+        lista z nazwami kategorii towarów i usług w kolejności kolumn macierzy 'get_category_matrix()'
+        (lista jest współdzielona i nie powinna być modyfikowana)
+        """
+        return self.categories
 
+    @instrumented
     def get_inflation_in_specific_month(self, month, year):
-        """Zwraca listę z danymi dotyczącymi inflacji w danym miesiącu i roku
+        """Zwraca tablicę z danymi dotyczącymi inflacji w danym miesiącu i roku
 
         Parameters
         ----------
@@ -85,8 +385,8 @@ class InflationData:
 
         Returns
         -------
-        line : list
-            lista z danymi dotyczącymi inflacji w określonym miesiącu i roku
+        line : numpy.ndarray
+            tablica z inflacją ogółem oraz inflacją w poszczególnych kategoriach w określonym miesiącu i roku
 
         Raises
         -------
@@ -94,13 +394,63 @@ class InflationData:
             Jeśli dane nie obejmują danego miesiąca i roku
         """
 
-        for line in self.inflation_data:
-            if line[0] == month and line[1] == year:
-                return line
-        else:
+        return self.values[self.get_row_index(month, year)]
+
+    @instrumented
+    def get_row_index(self, month, year):
+        """Zwraca numer wiersza macierzy 'values' odpowiadający danemu miesiącowi i rokowi
+
+        Parameters
+        ----------
+        month : str
+            miesiąc zapisany jako cyfra rzymska
+        year : str
+            rok
+
+        Returns
+        -------
+        row : int
+            numer wiersza macierzy 'values'
+
+        Raises
+        -------
+        ValueError
+            Jeśli dane nie obejmują danego miesiąca i roku
+        """
+
+        try:
+            row = self.period_index.get(period_key(month, year))
+        except ValueError:
+            row = None
+
+        if row is None:
             raise ValueError(f"Brak danych dla podanego miesiąca. Dane są dostępne tylko dla okresu: "
                              f"{self.get_data_time_range()}.")
 
+        return row
+
+    def has_month(self, month, year):
+        """
+        Returns
+        ----------
+        True, jeśli dane obejmują dany miesiąc i rok, w przeciwnym wypadku False
+        """
+
+        try:
+            return period_key(month, year) in self.period_index
+        except ValueError:
+            return False
+
+    def get_category_matrix(self):
+        """
+        Returns
+        ----------
+        macierz o wymiarach (liczba miesięcy) x (liczba kategorii) z inflacją w poszczególnych kategoriach
+        towarów i usług - kolejność kolumn odpowiada kolejności kategorii 'get_categories()'
+        """
+        return self.values[:, 1:]
+
+    @instrumented
     def get_category_inflation(self, index):
         """Zwraca słownik z danymi dotyczącymi inflacji w określonej kategorii towarów i usług w okresie czasu
         objętym przez dane
@@ -124,8 +474,6 @@ class InflationData:
             Jeśli podany indeks jest spoza zakresu dostępnych indeksów
         """
 
-        data = {}
-
         try:
             index = int(index)
         except ValueError:
@@ -134,8 +482,7 @@ class InflationData:
         if index not in self.data_field_map.keys():
             raise IndexError('Brak danych dla podanego indeksu!')
 
-        for line in self.inflation_data[1:]:
-            data[(line[0], line[1])] = float(line[index + 2])
+        data = dict(zip(self.months, self.values[:, index].tolist()))
 
         return data
 
@@ -147,8 +494,8 @@ class InflationData:
             zmienna typu string, która przedstawia okres czasu objęty przez dane
         """
 
-        first_month = self.inflation_data[1][0] + '.' + self.inflation_data[1][1]
-        last_month = self.inflation_data[-1][0] + '.' + self.inflation_data[-1][1]
+        first_month = self.months[0][0] + '.' + self.months[0][1]
+        last_month = self.months[-1][0] + '.' + self.months[-1][1]
         time_range = first_month + ' - ' + last_month
 
         return time_range
@@ -159,9 +506,10 @@ class InflationData:
         ----------
         available_months : list
             lista tupli zawierających miesiąc i rok - każda tupla to inny miesiąc objęty przez dane
+            (lista jest współdzielona i nie powinna być modyfikowana)
         """
 
-        available_months = [(data[0], data[1]) for data in self.inflation_data[1:]]
+        available_months = self.months
         return available_months
 
     def get_available_years(self):
@@ -170,9 +518,10 @@ class InflationData:
         ----------
         available_years : list
             lista z latami, w których występuje choć jeden miesiąc objęty przez dane
+            (lista jest współdzielona i nie powinna być modyfikowana)
         """
 
-        available_years = sorted(list(set(data[1] for data in self.inflation_data[1:])))
+        available_years = self.available_years
         return available_years
 
     def last_total_inflation(self):
@@ -182,8 +531,9 @@ class InflationData:
         wartość inflacji obliczonej według wag Głównego Urzędu Statystycznego
         w ostatnim miesiącu objętym prez dane
         """
-        return self.inflation_data[-1][2]
+        return float(self.values[-1, 0])
 
+    @instrumented
     def total_inflation_in_specific_month(self, month, year):
         """Zwraca wartość inflacji obliczonej według wag Głównego Urzędu Statystycznego w określonym miesiącu i roku
 
@@ -196,11 +546,9 @@ class InflationData:
 
         Returns
         -------
-        total_inflation : str
+        total_inflation : float
             wartość inflacji obliczonej według wag Głównego Urzędu Statystycznego w określonym miesiącu i roku
         """
 
-        for element in self.inflation_data:
-            if element[0] == month and element[1] == year:
-                total_inflation = element[2]
-                return total_inflation
+        total_inflation = float(self.get_inflation_in_specific_month(month, year)[0])
+        return total_inflation
@@ -0,0 +1,162 @@
+"""Moduł umożliwiający strumieniowe odczytywanie danych dotyczących inflacji z pliku .csv
+
+W przeciwieństwie do klasy InflationData funkcje z tego modułu nie wczytują całego pliku do pamięci.
+Dane odczytywane są porcjami o zadanej liczbie miesięcy, dzięki czemu zużycie pamięci nie zależy od długości pliku.
+Format pliku jest taki sam jak format pliku 'dane_inflacja.csv'.
+"""
+
+import csv
+import itertools
+from collections import namedtuple
+import numpy as np
+from inflation_data import period_key
+
+
+MonthRecord = namedtuple('MonthRecord', ['month', 'year', 'key', 'values'])
+MonthRecord.__doc__ = """Dane dotyczące inflacji w jednym miesiącu
+
+month : str - miesiąc zapisany jako cyfra rzymska
+year : str - rok
+key : int - klucz okresu w postaci liczby rrrrmm
+values : tuple - inflacja ogółem oraz inflacja w poszczególnych kategoriach towarów i usług
+"""
+
+InflationChunk = namedtuple('InflationChunk', ['headers', 'months', 'keys', 'values'])
+InflationChunk.__doc__ = """Porcja danych dotyczących inflacji obejmująca kolejne miesiące
+
+headers : list - nagłówki danych znajdujących się w pliku .csv
+months : list - lista tupli zawierających miesiąc i rok
+keys : numpy.ndarray - klucze okresów w postaci liczb rrrrmm
+values : numpy.ndarray - macierz (miesiące x kolumny) z inflacją ogółem oraz w poszczególnych kategoriach
+"""
+
+
+def read_headers(file_path="dane_inflacja.csv"):
+    """
+    Returns
+    ----------
+    lista z nagłówkami danych znajdujących się w pliku .csv
+    """
+
+    with open(file_path, newline='', encoding='utf-8') as csvfile:
+        return next(csv.reader(csvfile, delimiter=';'))
+
+
+def iter_record_chunks(file_path="dane_inflacja.csv", chunk_size=4096):
+    """Odczytuje plik .csv porcjami o zadanej liczbie miesięcy
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+    chunk_size : int
+        maksymalna liczba miesięcy w jednej porcji
+
+    Yields
+    -------
+    obiekt InflationChunk z danymi dotyczącymi kolejnych miesięcy
+
+    Raises
+    -------
+    ValueError
+        Jeśli rozmiar porcji nie jest liczbą dodatnią
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("Rozmiar porcji musi być większy od 0!")
+
+    with open(file_path, newline='', encoding='utf-8') as csvfile:
+        data = csv.reader(csvfile, delimiter=';')
+        headers = next(data)
+        columns = len(headers) - 2
+
+        while True:
+            lines = list(itertools.islice(data, chunk_size))
+            if not lines:
+                break
+
+            months = [(line[0], line[1]) for line in lines]
+            keys = np.array([period_key(month, year) for month, year in months], dtype=np.int64)
+            values = np.array([line[2:] for line in lines], dtype=np.float64).reshape(len(lines), columns)
+
+            yield InflationChunk(headers, months, keys, values)
+
+
+def iter_month_records(file_path="dane_inflacja.csv", chunk_size=4096):
+    """Odczytuje plik .csv miesiąc po miesiącu
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+    chunk_size : int
+        liczba miesięcy odczytywanych z pliku jednocześnie
+
+    Yields
+    -------
+    obiekt MonthRecord z danymi dotyczącymi kolejnego miesiąca
+    """
+
+    for chunk in iter_record_chunks(file_path, chunk_size):
+        for (month, year), key, values in zip(chunk.months, chunk.keys.tolist(), chunk.values.tolist()):
+            yield MonthRecord(month, year, key, tuple(values))
+
+
+def stream_category_inflation(index, file_path="dane_inflacja.csv", chunk_size=4096):
+    """Odczytuje strumieniowo przebieg inflacji w określonej kategorii towarów i usług
+
+    Parameters
+    ----------
+    index : int
+        indeks kategorii (taki sam jak w atrybucie 'data_field_map' klasy InflationData)
+    file_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+    chunk_size : int
+        maksymalna liczba miesięcy w jednej porcji
+
+    Yields
+    -------
+    tupla zawierająca listę miesięcy z danej porcji oraz tablicę z inflacją w tych miesiącach
+
+    Raises
+    -------
+    IndexError
+        Jeśli podany indeks jest spoza zakresu dostępnych indeksów
+    """
+
+    for chunk in iter_record_chunks(file_path, chunk_size):
+        if not 0 <= index < chunk.values.shape[1]:
+            raise IndexError('Brak danych dla podanego indeksu!')
+        yield chunk.months, chunk.values[:, index]
+
+
+def stream_own_inflation(weights, file_path="dane_inflacja.csv", chunk_size=4096):
+    """Oblicza strumieniowo 'własną' inflację dla jednego lub wielu zestawów wag
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        tablica z wagami (kategorie) lub macierz z wagami (zestawy wag x kategorie) wyrażonymi w procentach
+        w kolejności kategorii z nagłówka pliku .csv (kolumny po kolumnie 'Ogolem')
+    file_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+    chunk_size : int
+        maksymalna liczba miesięcy w jednej porcji
+
+    Yields
+    -------
+    tupla zawierająca listę miesięcy z danej porcji oraz tablicę (miesiące) lub macierz (zestawy wag x miesiące)
+    z 'własną' inflacją w tych miesiącach
+
+    Raises
+    -------
+    ValueError
+        Jeśli liczba wag nie jest równa liczbie kategorii
+    """
+
+    weights = np.asarray(weights, dtype=np.float64) / 100
+
+    for chunk in iter_record_chunks(file_path, chunk_size):
+        if weights.shape[-1] != chunk.values.shape[1] - 1:
+            raise ValueError(f"Liczba wag musi być równa liczbie kategorii ({chunk.values.shape[1] - 1})!")
+        yield chunk.months, weights @ chunk.values[:, 1:].T
@@ -0,0 +1,421 @@
+"""Skrypt uruchamiający lokalną usługę HTTP, która udostępnia obliczenia programu w formacie JSON
+
+Usługa korzysta wyłącznie z biblioteki standardowej (asyncio) i nie wymaga interakcji z użytkownikiem w konsoli.
+Dane dotyczące inflacji wczytywane są raz przy uruchomieniu usługi. Obliczenia wykonywane są w puli wątków
+(numpy zwalnia GIL podczas mnożenia macierzy), dzięki czemu duże zapytania nie blokują pętli zdarzeń, a pozostałe
+połączenia obsługiwane są w tym czasie współbieżnie. Dostępne są następujące ścieżki:
+
+    GET  /categories                lista kategorii (indeksy z 'data_field_map') oraz dostępnych miesięcy
+    POST /own-inflation             'własna' inflacja w miesiącu: {"weights": {...}, "month": "III", "year": "2022"}
+    POST /own-inflation/series      przebieg 'własnej' inflacji: {"weights": {...}} lub {"profiles": [{...}, ...]}
+    GET  /category-series?index=3   przebieg inflacji w kategorii (0 - inflacja ogółem)
+    POST /savings                   realna wartość oszczędności: {"money_amount": 10000, "inflation_rates": [5.0],
+                                    "savings_period": 10, "compounding": "annual"}
+
+Inflacja zwracana jest w procentach (wartość z pliku .csv pomniejszona o 100). Błędne zapytania kończą się
+odpowiedzią 400 z opisem błędu w polu 'error' (również niepoprawny nagłówek Content-Length lub zbyt długi wiersz
+zapytania), treść zapytania większa niż MAX_BODY_SIZE - odpowiedzią 413, a zbyt długi nagłówek lub zbyt wiele
+nagłówków - odpowiedzią 431. Przykład użycia:
+
+    python inflation_service.py --port 8080 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+from dataset_registry import get_inflation_data
+from exceptions import NumberOutOfRange
+from get_user_weights import validate_weights
+from own_inflation_cache import get_own_inflation_cache
+from own_inflation_engine import OwnInflationEngine
+from savings_engine import STEPS_PER_YEAR, calculate_real_savings
+
+
+MAX_BODY_SIZE = 16 << 20
+
+MAX_HEADERS = 100
+
+MAX_SAVINGS_PERIOD = 100
+
+MAX_SAVINGS_POINTS = 1 << 20
+
+STATUS_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                  413: 'Payload Too Large', 431: 'Request Header Fields Too Large', 500: 'Internal Server Error'}
+
+
+class InflationService:
+    """
+    Klasa reprezentująca usługę HTTP udostępniającą obliczenia dotyczące inflacji
+
+    Attributes
+    ----------
+    data : obiekt klasy InflationData
+        obiekt umożliwiający wykonywanie operacji na danych dotyczących inflacji
+    engine : obiekt klasy OwnInflationEngine
+        obiekt obliczający 'własną' inflację na podstawie podanych wag
+    cache : obiekt klasy OwnInflationCache
+        współdzielona pamięć podręczna wyników 'własnej' inflacji
+    executor : obiekt klasy ThreadPoolExecutor
+        pula wątków, w której wykonywane są obliczenia
+    routes : dict
+        słownik, którego kluczami są ścieżki, a wartościami słowniki z metodami HTTP i funkcjami obsługującymi
+
+    Methods
+    ----------
+    categories(query, body)
+        zwraca listę kategorii oraz dostępnych miesięcy
+    own_inflation(query, body)
+        zwraca 'własną' inflację w podanym miesiącu
+    own_inflation_series(query, body)
+        zwraca przebieg 'własnej' inflacji dla jednego lub wielu zestawów wag
+    category_series(query, body)
+        zwraca przebieg inflacji w podanej kategorii towarów i usług
+    savings(query, body)
+        zwraca realną wartość oszczędności w kolejnych okresach
+    dispatch(method, target, body)
+        wywołuje funkcję obsługującą zapytanie i zwraca kod odpowiedzi oraz jej treść
+    handle_connection(reader, writer)
+        obsługuje kolejne zapytania przesyłane w ramach jednego połączenia
+    serve(host, port)
+        uruchamia usługę i obsługuje połączenia do momentu jej przerwania
+    """
+
+    def __init__(self, data_path="dane_inflacja.csv", workers=None):
+        """
+        Parameters
+        ----------
+        data_path : str
+            ścieżka do pliku .csv z danymi dotyczącymi inflacji
+        workers : int
+            liczba wątków wykonujących obliczenia (domyślnie wartość domyślna ThreadPoolExecutor)
+        """
+
+        self.data = get_inflation_data(data_path)
+        self.engine = OwnInflationEngine(self.data)
+        self.cache = get_own_inflation_cache()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.routes = {
+            '/categories': {'GET': self.categories},
+            '/own-inflation': {'POST': self.own_inflation},
+            '/own-inflation/series': {'POST': self.own_inflation_series},
+            '/category-series': {'GET': self.category_series},
+            '/savings': {'POST': self.savings},
+        }
+
+    def _weights_vector(self, weights):
+        """Waliduje słownik z wagami i zamienia go na tablicę uporządkowaną według kolejności kategorii
+
+        Raises
+        -------
+        ValueError
+            Jeśli wagi nie są słownikiem lub nie odpowiadają kategoriom z pliku z danymi
+        NumberOutOfRange
+            Jeśli któraś z wag jest mniejsza od 0 lub większa od 100
+        """
+
+        if not isinstance(weights, dict):
+            raise ValueError("Wagi należy podać jako obiekt JSON w postaci {\"kategoria\": waga}!")
+        validate_weights(weights, self.engine.categories)
+
+        return self.engine.weights_to_vector(weights)
+
+    def _months(self):
+        """Zwraca listę dostępnych miesięcy zapisanych w postaci 'miesiąc.rok'"""
+
+        return [f"{month}.{year}" for month, year in self.data.get_available_months()]
+
+    def categories(self, query, body):
+        """Zwraca listę kategorii (indeksy z atrybutu 'data_field_map') oraz dostępnych miesięcy"""
+
+        return {'categories': [{'index': index, 'name': name} for index, name in self.data.data_field_map.items()],
+                'months': self._months()}
+
+    def own_inflation(self, query, body):
+        """Zwraca 'własną' inflację oraz inflację według wag GUS w podanym miesiącu
+
+        Raises
+        -------
+        ValueError
+            Jeśli dane nie obejmują podanego miesiąca lub wagi są niepoprawne
+        KeyError
+            Jeśli w zapytaniu brakuje któregoś z pól
+        """
+
+        row = self.data.get_row_index(body['month'], str(body['year']))
+        own_inflation = float(self.cache.calculate(self.data, self._weights_vector(body['weights']))[row]) - 100
+
+        return {'month': body['month'], 'year': str(body['year']), 'own_inflation': round(own_inflation, 4),
+                'gus_inflation': round(float(self.data.values[row, 0]) - 100, 4)}
+
+    def own_inflation_series(self, query, body):
+        """Zwraca przebieg 'własnej' inflacji dla jednego zestawu wag ('weights') lub wielu zestawów ('profiles')
+
+        Raises
+        -------
+        ValueError
+            Jeśli wagi są niepoprawne
+        KeyError
+            Jeśli w zapytaniu nie podano wag
+        """
+
+        if 'profiles' in body:
+            weights = np.array([self._weights_vector(profile) for profile in body['profiles']],
+                               dtype=np.float64).reshape(-1, len(self.engine.categories))
+        else:
+            weights = self._weights_vector(body['weights'])
+
+        return {'months': self._months(),
+                'own_inflation': np.round(self.cache.calculate(self.data, weights) - 100, 4).tolist(),
+                'gus_inflation': np.round(self.data.values[:, 0] - 100, 4).tolist()}
+
+    def category_series(self, query, body):
+        """Zwraca przebieg inflacji w kategorii o indeksie podanym w parametrze 'index'
+
+        Raises
+        -------
+        ValueError
+            Jeśli indeks nie jest liczbą całkowitą lub nie ma go w atrybucie 'data_field_map'
+        """
+
+        index = int(query.get('index', ['0'])[0])
+        if index not in self.data.data_field_map:
+            raise ValueError(f"Indeks kategorii musi być z zakresu 0-{len(self.data.data_field_map) - 1}!")
+
+        return {'index': index, 'category': self.data.data_field_map[index], 'months': self._months(),
+                'inflation': np.round(self.data.values[:, index] - 100, 4).tolist()}
+
+    def savings(self, query, body):
+        """Zwraca realną wartość oszczędności w kolejnych okresach dla podanych wartości inflacji
+
+        Raises
+        -------
+        ValueError
+            Jeśli parametry są niepoprawne, czas oszczędzania przekracza MAX_SAVINGS_PERIOD lat, wynik miałby więcej
+            niż MAX_SAVINGS_POINTS wartości lub podano nieznany sposób kapitalizacji
+        KeyError
+            Jeśli w zapytaniu brakuje któregoś z pól
+        """
+
+        money_amount = float(body['money_amount'])
+        savings_period = int(body['savings_period'])
+        if money_amount < 0 or savings_period < 0:
+            raise ValueError("Kwota oszczędności oraz czas oszczędzania nie mogą być ujemne!")
+        if savings_period > MAX_SAVINGS_PERIOD:
+            raise ValueError(f"Czas oszczędzania nie może przekraczać {MAX_SAVINGS_PERIOD} lat!")
+        steps = savings_period * STEPS_PER_YEAR.get(body.get('compounding', 'annual'), 1) + 1
+        if len(np.atleast_1d(body['inflation_rates'])) * steps > MAX_SAVINGS_POINTS:
+            raise ValueError(f"Wynik nie może zawierać więcej niż {MAX_SAVINGS_POINTS} wartości!")
+
+        time_axis, values = calculate_real_savings(money_amount, body['inflation_rates'], savings_period,
+                                                   body.get('compounding', 'annual'))
+
+        return {'time_axis': time_axis.tolist(), 'values': np.round(values, 2).tolist()}
+
+    def _respond(self, handler, query, body):
+        """Wywołuje funkcję obsługującą zapytanie i zamienia wynik na JSON (wykonywane w puli wątków)"""
+
+        payload = json.loads(body) if body else {}
+        if not isinstance(payload, dict):
+            raise ValueError("Treść zapytania musi być obiektem JSON!")
+
+        return json.dumps(handler(query, payload), ensure_ascii=False).encode('utf-8')
+
+    async def dispatch(self, method, target, body):
+        """Wywołuje funkcję obsługującą zapytanie i zwraca kod odpowiedzi oraz jej treść
+
+        Parameters
+        ----------
+        method : str
+            metoda HTTP
+        target : str
+            ścieżka wraz z parametrami zapytania
+        body : bytes
+            treść zapytania
+
+        Returns
+        -------
+        status : int
+            kod odpowiedzi HTTP
+        content : bytes
+            treść odpowiedzi w formacie JSON
+        """
+
+        url = urlsplit(target)
+        handlers = self.routes.get(url.path)
+        if handlers is None:
+            return 404, self._error(f"Nieznana ścieżka: {url.path}")
+        if method not in handlers:
+            return 405, self._error(f"Ścieżka {url.path} obsługuje tylko metody: {list(handlers)}")
+
+        loop = asyncio.get_running_loop()
+        try:
+            content = await loop.run_in_executor(self.executor, self._respond, handlers[method],
+                                                 parse_qs(url.query), body)
+        except KeyError as error:
+            return 400, self._error(f"Brak pola {error} w zapytaniu!")
+        except (ValueError, TypeError, NumberOutOfRange) as error:
+            return 400, self._error(str(error))
+        except Exception as error:
+            return 500, self._error(f"Błąd wewnętrzny: {error}")
+
+        return 200, content
+
+    @staticmethod
+    def _content_length(headers):
+        """Zwraca długość treści zapytania podaną w nagłówku Content-Length
+
+        Raises
+        -------
+        ValueError
+            Jeśli wartość nagłówka nie jest nieujemną liczbą całkowitą zapisaną cyframi dziesiętnymi
+        """
+
+        value = headers.get('content-length', '0')
+        if not (value.isascii() and value.isdigit()):
+            raise ValueError(f"Niepoprawna wartość nagłówka Content-Length: {value}")
+
+        return int(value)
+
+    @staticmethod
+    def _error(message):
+        """Zwraca treść odpowiedzi z opisem błędu"""
+
+        return json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    async def _send(writer, status, content, keep_alive):
+        """Zapisuje odpowiedź HTTP do strumienia"""
+
+        writer.write(f"HTTP/1.1 {status} {STATUS_REASONS[status]}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(content)}\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + content)
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        """Obsługuje kolejne zapytania przesyłane w ramach jednego połączenia (HTTP/1.1 keep-alive)
+
+        Parameters
+        ----------
+        reader : obiekt klasy asyncio.StreamReader
+            strumień, z którego odczytywane są zapytania
+        writer : obiekt klasy asyncio.StreamWriter
+            strumień, do którego zapisywane są odpowiedzi
+        """
+
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except ValueError:
+                    await self._send(writer, 400, self._error("Zbyt długi wiersz zapytania HTTP!"), False)
+                    break
+                if not request_line:
+                    break
+
+                headers = {}
+                header_lines = 0
+                error = None
+                while True:
+                    try:
+                        line = await reader.readline()
+                    except ValueError:
+                        error = "Zbyt długi nagłówek zapytania HTTP!"
+                        break
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    header_lines += 1
+                    if header_lines > MAX_HEADERS:
+                        error = f"Zapytanie HTTP może zawierać co najwyżej {MAX_HEADERS} nagłówków!"
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                if error is not None:
+                    await self._send(writer, 431, self._error(error), False)
+                    break
+
+                keep_alive = True
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    length = self._content_length(headers)
+                except ValueError:
+                    status, content, keep_alive = 400, self._error("Niepoprawne zapytanie HTTP!"), False
+                else:
+                    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                    if length > MAX_BODY_SIZE:
+                        status, content, keep_alive = 413, self._error("Zbyt duża treść zapytania!"), False
+                    else:
+                        body = await reader.readexactly(length) if length else b''
+                        status, content = await self.dispatch(method, target, body)
+
+                await self._send(writer, status, content, keep_alive)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8080):
+        """Uruchamia usługę i obsługuje połączenia do momentu jej przerwania
+
+        Parameters
+        ----------
+        host : str
+            adres, na którym nasłuchuje usługa
+        port : int
+            port, na którym nasłuchuje usługa
+        """
+
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"Usługa nasłuchuje na http://{host}:{port} (dane z okresu {self.data.get_data_time_range()}).")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False)
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń i uruchamia usługę
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Lokalna usługa HTTP udostępniająca obliczenia dotyczące inflacji.")
+    parser.add_argument('--host', default='127.0.0.1', help="adres, na którym nasłuchuje usługa")
+    parser.add_argument('--port', type=int, default=8080, help="port, na którym nasłuchuje usługa")
+    parser.add_argument('--workers', type=int, help="liczba wątków wykonujących obliczenia")
+    parser.add_argument('--data', default="dane_inflacja.csv", help="plik .csv z danymi dotyczącymi inflacji")
+    args = parser.parse_args(argv)
+
+    try:
+        service = InflationService(args.data, args.workers)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nZatrzymano usługę.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Moduł umożliwiający pomiar czasu wykonania najważniejszych operacji programu oraz ich profilowanie
+
+Pomiary są domyślnie wyłączone. Włącza je zmienna środowiskowa INFLATION_INSTRUMENTATION=1, która musi zostać
+ustawiona przed uruchomieniem programu - dekorator 'instrumented' sprawdza ją tylko raz, w momencie definiowania
+funkcji, i gdy pomiary są wyłączone zwraca funkcję bez zmian (brak jakiegokolwiek narzutu w czasie wywołania).
+Dla każdej mierzonej funkcji zapisywana jest liczba wywołań, łączny i maksymalny czas oraz próbka czasów wykonania
+o stałym rozmiarze (losowanie rezerwuarowe), na podstawie której obliczane są percentyle - zużycie pamięci nie
+rośnie więc wraz z liczbą wywołań (np. w długo działającej usłudze HTTP).
+Wyniki można pobrać jako słownik, zapisać do pliku JSON lub wyświetlić jako tabelę. Po zakończeniu programu
+tabela wypisywana jest na standardowe wyjście błędów, a jeśli ustawiono zmienną INFLATION_INSTRUMENTATION_OUTPUT -
+wyniki zapisywane są do wskazanego pliku JSON.
+
+Zmienna środowiskowa INFLATION_PROFILE=<nazwa> (np. 'OwnInflationEngine.calculate') włącza profilowanie
+(cProfile) tylko wskazanej operacji - niezależnie od pomiarów czasu. Statystyki zapisywane są po zakończeniu
+programu do pliku podanego w zmiennej INFLATION_PROFILE_OUTPUT (domyślnie '<nazwa>.prof') i mogą zostać
+odczytane modułem pstats. Przykład użycia:
+
+    INFLATION_INSTRUMENTATION=1 INFLATION_PROFILE=InflationData._load python main.py
+"""
+
+import atexit
+import cProfile
+import functools
+import json
+import os
+import random
+import sys
+import threading
+import time
+import numpy as np
+
+
+ENABLED = os.environ.get('INFLATION_INSTRUMENTATION', '') not in ('', '0')
+
+PROFILE_TARGET = os.environ.get('INFLATION_PROFILE') or None
+
+RESERVOIR_SIZE = 4096
+
+_timings = {}
+_lock = threading.Lock()
+_random = random.Random(0)
+_profiler = None
+_profile_state = threading.local()
+
+
+def _record(name, elapsed):
+    """Zapisuje czas wykonania operacji (liczba wywołań, łączny i maksymalny czas oraz próbka czasów wykonania)"""
+
+    with _lock:
+        timing = _timings.get(name)
+        if timing is None:
+            timing = _timings[name] = {'calls': 0, 'total': 0.0, 'max': 0.0, 'samples': []}
+
+        timing['calls'] += 1
+        timing['total'] += elapsed
+        timing['max'] = max(timing['max'], elapsed)
+        if len(timing['samples']) < RESERVOIR_SIZE:
+            timing['samples'].append(elapsed)
+        else:
+            position = _random.randrange(timing['calls'])
+            if position < RESERVOIR_SIZE:
+                timing['samples'][position] = elapsed
+
+
+def _profiled(function):
+    """Zwraca funkcję, której wywołania są profilowane przez współdzielony obiekt cProfile.Profile"""
+
+    global _profiler
+    if _profiler is None:
+        _profiler = cProfile.Profile()
+        atexit.register(_dump_profile)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        depth = getattr(_profile_state, 'depth', 0)
+        if depth == 0:
+            _profiler.enable()
+        _profile_state.depth = depth + 1
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _profile_state.depth = depth
+            if depth == 0:
+                _profiler.disable()
+
+    return wrapper
+
+
+def instrumented(function):
+    """Dekorator mierzący czas wykonania funkcji, gdy pomiary są włączone
+
+    Nazwą operacji jest kwalifikowana nazwa funkcji (np. 'InflationData.get_row_index'). Jeśli pomiary są
+    wyłączone i operacja nie jest wskazana w zmiennej INFLATION_PROFILE, funkcja zwracana jest bez zmian.
+
+    Parameters
+    ----------
+    function : callable
+        mierzona funkcja
+
+    Returns
+    -------
+    funkcja mierzona, profilowana lub niezmieniona
+    """
+
+    name = function.__qualname__
+    if name == PROFILE_TARGET:
+        function = _profiled(function)
+    if not ENABLED:
+        return function
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start_time)
+
+    return wrapper
+
+
+def get_stats():
+    """Zwraca statystyki czasu wykonania wszystkich mierzonych operacji
+
+    Returns
+    -------
+    stats : dict
+        słownik, którego kluczami są nazwy operacji, a wartościami słowniki z liczbą wywołań, łącznym i średnim
+        czasem oraz percentylami (50, 90, 99) i maksimum czasu wykonania w ms; percentyle obliczane są na podstawie
+        próbki co najwyżej RESERVOIR_SIZE czasów wykonania
+    """
+
+    with _lock:
+        timings = {name: dict(timing, samples=list(timing['samples'])) for name, timing in _timings.items()}
+
+    stats = {}
+    for name, timing in sorted(timings.items()):
+        p50, p90, p99 = (np.percentile(timing['samples'], [50, 90, 99]) * 1000).tolist()
+        stats[name] = {'calls': timing['calls'], 'total_ms': timing['total'] * 1000,
+                       'mean_ms': timing['total'] * 1000 / timing['calls'],
+                       'p50_ms': p50, 'p90_ms': p90, 'p99_ms': p99, 'max_ms': timing['max'] * 1000}
+
+    return stats
+
+
+def format_summary():
+    """Zwraca tabelę ze statystykami czasu wykonania (operacje uporządkowane według łącznego czasu)
+
+    Returns
+    -------
+    tabela zapisana jako tekst
+    """
+
+    stats = sorted(get_stats().items(), key=lambda item: item[1]['total_ms'], reverse=True)
+
+    lines = [f"{'operacja':<44}{'wywołania':>10}{'łącznie [ms]':>14}{'p50 [ms]':>11}{'p99 [ms]':>11}"]
+    for name, result in stats:
+        lines.append(f"{name:<44}{result['calls']:>10}{result['total_ms']:>14.3f}{result['p50_ms']:>11.4f}"
+                     f"{result['p99_ms']:>11.4f}")
+
+    return '\n'.join(lines)
+
+
+def dump_json(file_path):
+    """Zapisuje statystyki czasu wykonania do pliku JSON
+
+    Parameters
+    ----------
+    file_path : str
+        ścieżka do pliku JSON
+    """
+
+    with open(file_path, 'w') as file:
+        json.dump(get_stats(), file, indent=2)
+
+
+def reset():
+    """Usuwa wszystkie zapisane pomiary"""
+
+    with _lock:
+        _timings.clear()
+
+
+def _dump_profile():
+    """Zapisuje statystyki profilowania do pliku (wywoływana po zakończeniu programu)"""
+
+    output = os.environ.get('INFLATION_PROFILE_OUTPUT') or f"{PROFILE_TARGET}.prof"
+    _profiler.dump_stats(output)
+    print(f"Statystyki profilowania operacji {PROFILE_TARGET} zapisano w pliku {output}.", file=sys.stderr)
+
+
+def _dump_at_exit():
+    """Wypisuje lub zapisuje statystyki czasu wykonania po zakończeniu programu"""
+
+    if not _timings:
+        return
+
+    output = os.environ.get('INFLATION_INSTRUMENTATION_OUTPUT')
+    if output:
+        dump_json(output)
+    else:
+        print(format_summary(), file=sys.stderr)
+
+
+if ENABLED:
+    atexit.register(_dump_at_exit)
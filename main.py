@@ -6,14 +6,23 @@ W celu obsługi działania całego programu skrypt importuje z innych modułów
 - klasa CalculateInflation - obliczenie 'własnej' inflacji;
 - klasa ShowInflationOnGraph - stworzenie wykresu m.in. z dynamiką 'własnej' inflacji;
 - klasa ShowSavingsOnGraph - stworzenie wykresu przedstawiająego spadek wartości oszczędności przy określonej inflacji.
+
+Moduły tworzące wykresy (a wraz z nimi biblioteka matplotlib) importowane są dopiero przy pierwszym wyborze
+odpowiedniej opcji menu, dzięki czemu uruchomienie programu w celu obliczenia inflacji jest szybsze.
+
+Jeśli w katalogu roboczym znajduje się plik 'zbiory_danych.txt' (wiersze 'nazwa -> ścieżka do pliku .csv'),
+wymienione w nim zbiory danych (np. dla regionów lub typów gospodarstw domowych) są rejestrowane i wczytywane
+jednocześnie przy uruchomieniu programu, a użytkownik może wybrać, na którym z nich wykonywane są obliczenia.
 """
 
+import os
 import sys
 from calculate_inflation import CalculateInflation
-from show_inflation_on_graph import ShowInflationOnGraph
-from show_savings_on_graph import ShowSavingsOnGraph
+from dataset_registry import get_registry
 from exceptions import UnavailableChoice
 
+DATASETS_FILE = "zbiory_danych.txt"
+
 
 class MainMenu:
     """
@@ -25,6 +34,8 @@ class MainMenu:
         wybór użytkownika z listy możliwych operacji
     available_choices : list
         lista z możliwymi operacjami
+    dataset : str
+        nazwa wybranego zbioru danych (None - plik 'dane_inflacja.csv')
 
     Methods
     ----------
@@ -34,6 +45,8 @@ class MainMenu:
         odczytuje i waliduje wybór użytkownika
     operation()
         zapewnia działanie wybranej przez użytkownika opcji
+    choose_dataset()
+        odczytuje i waliduje wybór zbioru danych
     """
 
     def __init__(self):
@@ -41,14 +54,22 @@ class MainMenu:
 
         self.user_choice = None
         self.available_choices = [0, 1, 2, 3]
+        self.dataset = None
+
+        if os.path.isfile(DATASETS_FILE):
+            registry = get_registry()
+            try:
+                registry.load_all(registry.register_from_file(DATASETS_FILE), parse_in_processes=True)
+                self.available_choices.append(4)
+            except (OSError, ValueError) as error:
+                print(f"Nie udało się wczytać zbiorów danych z pliku {DATASETS_FILE}: {error}")
 
         while True:
             self.print_menu()
             self.validate_input()
             self.operation()
 
-    @staticmethod
-    def print_menu():
+    def print_menu(self):
         """Wyświetla w konsoli główne menu programu"""
 
         print('-' * 80)
@@ -58,6 +79,8 @@ class MainMenu:
         1. Oblicz własną inflację na podstawie danych GUS,
         2. Pokaż na wykresie przebieg dynamiki inflacji,
         3. Pokaż na wykresie jak topnieją oszczędności przy danej inflacji""")
+        if 4 in self.available_choices:
+            print(f"        4. Wybierz zbiór danych (obecnie: {self.dataset or 'dane_inflacja.csv'})")
 
     def validate_input(self):
         """Odczytuje wybór użytkownika
@@ -107,11 +130,41 @@ class MainMenu:
         if self.user_choice == 0:
             sys.exit()
         elif self.user_choice == 1:
-            CalculateInflation()
+            CalculateInflation(self.dataset)
         elif self.user_choice == 2:
-            ShowInflationOnGraph()
+            from show_inflation_on_graph import ShowInflationOnGraph
+            ShowInflationOnGraph(self.dataset)
         elif self.user_choice == 3:
-            ShowSavingsOnGraph()
+            from show_savings_on_graph import ShowSavingsOnGraph
+            ShowSavingsOnGraph(self.dataset)
+        elif self.user_choice == 4:
+            self.choose_dataset()
+
+    def choose_dataset(self):
+        """Odczytuje wybór zbioru danych i przypisuje jego nazwę do atrybutu 'dataset'
+
+        Raises
+        -------
+        ValueError
+            Jeśli podanej przez użytkownika wartości nie można zamienić na liczbę całkowitą
+        """
+
+        names = get_registry().names()
+        print("Dostępne zbiory danych:")
+        print("0 - dane_inflacja.csv")
+        for number, name in enumerate(names, 1):
+            print(f"{number} - {name}")
+
+        while True:
+            try:
+                number = int(input("Podaj numer zbioru danych: "))
+                if 0 <= number <= len(names):
+                    break
+                print(f"Podana liczba musi być z zakresu 0-{len(names)}!")
+            except ValueError:
+                print("Możesz wpisać tylko liczbę całkowitą!")
+
+        self.dataset = names[number - 1] if number else None
 
 
 if __name__ == '__main__':
@@ -0,0 +1,285 @@
+"""Moduł zawierający definicję klasy OwnInflationCache, która przechowuje obliczone wyniki 'własnej' inflacji
+
+Wyniki identyfikowane są skrótem (SHA-256) kanonicznej postaci wag (tablica float64 w kolejności 'get_categories()')
+oraz wersji danych (skrót zawartości pliku .csv i liczba miesięcy). Zmiana pliku .csv zmienia wersję danych,
+więc wyniki obliczone dla poprzedniej wersji nie są już zwracane - są usuwane z pamięci operacyjnej i z dysku przy
+pierwszym odwołaniu do nowej wersji danych. Wyniki dla nieaktualnej wersji są obliczane, ale nie są zapisywane.
+Wersje śledzone są osobno dla każdego pliku .csv, dzięki czemu wyniki dla wielu zbiorów danych (np. regionów) mogą
+znajdować się w pamięci podręcznej jednocześnie.
+
+Pamięć podręczna ma dwa poziomy:
+- w pamięci operacyjnej - najdawniej używane wyniki są usuwane po przekroczeniu limitu rozmiaru (LRU);
+- opcjonalnie na dysku - pliki .npy w katalogu podanym w konstruktorze (lub w zmiennej środowiskowej
+  OWN_INFLATION_CACHE_DIR dla pamięci współdzielonej w całym procesie), które są zachowywane między
+  uruchomieniami programu.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+import numpy as np
+from instrumentation import instrumented
+from own_inflation_engine import OwnInflationEngine
+
+
+def dataset_version(data):
+    """Zwraca wersję danych dotyczących inflacji
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+
+    Returns
+    -------
+    wersja danych - skrót zawartości pliku .csv i liczba miesięcy
+    """
+
+    return f"{data.source_hash}:{len(data.months)}"
+
+
+def weights_key(weights, version):
+    """Zwraca skrót kanonicznej postaci wag oraz wersji danych
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        tablica (kategorie) lub macierz (zestawy wag x kategorie) z wagami
+    version : str
+        wersja danych
+
+    Returns
+    -------
+    skrót zapisany szesnastkowo
+    """
+
+    weights = np.ascontiguousarray(weights, dtype=np.float64) + 0.0
+    hasher = hashlib.sha256(version.encode('utf-8'))
+    hasher.update(repr(weights.shape).encode('ascii'))
+    hasher.update(weights.tobytes())
+
+    return hasher.hexdigest()
+
+
+class OwnInflationCache:
+    """
+    Klasa reprezentująca dwupoziomową pamięć podręczną wyników 'własnej' inflacji
+
+    Attributes
+    ----------
+    max_bytes : int
+        maksymalny rozmiar wyników przechowywanych w pamięci operacyjnej w bajtach
+    cache_dir : str
+        katalog, w którym zapisywane są wyniki na dysku (None - bez zapisu na dysku)
+    memory_hits : int
+        liczba odwołań obsłużonych z pamięci operacyjnej
+    disk_hits : int
+        liczba odwołań obsłużonych z dysku
+    misses : int
+        liczba odwołań, które wymagały obliczenia wyniku
+
+    Methods
+    ----------
+    calculate(data, weights)
+        zwraca 'własną' inflację dla podanych wag, obliczając ją tylko wtedy, gdy nie ma jej w pamięci podręcznej
+    get_stats()
+        zwraca słownik ze statystykami działania pamięci podręcznej
+    clear()
+        usuwa wszystkie wyniki z pamięci operacyjnej i zeruje statystyki
+    """
+
+    def __init__(self, max_bytes=64 << 20, cache_dir=None):
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            maksymalny rozmiar wyników przechowywanych w pamięci operacyjnej w bajtach
+        cache_dir : str
+            katalog, w którym zapisywane są wyniki na dysku (None - bez zapisu na dysku)
+        """
+
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._versions = {}
+        self._retired = set()
+        self._lock = threading.Lock()
+
+    def _version_dir(self, source, version):
+        """Zwraca katalog z wynikami zapisanymi na dysku dla podanego pliku .csv i wersji danych"""
+
+        source_prefix = hashlib.sha256(source.encode('utf-8')).hexdigest()[:8]
+        version_name = hashlib.sha256(version.encode('utf-8')).hexdigest()[:16]
+
+        return os.path.join(self.cache_dir, f"{source_prefix}-{version_name}")
+
+    def _set_version(self, source, version):
+        """Usuwa wyniki obliczone dla poprzedniej wersji danych z tego samego pliku .csv z pamięci operacyjnej
+        oraz z dysku
+
+        Usuwane są tylko wyniki pary (plik .csv, poprzednia wersja danych), więc wyniki innych plików .csv - również
+        o tej samej zawartości - oraz wyniki zapisane w tym samym katalogu przez inne procesy dla innych plików
+        pozostają nienaruszone. Poprzednia wersja jest zapamiętywana jako nieaktualna, więc odwołania do niej
+        (np. przez inny, nieodświeżony obiekt klasy InflationData dla tego samego pliku) nie cofają wersji danych.
+        """
+
+        previous = self._versions.get(source)
+        self._versions[source] = version
+        if previous is None:
+            return
+        self._retired.add((source, previous))
+
+        for entry_key in [entry_key for entry_key, (entry_version, _) in self._entries.items()
+                          if entry_key[0] == source and entry_version == previous]:
+            self._bytes -= self._entries.pop(entry_key)[1].nbytes
+
+        if self.cache_dir is not None:
+            shutil.rmtree(self._version_dir(source, previous), ignore_errors=True)
+
+    def _store(self, source, key, version, result):
+        """Zapisuje wynik w pamięci operacyjnej, usuwając najdawniej używane wyniki po przekroczeniu limitu"""
+
+        if result.nbytes > self.max_bytes:
+            return
+
+        replaced = self._entries.pop((source, key), None)
+        if replaced is not None:
+            self._bytes -= replaced[1].nbytes
+
+        self._entries[(source, key)] = (version, result)
+        self._bytes += result.nbytes
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    def _load_from_disk(self, source, version, key):
+        """Zwraca wynik zapisany na dysku lub None, jeśli nie ma go na dysku"""
+
+        if self.cache_dir is None:
+            return None
+
+        try:
+            return np.load(os.path.join(self._version_dir(source, version), f"{key}.npy"))
+        except (OSError, ValueError):
+            return None
+
+    def _save_to_disk(self, source, version, key, result):
+        """Zapisuje wynik na dysku (zapis do pliku tymczasowego i zamiana nazwy)"""
+
+        if self.cache_dir is None:
+            return
+
+        directory = self._version_dir(source, version)
+        path = os.path.join(directory, f"{key}.npy")
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temporary_path, 'wb') as file:
+                np.save(file, result)
+            os.replace(temporary_path, path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @instrumented
+    def calculate(self, data, weights):
+        """Zwraca 'własną' inflację dla podanych wag, obliczając ją tylko wtedy, gdy nie ma jej w pamięci podręcznej
+
+        Zwracana tablica jest współdzielona z pamięcią podręczną, więc jest tylko do odczytu.
+
+        Parameters
+        ----------
+        data : obiekt klasy InflationData
+            dane dotyczące inflacji
+        weights : numpy.ndarray
+            tablica z wagami (kategorie) lub macierz z wagami (zestawy wag x kategorie) wyrażonymi w procentach
+
+        Returns
+        -------
+        result : numpy.ndarray
+            tablica (miesiące) lub macierz (zestawy wag x miesiące) z 'własną' inflacją
+
+        Raises
+        -------
+        ValueError
+            Jeśli liczba wag nie jest równa liczbie kategorii
+        """
+
+        source = os.path.abspath(data.file_path)
+        version = dataset_version(data)
+        key = weights_key(weights, version)
+
+        with self._lock:
+            if version != self._versions.get(source) and (source, version) not in self._retired:
+                self._set_version(source, version)
+
+            entry = self._entries.get((source, key))
+            if entry is not None:
+                self._entries.move_to_end((source, key))
+                self.memory_hits += 1
+                return entry[1]
+
+        result = self._load_from_disk(source, version, key)
+        from_disk = result is not None
+        if not from_disk:
+            result = OwnInflationEngine(data).calculate(weights)
+        result.setflags(write=False)
+
+        with self._lock:
+            current = version == self._versions.get(source)
+            if current:
+                self._store(source, key, version, result)
+            if from_disk:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+
+        if current and not from_disk:
+            self._save_to_disk(source, version, key, result)
+
+        return result
+
+    def get_stats(self):
+        """
+        Returns
+        ----------
+        stats : dict
+            słownik z liczbą trafień (w pamięci operacyjnej i na dysku) i chybień, udziałem trafień, liczbą wyników
+            w pamięci operacyjnej oraz ich rozmiarem w bajtach
+        """
+
+        with self._lock:
+            requests = self.memory_hits + self.disk_hits + self.misses
+            stats = {'memory_hits': self.memory_hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                     'hit_rate': (self.memory_hits + self.disk_hits) / requests if requests else 0.0,
+                     'entries': len(self._entries), 'bytes': self._bytes}
+
+        return stats
+
+    def clear(self):
+        """Usuwa wszystkie wyniki z pamięci operacyjnej i zeruje statystyki"""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+
+_cache = OwnInflationCache(cache_dir=os.environ.get('OWN_INFLATION_CACHE_DIR'))
+
+
+def get_own_inflation_cache():
+    """
+    Returns
+    ----------
+    pamięć podręczna wyników 'własnej' inflacji współdzielona w całym procesie
+    """
+    return _cache
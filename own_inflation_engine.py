@@ -0,0 +1,126 @@
+"""Moduł zawierający definicję klasy OwnInflationEngine, która oblicza 'własną' inflację dla wielu zestawów wag
+jednocześnie
+
+Obliczenia wykonywane są jako jedno mnożenie macierzy wag (zestawy wag x kategorie) przez macierz z inflacją
+w poszczególnych kategoriach towarów i usług przechowywaną w obiekcie klasy InflationData.
+W celu wykonania obliczeń wykorzystywana jest biblioteka numpy.
+"""
+
+import numpy as np
+from instrumentation import instrumented
+
+
+class OwnInflationEngine:
+    """
+    Klasa reprezentująca silnik obliczający 'własną' inflację dla wielu zestawów wag we wszystkich miesiącach
+
+    Attributes
+    ----------
+    data : obiekt klasy InflationData
+        obiekt umożliwiający wykonywanie operacji na danych dotyczących inflacji
+    categories : list
+        lista z nazwami kategorii towarów i usług w kolejności 'get_categories()'
+
+    Methods
+    ----------
+    weights_to_vector(weights)
+        zamienia słownik z wagami na tablicę uporządkowaną według kolejności kategorii
+    weights_to_matrix(profiles)
+        zamienia listę słowników z wagami na macierz (zestawy wag x kategorie)
+    calculate(weights)
+        oblicza 'własną' inflację dla jednego lub wielu zestawów wag we wszystkich miesiącach
+    """
+
+    def __init__(self, data):
+        """
+        Parameters
+        ----------
+        data : obiekt klasy InflationData
+            dane dotyczące inflacji, na podstawie których wykonywane są obliczenia
+        """
+
+        self.data = data
+        self.categories = data.get_categories()
+
+    def weights_to_vector(self, weights):
+        """Zamienia słownik z wagami na tablicę uporządkowaną według kolejności kategorii
+
+        Parameters
+        ----------
+        weights : dict
+            słownik, którego kluczami są nazwy kategorii, a wartościami wagi wyrażone w procentach
+
+        Returns
+        -------
+        vector : numpy.ndarray
+            tablica z wagami w kolejności 'get_categories()'
+
+        Raises
+        -------
+        ValueError
+            Jeśli w słowniku brakuje wagi dla którejś z kategorii
+        """
+
+        try:
+            vector = np.array([weights[category] for category in self.categories], dtype=np.float64)
+        except KeyError as error:
+            raise ValueError(f"Brak wagi dla kategorii {error}!")
+
+        return vector
+
+    def weights_to_matrix(self, profiles):
+        """Zamienia listę słowników z wagami na macierz (zestawy wag x kategorie)
+
+        Parameters
+        ----------
+        profiles : list
+            lista słowników z wagami
+
+        Returns
+        -------
+        matrix : numpy.ndarray
+            macierz, której kolejne wiersze to kolejne zestawy wag
+
+        Raises
+        -------
+        ValueError
+            Jeśli w którymś ze słowników brakuje wagi dla którejś z kategorii
+        """
+
+        matrix = np.empty((len(profiles), len(self.categories)), dtype=np.float64)
+        for row, weights in enumerate(profiles):
+            matrix[row] = self.weights_to_vector(weights)
+
+        return matrix
+
+    @instrumented
+    def calculate(self, weights):
+        """Oblicza 'własną' inflację dla jednego lub wielu zestawów wag we wszystkich miesiącach
+
+        Wynik ma taką samą postać jak dane w pliku .csv, tzn. jest indeksem cen (analogiczny okres
+        poprzedniego roku = 100)
+
+        Parameters
+        ----------
+        weights : numpy.ndarray
+            tablica z wagami (kategorie) lub macierz z wagami (zestawy wag x kategorie) wyrażonymi w procentach
+
+        Returns
+        -------
+        own_inflation : numpy.ndarray
+            tablica (miesiące) lub macierz (zestawy wag x miesiące) z 'własną' inflacją
+
+        Raises
+        -------
+        ValueError
+            Jeśli liczba wag nie jest równa liczbie kategorii
+        """
+
+        weights = np.asarray(weights, dtype=np.float64)
+
+        if weights.shape[-1] != len(self.categories):
+            raise ValueError(f"Liczba wag musi być równa liczbie kategorii ({len(self.categories)})!")
+
+        own_inflation = (weights / 100) @ self.data.get_category_matrix().T
+
+        return own_inflation
@@ -0,0 +1,205 @@
+"""Moduł zawierający definicję klasy PriceLevelIndex, która umożliwia obliczenie skumulowanej inflacji między
+dowolnymi dwoma miesiącami w czasie stałym
+
+Dane w pliku .csv to indeksy rok do roku, więc na ich podstawie odtwarzany jest poziom cen w kolejnych miesiącach
+(funkcja price_levels z modułu index_transformation - poziom cen to poziom sprzed 12 miesięcy pomnożony przez
+indeks rok do roku). Logarytmy poziomów cen przechowywane są dla inflacji ogółem ('Ogolem'), każdej kategorii oraz
+dodanych serii 'własnej' inflacji. Wzrost cen między dwoma miesiącami to iloraz dwóch poziomów cen - dla miesięcy
+odległych o wielokrotność 12 jest on dokładnie równy iloczynowi indeksów rok do roku, a dla pozostałych par
+miesięcy jest szacunkiem (zależy od założonego przebiegu cen przed okresem objętym przez dane). Logarytmy poziomów
+cen przechowywane są w buforach o podwajanej pojemności, więc po dopisaniu miesięcy do danych obliczane są tylko
+poziomy cen nowych miesięcy.
+"""
+
+import numpy as np
+from index_transformation import _month_numbers, price_levels
+from instrumentation import instrumented
+from own_inflation_engine import OwnInflationEngine
+
+
+class PriceLevelIndex:
+    """
+    Klasa reprezentująca skumulowany indeks poziomu cen obliczony na podstawie danych dotyczących inflacji
+
+    Attributes
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+
+    Methods
+    ----------
+    update()
+        uzupełnia poziomy cen o miesiące dopisane do danych od ostatniego wywołania
+    add_own_inflation(name, weights)
+        dodaje serię 'własnej' inflacji obliczonej dla podanych wag
+    cumulative_inflation(start, end, index, name)
+        zwraca skumulowaną inflację między dwoma miesiącami
+    """
+
+    def __init__(self, data):
+        """
+        Parameters
+        ----------
+        data : obiekt klasy InflationData
+            dane dotyczące inflacji
+        """
+
+        self.data = data
+        self._engine = OwnInflationEngine(data)
+        self._rows = 0
+        self._load_version = None
+        self._log_levels = None
+        self._own_weights = {}
+        self._own_log_levels = {}
+
+    @staticmethod
+    def _allocate(log_levels):
+        """Tworzy bufor z logarytmami poziomów cen o pojemności większej niż liczba wierszy (do dopisywania)"""
+
+        buffer = np.empty((max(2 * len(log_levels), 16),) + log_levels.shape[1:])
+        buffer[:len(log_levels)] = log_levels
+
+        return buffer
+
+    @staticmethod
+    def _extend(log_levels, rows, log_indices):
+        """Dopisuje logarytmy poziomów cen nowych miesięcy do bufora, podwajając jego pojemność w razie potrzeby
+
+        Logarytm poziomu cen to logarytm poziomu sprzed 12 miesięcy powiększony o logarytm indeksu rok do roku,
+        więc do dopisania miesięcy potrzebne są tylko poziomy cen z ostatnich 12 miesięcy. Miesiące dopisywane są
+        blokami po 12 (każdy blok zależy tylko od poprzedniego).
+
+        Parameters
+        ----------
+        log_levels : numpy.ndarray
+            bufor z logarytmami poziomów cen (wiersz 0 to miesiąc poprzedzający dane, wiersz i to i-ty miesiąc)
+        rows : int
+            liczba miesięcy, dla których poziomy cen są już obliczone (co najmniej 12)
+        log_indices : numpy.ndarray
+            logarytmy indeksów rok do roku (podzielonych przez 100) w nowych miesiącach
+
+        Returns
+        -------
+        bufor z dopisanymi logarytmami poziomów cen
+        """
+
+        total_rows = rows + len(log_indices)
+        if total_rows + 1 > len(log_levels):
+            buffer = np.empty((max(2 * len(log_levels), total_rows + 1),) + log_levels.shape[1:])
+            buffer[:rows + 1] = log_levels[:rows + 1]
+            log_levels = buffer
+
+        for first in range(0, len(log_indices), 12):
+            block = log_indices[first:first + 12]
+            row = rows + 1 + first
+            np.add(log_levels[row - 12:row - 12 + len(block)], block, out=log_levels[row:row + len(block)])
+
+        return log_levels
+
+    def update(self):
+        """Uzupełnia poziomy cen o miesiące dopisane do danych od ostatniego wywołania
+
+        Jeśli dane zostały jedynie uzupełnione o miesiące dopisane na końcu (atrybut 'load_version' się nie
+        zmienił), obliczane są tylko poziomy cen nowych miesięcy, a koszt zależy tylko od ich liczby. Jeśli dane
+        zostały wczytane na nowo lub obejmują mniej niż 12 miesięcy, poziomy cen obliczane są od początku.
+
+        Raises
+        -------
+        ValueError
+            Jeśli miesiące objęte przez dane nie następują bezpośrednio po sobie
+        """
+
+        rows = len(self.data.months)
+        load_version = self.data.load_version
+        if load_version == self._load_version and rows == self._rows:
+            return
+
+        if load_version != self._load_version or rows < self._rows or self._rows < 12:
+            _month_numbers(self.data.period_keys)
+            self._log_levels = self._allocate(np.log(price_levels(self.data.values)))
+            for name, weights in self._own_weights.items():
+                self._own_log_levels[name] = self._allocate(np.log(price_levels(self._engine.calculate(weights))))
+        else:
+            _month_numbers(self.data.period_keys[self._rows - 1:rows])
+            new_values = self.data.values[self._rows:rows]
+            self._log_levels = self._extend(self._log_levels, self._rows, np.log(new_values / 100))
+            for name, weights in self._own_weights.items():
+                own_inflation = (weights / 100) @ new_values[:, 1:].T
+                self._own_log_levels[name] = self._extend(self._own_log_levels[name], self._rows,
+                                                          np.log(own_inflation / 100))
+
+        self._rows = rows
+        self._load_version = load_version
+
+    def add_own_inflation(self, name, weights):
+        """Dodaje serię 'własnej' inflacji obliczonej dla podanych wag
+
+        Parameters
+        ----------
+        name : str
+            nazwa serii
+        weights : dict, numpy.ndarray
+            wagi wydatków wyrażone w procentach (słownik lub tablica w kolejności 'get_categories()')
+
+        Raises
+        -------
+        ValueError
+            Jeśli miesiące objęte przez dane nie następują bezpośrednio po sobie
+        """
+
+        self.update()
+        if isinstance(weights, dict):
+            weights = self._engine.weights_to_vector(weights)
+        weights = np.asarray(weights, dtype=np.float64)
+
+        self._own_weights[name] = weights
+        self._own_log_levels[name] = self._allocate(np.log(price_levels(self._engine.calculate(weights))))
+
+    @instrumented
+    def cumulative_inflation(self, start, end, index=None, name=None):
+        """Zwraca skumulowaną inflację między dwoma miesiącami
+
+        Wynik to procentowy wzrost cen od końca miesiąca 'start' do końca miesiąca 'end'.
+
+        Parameters
+        ----------
+        start : tuple
+            tupla z miesiącem (cyfra rzymska) i rokiem
+        end : tuple
+            tupla z miesiącem (cyfra rzymska) i rokiem
+        index : int
+            indeks kategorii z atrybutu 'data_field_map' (0 - inflacja ogółem); jeśli nie zostanie podany,
+            zwracana jest tablica dla wszystkich kategorii
+        name : str
+            nazwa dodanej wcześniej serii 'własnej' inflacji (zamiast indeksu kategorii)
+
+        Returns
+        -------
+        skumulowana inflacja wyrażona w procentach (liczba lub tablica)
+
+        Raises
+        -------
+        ValueError
+            Jeśli dane nie obejmują podanych miesięcy, miesiąc 'start' jest późniejszy niż miesiąc 'end' lub miesiące
+            objęte przez dane nie następują bezpośrednio po sobie
+        KeyError
+            Jeśli nie dodano serii o podanej nazwie
+        """
+
+        self.update()
+
+        first_row = self.data.get_row_index(*start)
+        last_row = self.data.get_row_index(*end)
+        if first_row > last_row:
+            raise ValueError("Miesiąc początkowy musi być wcześniejszy niż miesiąc końcowy!")
+
+        if name is not None:
+            log_levels = self._own_log_levels[name]
+        elif index is not None:
+            log_levels = self._log_levels[:, index]
+        else:
+            log_levels = self._log_levels
+
+        growth = np.expm1(log_levels[last_row + 1] - log_levels[first_row + 1]) * 100
+
+        return float(growth) if np.ndim(growth) == 0 else growth
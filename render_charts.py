@@ -0,0 +1,146 @@
+"""Skrypt zapisujący wykresy do plików PNG lub SVG bez wyświetlania okien (tryb bezgłowy)
+
+Tworzone są wykresy z przebiegiem inflacji w każdej kategorii z atrybutu 'data_field_map' klasy InflationData
+oraz - jeśli podano katalog z plikami z wagami - wykresy z przebiegiem inflacji według wag GUS i według wag
+z każdego pliku. Wykresy tworzone są równolegle w puli procesów o rozmiarze równym liczbie rdzeni procesora.
+Inflacja może zostać pokazana rok do roku (domyślnie), miesiąc do miesiąca lub od początku roku. Przykład użycia:
+
+    python render_charts.py wykresy --weights katalog_z_wagami --format svg --basis mom
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+from dataset_registry import get_inflation_data
+from get_user_weights import read_weights_file
+from index_transformation import get_index_transformer
+from own_inflation_engine import OwnInflationEngine
+from show_inflation_on_graph import draw_category_inflation, draw_gus_and_own_inflation
+
+
+def render_chart(task):
+    """Tworzy jeden wykres i zapisuje go do pliku
+
+    Parameters
+    ----------
+    task : tuple
+        tupla zawierająca rodzaj wykresu ('category' lub 'profile'), indeks kategorii lub ścieżkę do pliku z wagami,
+        katalog docelowy, format pliku, ścieżkę do pliku .csv z danymi oraz ujęcie inflacji
+
+    Returns
+    -------
+    tupla zawierająca ścieżkę do zapisanego pliku oraz czas tworzenia wykresu w sekundach
+    """
+
+    kind, source, output_dir, file_format, data_path, basis = task
+    start_time = time.perf_counter()
+    data = get_inflation_data(data_path)
+
+    if kind == 'category':
+        figure = draw_category_inflation(data, source, basis=basis)
+        file_name = f"kategoria_{source:02d}.{file_format}"
+    else:
+        engine = OwnInflationEngine(data)
+        transformer = get_index_transformer(data)
+        own_inflation = engine.calculate(engine.weights_to_vector(read_weights_file(source)))
+        own_inflation = transformer.transform(own_inflation, basis, percent=True)
+        own_inflation = dict(zip(data.get_available_months(), np.round(own_inflation, 1).tolist()))
+        gus_inflation = dict(zip(data.get_available_months(), transformer.view(basis, percent=True)[:, 0].tolist()))
+        figure = draw_gus_and_own_inflation(gus_inflation, own_inflation, basis)
+        file_name = f"profil_{os.path.splitext(os.path.basename(source))[0]}.{file_format}"
+
+    output_path = os.path.join(output_dir, file_name)
+    figure.savefig(output_path, format=file_format)
+    plt.close(figure)
+
+    return output_path, time.perf_counter() - start_time
+
+
+def render_all(output_dir, weights_dir=None, file_format='png', workers=None, data_path="dane_inflacja.csv",
+               basis='yoy'):
+    """Tworzy wszystkie wykresy w puli procesów
+
+    Parameters
+    ----------
+    output_dir : str
+        katalog, do którego zapisywane są wykresy
+    weights_dir : str
+        katalog z plikami .txt z wagami - jeśli nie zostanie podany, tworzone są tylko wykresy kategorii
+    file_format : str
+        format plików - 'png' lub 'svg'
+    workers : int
+        liczba procesów (domyślnie liczba rdzeni procesora)
+    data_path : str
+        ścieżka do pliku .csv z danymi dotyczącymi inflacji
+    basis : str
+        ujęcie inflacji - 'yoy' (rok do roku), 'mom' (miesiąc do miesiąca) lub 'ytd' (od początku roku)
+
+    Yields
+    -------
+    tupla zawierająca ścieżkę do zapisanego pliku oraz czas tworzenia wykresu w sekundach
+    """
+
+    os.makedirs(output_dir, exist_ok=True)
+    data = get_inflation_data(data_path)
+
+    tasks = [('category', index, output_dir, file_format, data_path, basis) for index in data.data_field_map]
+    if weights_dir is not None:
+        tasks += [('profile', entry.path, output_dir, file_format, data_path, basis)
+                  for entry in sorted(os.scandir(weights_dir), key=lambda item: item.name)
+                  if entry.is_file() and entry.name.endswith('.txt')]
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(render_chart, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń i tworzy wykresy
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Zapisuje wykresy z przebiegiem inflacji do plików.")
+    parser.add_argument('output_dir', help="katalog, do którego zapisywane są wykresy")
+    parser.add_argument('--weights', help="katalog z plikami .txt z wagami")
+    parser.add_argument('--format', choices=['png', 'svg'], default='png', help="format plików z wykresami")
+    parser.add_argument('--workers', type=int, help="liczba procesów (domyślnie liczba rdzeni procesora)")
+    parser.add_argument('--data', default="dane_inflacja.csv", help="plik .csv z danymi dotyczącymi inflacji")
+    parser.add_argument('--basis', choices=['yoy', 'mom', 'ytd'], default='yoy',
+                        help="ujęcie inflacji - rok do roku, miesiąc do miesiąca lub od początku roku")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    charts_count = 0
+    try:
+        for output_path, elapsed in render_all(args.output_dir, args.weights, args.format, args.workers, args.data,
+                                               args.basis):
+            print(f"{output_path}: {elapsed * 1000:.1f} ms")
+            charts_count += 1
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Zapisano {charts_count} wykresów w {elapsed:.2f} s.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
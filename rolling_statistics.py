@@ -0,0 +1,120 @@
+"""Moduł zawierający funkcje obliczające statystyki kroczące (średnią, odchylenie standardowe, minimum i maksimum)
+inflacji w oknie o zadanej liczbie miesięcy
+
+Statystyki obliczane są jednocześnie dla wszystkich okien i wszystkich serii (kolumn) bez pętli po oknach.
+Średnia i odchylenie standardowe wyznaczane są z sum skumulowanych wartości i ich kwadratów (przed sumowaniem od
+wartości odejmowana jest średnia serii, co ogranicza utratę precyzji), a minimum i maksimum - z widoku
+przesuwnego okna (numpy.lib.stride_tricks.sliding_window_view), który nie kopiuje danych.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from instrumentation import instrumented
+from own_inflation_engine import OwnInflationEngine
+
+
+def _window_sums(values, window):
+    """Zwraca sumy wartości w kolejnych oknach obliczone jako różnice sum skumulowanych
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        tablica (miesiące) lub macierz (miesiące x serie) z wartościami
+    window : int
+        liczba miesięcy w oknie
+
+    Returns
+    -------
+    tablica lub macierz z sumami w kolejnych oknach
+    """
+
+    cumulative = np.zeros((len(values) + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=cumulative[1:])
+
+    return cumulative[window:] - cumulative[:-window]
+
+
+@instrumented
+def rolling_statistics(values, window):
+    """Oblicza statystyki kroczące w oknie o zadanej liczbie miesięcy
+
+    Wiersz i wyników odpowiada oknu kończącemu się w miesiącu i + window - 1.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        tablica (miesiące) lub macierz (miesiące x serie) z wartościami
+    window : int
+        liczba miesięcy w oknie
+
+    Returns
+    -------
+    statistics : dict
+        słownik, którego kluczami są nazwy statystyk ('mean', 'std', 'min', 'max'), a wartościami tablice
+        (okna) lub macierze (okna x serie)
+
+    Raises
+    -------
+    ValueError
+        Jeśli okno jest krótsze niż 1 miesiąc lub dłuższe niż liczba miesięcy w danych
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if not 1 <= window <= len(values):
+        raise ValueError(f"Długość okna musi być z zakresu 1-{len(values)}!")
+
+    shift = values.mean(axis=0)
+    centered = values - shift
+    mean = _window_sums(centered, window) / window
+    variance = _window_sums(centered ** 2, window) / window - mean ** 2
+
+    windows = sliding_window_view(values, window, axis=0)
+    statistics = {'mean': mean + shift, 'std': np.sqrt(np.maximum(variance, 0)),
+                  'min': windows.min(axis=-1), 'max': windows.max(axis=-1)}
+
+    return statistics
+
+
+def category_rolling_statistics(data, window):
+    """Oblicza statystyki kroczące inflacji ogółem oraz inflacji we wszystkich kategoriach towarów i usług
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    window : int
+        liczba miesięcy w oknie
+
+    Returns
+    -------
+    słownik ze statystykami - macierzami (okna x kategorie), których kolumny odpowiadają indeksom z atrybutu
+    'data_field_map' (0 - inflacja ogółem)
+    """
+
+    return rolling_statistics(data.values, window)
+
+
+def own_rolling_statistics(data, weights, window):
+    """Oblicza statystyki kroczące 'własnej' inflacji dla jednego lub wielu zestawów wag
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    weights : dict, numpy.ndarray
+        wagi wydatków wyrażone w procentach (słownik, tablica w kolejności 'get_categories()' lub macierz
+        (zestawy wag x kategorie))
+    window : int
+        liczba miesięcy w oknie
+
+    Returns
+    -------
+    słownik ze statystykami - tablicami (okna) lub macierzami (okna x zestawy wag)
+    """
+
+    engine = OwnInflationEngine(data)
+    if isinstance(weights, dict):
+        weights = engine.weights_to_vector(weights)
+
+    return rolling_statistics(engine.calculate(weights).T, window)
@@ -0,0 +1,57 @@
+"""Moduł zawierający funkcję obliczającą spadek realnej wartości oszczędności z powodu inflacji
+
+Obliczenia wykonywane są jednocześnie dla wszystkich wartości inflacji i wszystkich kroków czasowych
+(siatka: wartości inflacji x kroki czasowe) przy użyciu biblioteki numpy. Moduł nie tworzy wykresów -
+zwracane tablice wykorzystywane są przez klasę ShowSavingsOnGraph.
+"""
+
+import numpy as np
+from instrumentation import instrumented
+
+
+STEPS_PER_YEAR = {'annual': 1, 'monthly': 12}
+
+
+@instrumented
+def calculate_real_savings(money_amount, inflation_rates, savings_period, compounding='annual'):
+    """Oblicza realną wartość oszczędności w kolejnych okresach dla wielu wartości inflacji jednocześnie
+
+    Realna wartość po x latach przy kapitalizacji rocznej wynosi money_amount * (1 - inflacja/100) ** x,
+    a przy kapitalizacji miesięcznej money_amount * (1 - inflacja/1200) ** (12 * x).
+
+    Parameters
+    ----------
+    money_amount : float
+        kwota oszczędności
+    inflation_rates : list, numpy.ndarray
+        wartości inflacji rok do roku wyrażone w procentach
+    savings_period : int
+        czas oszczędzania w latach
+    compounding : str
+        sposób kapitalizacji - 'annual' (roczna) lub 'monthly' (miesięczna)
+
+    Returns
+    -------
+    time_axis : numpy.ndarray
+        tablica z czasem oszczędzania w latach odpowiadającym kolejnym krokom czasowym
+    values : numpy.ndarray
+        macierz (wartości inflacji x kroki czasowe) z realną wartością oszczędności
+
+    Raises
+    -------
+    ValueError
+        Jeśli podano nieznany sposób kapitalizacji
+    """
+
+    if compounding not in STEPS_PER_YEAR:
+        raise ValueError(f"Nieznany sposób kapitalizacji: {compounding}. Dostępne wartości to: "
+                         f"{list(STEPS_PER_YEAR)}.")
+
+    steps_per_year = STEPS_PER_YEAR[compounding]
+    rates = np.atleast_1d(np.asarray(inflation_rates, dtype=np.float64)) / (100 * steps_per_year)
+    steps = np.arange(savings_period * steps_per_year + 1)
+
+    time_axis = steps / steps_per_year
+    values = money_amount * np.power(1 - rates[:, np.newaxis], steps[np.newaxis, :])
+
+    return time_axis, values
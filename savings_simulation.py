@@ -0,0 +1,218 @@
+"""Moduł umożliwiający symulację Monte Carlo realnej wartości oszczędności na podstawie historycznej inflacji
+
+Ścieżki inflacji miesiąc do miesiąca tworzone są przez losowanie ze zwracaniem (bootstrap) miesięcy z historii
+danych przechowywanych w obiekcie klasy InflationData. Inflacja w każdym miesiącu to 'własna' inflacja obliczona
+dla podanych wag i zamieniona z wartości rok do roku na wartość miesiąc do miesiąca na podstawie odtworzonego
+poziomu cen (metoda transform klasy IndexTransformer). Losowane są tylko miesiące, dla których inflacja miesiąc
+do miesiąca jest dostępna (od 13. miesiąca danych). Opcjonalnie losowane są całe bloki kolejnych miesięcy, co
+zachowuje krótkookresową zależność między miesiącami.
+
+Symulacja wykonywana jest wektorowo dla wielu ścieżek jednocześnie i dzielona na porcje obliczane w puli
+procesów. Każda porcja ma własne ziarno wyprowadzone z ziarna głównego (numpy.random.SeedSequence), więc wynik
+zależy tylko od ziarna i liczby ścieżek, a nie od liczby procesów. Przykład użycia:
+
+    python savings_simulation.py wagi.txt --amount 10000 --years 10 --paths 100000 --output symulacja.png
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from dataset_registry import get_inflation_data
+from get_user_weights import read_weights_file
+from index_transformation import get_index_transformer
+from instrumentation import instrumented
+from own_inflation_engine import OwnInflationEngine
+
+
+PATHS_PER_TASK = 10000
+
+
+def monthly_log_factors(data, weights):
+    """Oblicza logarytmy miesięcznych współczynników wzrostu cen dla wszystkich miesięcy z historii
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    weights : dict, numpy.ndarray
+        wagi wydatków wyrażone w procentach (słownik lub tablica w kolejności 'get_categories()')
+
+    Returns
+    -------
+    tablica z logarytmami współczynników wzrostu cen miesiąc do miesiąca (bez pierwszych 12 miesięcy danych,
+    dla których inflacja miesiąc do miesiąca nie jest dostępna)
+
+    Raises
+    -------
+    ValueError
+        Jeśli dane obejmują mniej niż 13 miesięcy lub miesiące nie następują bezpośrednio po sobie
+    """
+
+    engine = OwnInflationEngine(data)
+    if isinstance(weights, dict):
+        weights = engine.weights_to_vector(weights)
+
+    month_on_month = get_index_transformer(data).transform(engine.calculate(weights), 'mom')
+    month_on_month = month_on_month[~np.isnan(month_on_month)]
+    if not len(month_on_month):
+        raise ValueError("Do symulacji potrzebne są dane obejmujące co najmniej 13 miesięcy!")
+
+    return np.log(month_on_month / 100)
+
+
+def simulate_paths(log_factors, paths, horizon, seed, block_size=1):
+    """Symuluje ścieżki skumulowanego wzrostu cen przez losowanie miesięcy z historii
+
+    Parameters
+    ----------
+    log_factors : numpy.ndarray
+        logarytmy miesięcznych współczynników wzrostu cen z historii
+    paths : int
+        liczba ścieżek
+    horizon : int
+        liczba symulowanych miesięcy
+    seed : numpy.random.SeedSequence, int
+        ziarno generatora liczb losowych
+    block_size : int
+        liczba kolejnych miesięcy losowanych jako jeden blok (1 - losowanie pojedynczych miesięcy)
+
+    Returns
+    -------
+    macierz (ścieżki x (horizon + 1)) z realną wartością jednej złotówki w kolejnych miesiącach
+    """
+
+    generator = np.random.default_rng(seed)
+    history = len(log_factors)
+
+    if block_size <= 1:
+        indices = generator.integers(0, history, size=(paths, horizon))
+    else:
+        blocks = -(-horizon // block_size)
+        starts = generator.integers(0, history, size=(paths, blocks, 1))
+        indices = ((starts + np.arange(block_size)) % history).reshape(paths, -1)[:, :horizon]
+
+    cumulative = np.zeros((paths, horizon + 1))
+    np.cumsum(log_factors[indices], axis=1, out=cumulative[:, 1:])
+
+    return np.exp(-cumulative)
+
+
+def _simulate_task(task):
+    """Symuluje jedną porcję ścieżek (funkcja wykonywana w procesach puli)"""
+
+    log_factors, paths, horizon, seed, block_size = task
+    return simulate_paths(log_factors, paths, horizon, seed, block_size)
+
+
+@instrumented
+def simulate_savings(data, weights, money_amount, horizon, paths=100000, percentiles=(5, 50, 95), seed=0,
+                     block_size=1, workers=None):
+    """Symuluje realną wartość oszczędności i zwraca pasma percentyli
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    weights : dict, numpy.ndarray
+        wagi wydatków wyrażone w procentach
+    money_amount : float
+        kwota oszczędności
+    horizon : int
+        czas oszczędzania w miesiącach
+    paths : int
+        liczba symulowanych ścieżek
+    percentiles : tuple
+        percentyle wyznaczane dla każdego miesiąca
+    seed : int
+        ziarno główne generatora liczb losowych
+    block_size : int
+        liczba kolejnych miesięcy losowanych jako jeden blok
+    workers : int
+        liczba procesów (domyślnie liczba rdzeni procesora, 1 - obliczenia w bieżącym procesie)
+
+    Returns
+    -------
+    time_axis : numpy.ndarray
+        tablica z numerami kolejnych miesięcy (0 - horizon)
+    bands : numpy.ndarray
+        macierz (percentyle x (horizon + 1)) z realną wartością oszczędności
+    """
+
+    log_factors = monthly_log_factors(data, weights)
+
+    task_sizes = [PATHS_PER_TASK] * (paths // PATHS_PER_TASK)
+    if paths % PATHS_PER_TASK:
+        task_sizes.append(paths % PATHS_PER_TASK)
+    seeds = np.random.SeedSequence(seed).spawn(len(task_sizes))
+    tasks = [(log_factors, size, horizon, task_seed, block_size) for size, task_seed in zip(task_sizes, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        results = [_simulate_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_simulate_task, tasks))
+
+    bands = money_amount * np.percentile(np.concatenate(results), percentiles, axis=0)
+
+    return np.arange(horizon + 1), bands
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń, wykonuje symulację i tworzy wykres
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Symulacja Monte Carlo realnej wartości oszczędności.")
+    parser.add_argument('weights', help="plik .txt z wagami wydatków")
+    parser.add_argument('--amount', type=float, default=10000, help="kwota oszczędności")
+    parser.add_argument('--years', type=int, default=10, help="czas oszczędzania w latach")
+    parser.add_argument('--paths', type=int, default=100000, help="liczba symulowanych ścieżek")
+    parser.add_argument('--seed', type=int, default=0, help="ziarno generatora liczb losowych")
+    parser.add_argument('--block-size', type=int, default=1, help="długość losowanych bloków miesięcy")
+    parser.add_argument('--workers', type=int, help="liczba procesów (domyślnie liczba rdzeni procesora)")
+    parser.add_argument('--output', help="plik, do którego zapisywany jest wykres (domyślnie wykres jest "
+                                         "wyświetlany w oknie)")
+    parser.add_argument('--data', default="dane_inflacja.csv", help="plik .csv z danymi dotyczącymi inflacji")
+    args = parser.parse_args(argv)
+
+    try:
+        data = get_inflation_data(args.data)
+        time_axis, bands = simulate_savings(data, read_weights_file(args.weights), args.amount, args.years * 12,
+                                            args.paths, seed=args.seed, block_size=args.block_size,
+                                            workers=args.workers)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(f"Realna wartość {args.amount:.0f} zł po {args.years} latach (percentyle 5/50/95): "
+          f"{bands[0, -1]:.2f} / {bands[1, -1]:.2f} / {bands[2, -1]:.2f} zł")
+
+    if args.output:
+        import matplotlib
+        matplotlib.use('Agg')
+
+    import matplotlib.pyplot as plt
+    from show_savings_on_graph import draw_simulated_savings
+
+    figure = draw_simulated_savings(time_axis / 12, bands, (5, 50, 95), args.amount)
+    if args.output:
+        figure.savefig(args.output)
+    else:
+        plt.show()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
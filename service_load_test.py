@@ -0,0 +1,238 @@
+"""Skrypt generujący obciążenie lokalnej usługi HTTP (inflation_service.py) i mierzący czasy odpowiedzi
+
+Zapytania wysyłane są przez zadaną liczbę współbieżnych klientów (asyncio), z których każdy utrzymuje jedno
+połączenie (HTTP/1.1 keep-alive). Wagi generowane są losowo dla kategorii pobranych z usługi. Dla każdej ścieżki
+wypisywane są percentyle czasu odpowiedzi oraz przepustowość, a wyniki mogą zostać zapisane do pliku JSON.
+Przykład użycia (usługa musi być wcześniej uruchomiona):
+
+    python service_load_test.py --port 8080 --clients 32 --requests 2000 --endpoint series --profiles 100
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import numpy as np
+
+
+ENDPOINTS = ('month', 'series', 'category', 'savings')
+
+
+async def send_request(reader, writer, method, path, payload=None):
+    """Wysyła zapytanie w ramach otwartego połączenia i odczytuje odpowiedź
+
+    Parameters
+    ----------
+    reader : obiekt klasy asyncio.StreamReader
+        strumień, z którego odczytywana jest odpowiedź
+    writer : obiekt klasy asyncio.StreamWriter
+        strumień, do którego zapisywane jest zapytanie
+    method : str
+        metoda HTTP
+    path : str
+        ścieżka wraz z parametrami zapytania
+    payload : bytes
+        treść zapytania w formacie JSON
+
+    Returns
+    -------
+    status : int
+        kod odpowiedzi HTTP
+    content : bytes
+        treść odpowiedzi
+    """
+
+    payload = payload or b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(payload)}\r\n\r\n".encode('latin-1') + payload)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+
+    return status, await reader.readexactly(length)
+
+
+def build_requests(endpoint, categories, months, count, profiles=1, seed=0):
+    """Tworzy listę zapytań z losowymi wagami dla wybranej ścieżki
+
+    Parameters
+    ----------
+    endpoint : str
+        rodzaj zapytań - 'month', 'series', 'category' lub 'savings'
+    categories : list
+        lista z nazwami kategorii towarów i usług
+    months : list
+        lista dostępnych miesięcy zapisanych w postaci 'miesiąc.rok'
+    count : int
+        liczba zapytań
+    profiles : int
+        liczba zestawów wag w jednym zapytaniu 'series'
+    seed : int
+        ziarno generatora liczb losowych
+
+    Returns
+    -------
+    lista tupli z metodą HTTP, ścieżką oraz treścią zapytania
+    """
+
+    generator = np.random.default_rng(seed)
+
+    def random_weights():
+        weights = generator.multinomial(100, np.full(len(categories), 1 / len(categories))).tolist()
+        return dict(zip(categories, weights))
+
+    requests = []
+    for _ in range(count):
+        if endpoint == 'month':
+            month, year = months[generator.integers(len(months))].split('.')
+            payload = {'weights': random_weights(), 'month': month, 'year': year}
+            requests.append(('POST', '/own-inflation', payload))
+        elif endpoint == 'series':
+            payload = {'profiles': [random_weights() for _ in range(profiles)]}
+            requests.append(('POST', '/own-inflation/series', payload))
+        elif endpoint == 'category':
+            requests.append(('GET', f"/category-series?index={generator.integers(len(categories) + 1)}", None))
+        else:
+            payload = {'money_amount': 10000, 'inflation_rates': generator.uniform(0, 20, 10).tolist(),
+                       'savings_period': 30, 'compounding': 'monthly'}
+            requests.append(('POST', '/savings', payload))
+
+    return [(method, path, json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload else None)
+            for method, path, payload in requests]
+
+
+async def run_load(host, port, requests, clients):
+    """Wysyła zapytania przez współbieżnych klientów i mierzy czas odpowiedzi na każde z nich
+
+    Parameters
+    ----------
+    host : str
+        adres usługi
+    port : int
+        port usługi
+    requests : list
+        lista tupli z metodą HTTP, ścieżką oraz treścią zapytania
+    clients : int
+        liczba współbieżnych klientów (połączeń)
+
+    Returns
+    -------
+    latencies : list
+        lista czasów odpowiedzi w sekundach
+    errors : int
+        liczba odpowiedzi z kodem innym niż 200
+    elapsed : float
+        całkowity czas wysyłania zapytań w sekundach
+    """
+
+    queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while not queue.empty():
+                method, path, payload = queue.get_nowait()
+                start_time = time.perf_counter()
+                status, _ = await send_request(reader, writer, method, path, payload)
+                latencies.append(time.perf_counter() - start_time)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+
+    return latencies, errors, time.perf_counter() - start_time
+
+
+async def fetch_metadata(host, port):
+    """Pobiera z usługi listę kategorii oraz dostępnych miesięcy
+
+    Returns
+    -------
+    categories : list
+        lista z nazwami kategorii towarów i usług
+    months : list
+        lista dostępnych miesięcy zapisanych w postaci 'miesiąc.rok'
+    """
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, content = await send_request(reader, writer, 'GET', '/categories')
+    finally:
+        writer.close()
+
+    metadata = json.loads(content)
+    categories = [category['name'] for category in metadata['categories'][1:]]
+
+    return categories, metadata['months']
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń, generuje obciążenie usługi i wypisuje wyniki
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Test obciążeniowy lokalnej usługi HTTP.")
+    parser.add_argument('--host', default='127.0.0.1', help="adres usługi")
+    parser.add_argument('--port', type=int, default=8080, help="port usługi")
+    parser.add_argument('--endpoint', choices=ENDPOINTS, action='append',
+                        help="rodzaj zapytań (można podać wielokrotnie, domyślnie wszystkie)")
+    parser.add_argument('--clients', type=int, default=16, help="liczba współbieżnych klientów")
+    parser.add_argument('--requests', type=int, default=1000, help="liczba zapytań dla każdej ścieżki")
+    parser.add_argument('--profiles', type=int, default=1, help="liczba zestawów wag w zapytaniu 'series'")
+    parser.add_argument('--seed', type=int, default=0, help="ziarno generatora liczb losowych")
+    parser.add_argument('--output', help="plik JSON, do którego zapisywane są wyniki")
+    args = parser.parse_args(argv)
+
+    try:
+        categories, months = asyncio.run(fetch_metadata(args.host, args.port))
+    except OSError as error:
+        print(f"Nie można połączyć się z usługą: {error}", file=sys.stderr)
+        return 1
+
+    results = {}
+    print(f"{'ścieżka':<12}{'p50 [ms]':>12}{'p90 [ms]':>12}{'p99 [ms]':>12}{'zapytania/s':>14}{'błędy':>8}")
+    for endpoint in args.endpoint or ENDPOINTS:
+        requests = build_requests(endpoint, categories, months, args.requests, args.profiles, args.seed)
+        latencies, errors, elapsed = asyncio.run(run_load(args.host, args.port, requests, args.clients))
+
+        p50, p90, p99 = np.percentile(np.array(latencies) * 1000, [50, 90, 99]).tolist()
+        results[endpoint] = {'requests': len(latencies), 'errors': errors, 'p50_ms': p50, 'p90_ms': p90,
+                             'p99_ms': p99, 'throughput_per_s': len(latencies) / elapsed}
+        print(f"{endpoint:<12}{p50:>12.3f}{p90:>12.3f}{p99:>12.3f}{len(latencies) / elapsed:>14.1f}{errors:>8}")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'parameters': vars(args), 'results': results}, file, indent=2)
+        print(f"\nWyniki zapisano w pliku {args.output}.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
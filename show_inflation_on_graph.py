@@ -3,15 +3,223 @@ inflacji oraz wykresu z przebiegiem inflacji w wybranej kategorii towarów i us
 
 Moduł importuje klasy wspomagające działanie klasy ShowInflationOnGraph, które umożliwiają:
 - klasa GetUserWeights - podanie przez użytkownika własnych 'wag' w poszczególnych kateogriach towarów i usług;
-- klasa InflationData - odczytywanie danych dotyczących inflacji zapisanych w pliku .csv.
+- funkcja get_inflation_data - dostęp do współdzielonych danych dotyczących inflacji zapisanych w pliku .csv;
+- klasa OwnInflationEngine - obliczenie 'własnej' inflacji na podstawie podanych wag;
+- funkcja get_own_inflation_cache - dostęp do współdzielonej pamięci podręcznej wyników 'własnej' inflacji;
+- funkcja rolling_statistics - obliczenie statystyk kroczących inflacji w kategoriach towarów i usług;
+- funkcja get_index_transformer - przedstawienie inflacji w różnych ujęciach (rok do roku, miesiąc do miesiąca,
+  od początku roku oraz względem miesiąca bazowego);
+- funkcja decompose_own_inflation - rozkład 'własnej' inflacji na wkłady poszczególnych kategorii;
+- funkcje load_and_stack i compare_own_inflation - porównanie inflacji w wielu zarejestrowanych zbiorach danych.
 
 W celu stworzenia wykresów wykorzystywana jest biblioteka matplotlib.
+Funkcje draw_gus_and_own_inflation, draw_category_inflation, draw_own_inflation_contributions oraz
+draw_dataset_comparison tworzą wykresy bez ich wyświetlania, dzięki czemu wykorzystywane są również do zapisywania
+wykresów do plików (skrypt render_charts.py).
 """
 
-from inflation_data import InflationData
+from contribution_decomposition import decompose_own_inflation
+from dataset_comparison import compare_own_inflation, load_and_stack
+from dataset_registry import get_inflation_data, get_registry
 from exceptions import UnavailableChoice
 from get_user_weights import GetUserWeights
+from index_transformation import BASES, ESTIMATED_BASES, get_index_transformer, has_consecutive_months
+from instrumentation import instrumented
+from own_inflation_cache import get_own_inflation_cache
+from own_inflation_engine import OwnInflationEngine
+from rolling_statistics import rolling_statistics
 import matplotlib.pyplot as plt
+import numpy as np
+
+
+@instrumented
+def draw_gus_and_own_inflation(gus_inflation, own_inflation, basis='yoy'):
+    """Tworzy wykres z przebiegiem inflacji według wag GUS i według 'własnych' wag
+
+    Parameters
+    ----------
+    gus_inflation : dict
+        słownik którego kluczami są tuple z miesiącem i rokiem, a wartościami inflacja według wag gus w procentach
+    own_inflation : dict
+        słownik którego kluczami są tuple z miesiącem i rokiem, a wartościami inflacja według 'własnych' wag
+        w procentach
+    basis : str
+        ujęcie, w którym podano inflację - 'yoy', 'mom', 'ytd' lub 'base'
+
+    Returns
+    -------
+    figure : matplotlib.figure.Figure
+        utworzony wykres
+    """
+
+    gus_data = list(gus_inflation.values())
+    own_data = list(own_inflation.values())
+    x_axis = [month + '.' + year for month, year in gus_inflation.keys()]
+    figure = plt.figure(figsize=(12, 6))
+    plt.plot(x_axis, gus_data, color='red', label='inflacja GUS')
+    plt.plot(x_axis, own_data, color='green', label='inflacja "własna"')
+    plt.xlabel('miesiąc')
+    plt.ylabel(f"dynamika inflacji {BASES[basis]}{' - szacunek' if basis in ESTIMATED_BASES else ''} [%]")
+    plt.legend()
+
+    return figure
+
+
+@instrumented
+def draw_category_inflation(data, index, window=None, basis='yoy', base=None):
+    """Tworzy wykres z przebiegiem inflacji w określonej kategorii towarów i usług
+
+    Jeśli podano długość okna, na wykres nakładane są statystyki kroczące: średnia, pasmo średnia ± odchylenie
+    standardowe oraz minimum i maksimum w oknie. Statystyki obliczane są od pierwszego miesiąca, dla którego
+    dostępna jest wartość w wybranym ujęciu.
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    index : int
+        indeks odpowiadający określonej kategorii towrów i usług w pliku z danymi
+    window : int
+        liczba miesięcy w oknie statystyk kroczących (domyślnie statystyki nie są pokazywane)
+    basis : str
+        ujęcie - 'yoy' (rok do roku), 'mom' (miesiąc do miesiąca), 'ytd' (od początku roku) lub 'base'
+        (względem miesiąca bazowego)
+    base : tuple
+        tupla z miesiącem i rokiem miesiąca bazowego (tylko dla ujęcia 'base')
+
+    Returns
+    -------
+    figure : matplotlib.figure.Figure
+        utworzony wykres
+    """
+
+    category_data = get_index_transformer(data).view(basis, base, percent=True)[:, index]
+    x_axis = [month + '.' + year for month, year in data.get_available_months()]
+    label = data.get_headers()[index+2]
+    figure = plt.figure(figsize=[12, 6])
+    plt.plot(x_axis, category_data, color='green', label=label)
+    first = int(np.argmax(~np.isnan(category_data)))
+    if window and len(category_data) - first >= window and not np.isnan(category_data[first]):
+        statistics = rolling_statistics(category_data[first:], window)
+        window_axis = x_axis[first + window - 1:]
+        plt.plot(window_axis, statistics['mean'], color='blue', label=f'średnia krocząca ({window} mies.)')
+        plt.fill_between(window_axis, statistics['mean'] - statistics['std'], statistics['mean'] + statistics['std'],
+                         color='blue', alpha=0.15, label='średnia ± odchylenie standardowe')
+        plt.plot(window_axis, statistics['min'], color='gray', linestyle='--', label='minimum i maksimum w oknie')
+        plt.plot(window_axis, statistics['max'], color='gray', linestyle='--')
+    plt.xlabel('miesiąc')
+    plt.ylabel(f"dynamika inflacji {BASES[basis]}{' - szacunek' if basis in ESTIMATED_BASES else ''} [%]")
+    plt.legend()
+
+    return figure
+
+
+def _stacked_bars(axes, x_axis, contributions, labels):
+    """Rysuje skumulowane słupki, osobno dla wkładów dodatnich i ujemnych
+
+    Parameters
+    ----------
+    axes : matplotlib.axes.Axes
+        wykres, na którym rysowane są słupki
+    x_axis : list
+        lista z opisami kolejnych miesięcy
+    contributions : numpy.ndarray
+        macierz (miesiące x kategorie) z wkładami kategorii
+    labels : list
+        lista z nazwami kategorii
+    """
+
+    positive = np.clip(contributions, 0, None)
+    negative = np.clip(contributions, None, 0)
+    positive_bottom = np.cumsum(positive, axis=1) - positive
+    negative_bottom = np.cumsum(negative, axis=1) - negative
+    colors = plt.get_cmap('tab20')(np.arange(len(labels)) % 20)
+
+    for column, label in enumerate(labels):
+        axes.bar(x_axis, positive[:, column], bottom=positive_bottom[:, column], color=colors[column], label=label)
+        axes.bar(x_axis, negative[:, column], bottom=negative_bottom[:, column], color=colors[column])
+
+
+@instrumented
+def draw_own_inflation_contributions(data, contributions):
+    """Tworzy wykres z wkładami poszczególnych kategorii w 'własną' inflację oraz w jej różnicę względem inflacji GUS
+
+    Parameters
+    ----------
+    data : obiekt klasy InflationData
+        dane dotyczące inflacji
+    contributions : dict
+        słownik z wkładami kategorii zwrócony przez funkcję decompose_own_inflation dla jednego zestawu wag
+
+    Returns
+    -------
+    figure : matplotlib.figure.Figure
+        utworzony wykres
+    """
+
+    x_axis = [month + '.' + year for month, year in data.get_available_months()]
+    labels = data.get_categories()
+    own = contributions['own']
+    difference = contributions['difference']
+
+    figure, (own_axes, difference_axes) = plt.subplots(2, 1, figsize=(12, 9), sharex=True)
+
+    _stacked_bars(own_axes, x_axis, own, labels)
+    own_axes.plot(x_axis, own.sum(axis=1), color='black', marker='o', label='inflacja "własna"')
+    own_axes.plot(x_axis, get_index_transformer(data).view(percent=True)[:, 0], color='red', marker='o',
+                  label='inflacja GUS')
+    own_axes.set_ylabel('wkład w inflację "własną" [p.p.]')
+
+    _stacked_bars(difference_axes, x_axis, difference, labels)
+    difference_axes.plot(x_axis, difference.sum(axis=1), color='black', marker='o',
+                         label='różnica inflacji "własnej" i GUS')
+    difference_axes.axhline(0, color='gray', linewidth=0.8)
+    difference_axes.set_ylabel('wkład w różnicę względem inflacji GUS [p.p.]')
+    difference_axes.set_xlabel('miesiąc')
+    difference_axes.tick_params(axis='x', labelrotation=45)
+
+    own_axes.legend(loc='upper left', bbox_to_anchor=(1.01, 1), fontsize='small')
+    difference_axes.legend(handles=difference_axes.get_lines()[:1], loc='upper left', bbox_to_anchor=(1.01, 1),
+                           fontsize='small')
+    figure.tight_layout()
+
+    return figure
+
+
+@instrumented
+def draw_dataset_comparison(names, months, gus_inflation, own_inflation=None):
+    """Tworzy wykres z przebiegiem inflacji w wielu zbiorach danych
+
+    Parameters
+    ----------
+    names : list
+        lista nazw zbiorów danych
+    months : list
+        lista tupli z miesiącem i rokiem wspólnych dla wszystkich zbiorów danych
+    gus_inflation : numpy.ndarray
+        macierz (zbiory danych x miesiące) z inflacją według wag GUS
+    own_inflation : numpy.ndarray
+        macierz (zbiory danych x miesiące) z inflacją według 'własnych' wag (domyślnie nie jest pokazywana)
+
+    Returns
+    -------
+    figure : matplotlib.figure.Figure
+        utworzony wykres
+    """
+
+    x_axis = [month + '.' + year for month, year in months]
+    colors = plt.get_cmap('tab10')(np.arange(len(names)) % 10)
+    figure = plt.figure(figsize=(12, 6))
+    for position, name in enumerate(names):
+        plt.plot(x_axis, gus_inflation[position] - 100, color=colors[position], label=f'{name} - inflacja GUS')
+        if own_inflation is not None:
+            plt.plot(x_axis, own_inflation[position] - 100, color=colors[position], linestyle='--',
+                     label=f'{name} - inflacja "własna"')
+    plt.xlabel('miesiąc')
+    plt.ylabel('dynamika inflacji rok do roku [%]')
+    plt.legend()
+
+    return figure
 
 
 class ShowInflationOnGraph:
@@ -28,6 +236,13 @@ class ShowInflationOnGraph:
         słownik przechowujący wagi podane przez użytkownika
     data : obiekt klasy InflationData
         obiekt umożliwiajacy wykonywanie operacji na danych dotyczących inflacji
+    engine : obiekt klasy OwnInflationEngine
+        obiekt obliczający 'własną' inflację na podstawie podanych wag
+    cache : obiekt klasy OwnInflationCache
+        współdzielona pamięć podręczna wyników 'własnej' inflacji
+    transformer : obiekt klasy IndexTransformer
+        obiekt przedstawiający inflację w różnych ujęciach (rok do roku, miesiąc do miesiąca, od początku roku,
+        względem miesiąca bazowego)
 
     Methods
     ----------
@@ -37,19 +252,36 @@ class ShowInflationOnGraph:
         odczytuje i waliduje wybór użytkownika
     operation()
         zapewnia działanie opcji wybranej przez użytkownika
+    choose_basis()
+        odczytuje i waliduje wybór ujęcia, w którym inflacja ma zostać pokazana na wykresie
     gus_and_own_inflation()
         tworzy wykres z przebiegem inflacji według wag GUS oraz według własnych wag
     category_inflation()
-        tworzy wykres z przebiegiem inflacji we wskazaenej kategorii towarów i usług
+        tworzy wykres z przebiegiem inflacji we wskazaenej kategorii towarów i usług, opcjonalnie ze statystykami
+        kroczącymi
+    own_inflation_contributions()
+        tworzy wykres z wkładami poszczególnych kategorii towarów i usług w 'własną' inflację
+    dataset_comparison()
+        tworzy wykres porównujący inflację we wszystkich zarejestrowanych zbiorach danych
     """
 
-    def __init__(self):
-        """Odpowiada za działanie komponentu programu w pętli while"""
+    def __init__(self, dataset=None):
+        """Odpowiada za działanie komponentu programu w pętli while
+
+        Parameters
+        ----------
+        dataset : str
+            nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv (domyślnie 'dane_inflacja.csv')
+        """
 
         self.user_choice = None
-        self.available_choices = [0, 1, 2]
+        self.available_choices = [0, 1, 2, 3, 4]
         self.user_expenses_weights = {}
-        self.data = InflationData()
+        self.dataset = dataset
+        self.data = get_inflation_data(dataset)
+        self.engine = OwnInflationEngine(self.data)
+        self.cache = get_own_inflation_cache()
+        self.transformer = get_index_transformer(self.data)
 
         while True:
             self.print_menu()
@@ -67,7 +299,9 @@ class ShowInflationOnGraph:
         print(f"""Oto lista możliwych operacji:
         0. Wróć do menu głównego programu,
         1. Pokaż na wykresie przebieg inflacji na podstawie wag GUS oraz na podstawie własnych wag,
-        2. Pokaż na wykresie przebieg inflacji w poszczególnych kategoriach towarów i usług.""")
+        2. Pokaż na wykresie przebieg inflacji w poszczególnych kategoriach towarów i usług,
+        3. Pokaż na wykresie, jak poszczególne kategorie towarów i usług wpływają na 'własną' inflację,
+        4. Porównaj na wykresie inflację we wszystkich zarejestrowanych zbiorach danych (np. regionach).""")
 
     def validate_input(self):
         """Odczytuje wybór użytkownika
@@ -112,27 +346,87 @@ class ShowInflationOnGraph:
             self.gus_and_own_inflation()
         elif self.user_choice == 2:
             self.category_inflation()
+        elif self.user_choice == 3:
+            self.own_inflation_contributions()
+        elif self.user_choice == 4:
+            self.dataset_comparison()
+
+    def choose_basis(self):
+        """Odczytuje i waliduje wybór ujęcia, w którym inflacja ma zostać pokazana na wykresie
+
+        Jeśli w danych brakuje niektórych miesięcy, bez pytania zwracane jest ujęcie rok do roku (jedyne dostępne)
+
+        Returns
+        -------
+        basis : str
+            ujęcie - 'yoy', 'mom', 'ytd' lub 'base'
+        base : tuple
+            tupla z miesiącem i rokiem miesiąca bazowego (None dla pozostałych ujęć)
+
+        Raises
+        -------
+        ValueError
+            Jeśli podanej przez użytkownika wartości nie można zamienić na liczbę całkowitą
+        """
+
+        print()
+        if not has_consecutive_months(self.data.period_keys):
+            print("W danych brakuje niektórych miesięcy, więc inflacja zostanie pokazana tylko rok do roku.")
+            return 'yoy', None
+
+        print("Wybierz ujęcie, w którym inflacja ma zostać pokazana na wykresie:")
+        for number, description in enumerate(BASES.values(), 1):
+            print(f"{number} - {description}")
+
+        while True:
+            try:
+                number = int(input("Podaj odpowiednią liczbę: "))
+                if 1 <= number <= len(BASES):
+                    break
+                print(f"Podana liczba musi być z zakresu 1-{len(BASES)}!")
+            except ValueError:
+                print("Możesz wpisać tylko liczbę całkowitą!")
+
+        basis = list(BASES)[number - 1]
+        if basis != 'base':
+            return basis, None
+
+        while True:
+            month, _, year = input(f"Podaj miesiąc bazowy z okresu {self.data.get_data_time_range()} w formacie"
+                                   f" 'V.2021': ").partition('.')
+            base = (month.strip().upper(), year.strip())
+            if self.data.has_month(*base):
+                return basis, base
+            print("Brak danych dla podanego miesiąca!")
 
     def gus_and_own_inflation(self):
         """Tworzy wykres z przebiegiem inflacji według wag GUS oraz według wag podanych przez użytkownika"""
 
-        def calculate_own_inflation():
+        def calculate_own_inflation(basis, base):
             """Liczy 'własną' inflację dla wszystkich miesięcy, dla których dostępne są dane
 
+            Parameters
+            ----------
+            basis : str
+                ujęcie, w którym obliczana jest inflacja
+            base : tuple
+                tupla z miesiącem i rokiem miesiąca bazowego (tylko dla ujęcia 'base')
+
             Returns
             -------
             own_inflation_dict : dict
-                słownik którego kluczami są tuple z miesiącem i rokiem, a wartościami obliczona inflacja
+                słownik którego kluczami są tuple z miesiącem i rokiem, a wartościami obliczona inflacja w procentach
             """
-            own_inflation_dict = {}
-            for month_data in self.data.inflation_data[1:]:
-                inflation = sum([weight/100 * float(category_inflation) for weight, category_inflation in
-                                 zip(self.user_expenses_weights.values(), month_data[3:])])
-                own_inflation_dict[(month_data[0], month_data[1])] = round(inflation, 1)
+            weights = self.engine.weights_to_vector(self.user_expenses_weights)
+            inflation = self.transformer.transform(self.cache.calculate(self.data, weights), basis, base,
+                                                   percent=True)
+
+            own_inflation_dict = {month: round(value, 1) for month, value
+                                  in zip(self.data.get_available_months(), inflation.tolist())}
 
             return own_inflation_dict
 
-        def show_graph(gus_inflation, own_inflation):
+        def show_graph(gus_inflation, own_inflation, basis):
             """Tworzy i wyświetla wykres z przebiegiem inflacji według wag GUS i według 'własnych' wag
 
             Parameters
@@ -142,28 +436,22 @@ class ShowInflationOnGraph:
             ----------
             own_inflation : dict
                 słownik którego kluczami są tuple z miesiącem i rokiem, a wartościami inflacja według 'własnych' wag
+            basis : str
+                ujęcie, w którym podano inflację
             """
-            gus_data = list(gus_inflation.values())
-            gus_data = [data-100 for data in gus_data]
-            own_data = list(own_inflation.values())
-            own_data = [data-100 for data in own_data]
-            x_axis = [month + '.' + year for month, year in gus_inflation.keys()]
-            plt.figure(figsize=(12, 6))
-            plt.plot(x_axis, gus_data, color='red', label='inflacja GUS')
-            plt.plot(x_axis, own_data, color='green', label='inflacja "własna"')
-            plt.xlabel('miesiąc')
-            plt.ylabel('dynamika inflacji rok do roku [%]')
-            plt.legend()
+            draw_gus_and_own_inflation(gus_inflation, own_inflation, basis)
             plt.show()
 
-        instance = GetUserWeights()
+        instance = GetUserWeights(self.dataset)
         self.user_expenses_weights = instance.user_expenses_weights
-        own_infl = calculate_own_inflation()
-        gus_infl = self.data.get_category_inflation(0)
+        basis, base = self.choose_basis()
+        own_infl = calculate_own_inflation(basis, base)
+        gus_infl = dict(zip(self.data.get_available_months(),
+                            self.transformer.view(basis, base, percent=True)[:, 0].tolist()))
 
         print()
         print("Za chwilę wyświetlone zostanie okno z wykresem. Aby kontynuować działanie programu zamknij okno.")
-        show_graph(gus_infl, own_infl)
+        show_graph(gus_infl, own_infl, basis)
         print()
         print('*' * 80)
 
@@ -193,30 +481,49 @@ class ShowInflationOnGraph:
                 try:
                     user_index = int(input("Podaj odpowiednią liczbę lub wpisz '0', aby powrócić do poprzedniego"
                                            " menu: "))
-                    if user_index in list(range(0, 13)):
+                    if user_index in self.data.data_field_map:
                         return user_index
                     else:
-                        print("Podana liczba musi być z zakresu 1-12!")
+                        print(f"Podana liczba musi być z zakresu 1-{len(self.data.data_field_map) - 1}!")
+                except ValueError:
+                    print("Możesz wpisać tylko liczbę całkowitą!")
+
+        def choose_window():
+            """Odczytuje i waliduje długość okna statystyk kroczących
+
+            Returns
+            -------
+            window : int
+                liczba miesięcy w oknie lub 0, jeśli statystyki kroczące nie mają być pokazane
+            """
+
+            months = len(self.data.get_available_months())
+            while True:
+                try:
+                    window = int(input("Podaj liczbę miesięcy w oknie średniej kroczącej lub wpisz '0', aby jej nie"
+                                       " pokazywać: "))
+                    if 0 <= window <= months:
+                        return window
+                    else:
+                        print(f"Podana liczba musi być z zakresu 0-{months}!")
                 except ValueError:
                     print("Możesz wpisać tylko liczbę całkowitą!")
 
-        def show_graph(index):
+        def show_graph(index, window, basis, base):
             """Tworzy i wyświetla wykres z przebiegiem inflacji w określonej kategorii towarów i usług
 
             Parameters
             ----------
             index : int
                 indeks odpowiadający określonej kategorii towrów i usług w pliku z danymi
+            window : int
+                liczba miesięcy w oknie statystyk kroczących (0 - bez statystyk)
+            basis : str
+                ujęcie, w którym pokazywana jest inflacja
+            base : tuple
+                tupla z miesiącem i rokiem miesiąca bazowego (tylko dla ujęcia 'base')
             """
-            category_inflation = self.data.get_category_inflation(index)
-            category_data = [inflation-100 for inflation in list(category_inflation.values())]
-            x_axis = [month + '.' + year for month, year in category_inflation.keys()]
-            label = self.data.get_headers()[index+2]
-            plt.figure(figsize=[12, 6])
-            plt.plot(x_axis, category_data, color='green', label=label)
-            plt.xlabel('miesiąc')
-            plt.ylabel('dynamika inflacji rok do roku [%]')
-            plt.legend()
+            draw_category_inflation(self.data, index, window, basis, base)
             plt.show()
 
         print('*' * 80)
@@ -227,7 +534,58 @@ class ShowInflationOnGraph:
                 print('*' * 80)
                 break
             else:
+                window = choose_window()
+                basis, base = self.choose_basis()
                 print()
                 print("Za chwilę wyświetlone zostanie okno z wykresem. Aby kontynuować działanie programu zamknij okno")
-                show_graph(category_index)
+                show_graph(category_index, window, basis, base)
                 print('*' * 80)
+
+    def own_inflation_contributions(self):
+        """Tworzy wykres z wkładami poszczególnych kategorii towarów i usług w 'własną' inflację oraz w jej różnicę
+        względem inflacji GUS"""
+
+        instance = GetUserWeights(self.dataset)
+        self.user_expenses_weights = instance.user_expenses_weights
+        contributions = decompose_own_inflation(self.data, self.user_expenses_weights)
+
+        print()
+        print("Za chwilę wyświetlone zostanie okno z wykresem. Aby kontynuować działanie programu zamknij okno.")
+        draw_own_inflation_contributions(self.data, contributions)
+        plt.show()
+        print()
+        print('*' * 80)
+
+    def dataset_comparison(self):
+        """Tworzy wykres porównujący inflację według wag GUS oraz według wag podanych przez użytkownika we wszystkich
+        zarejestrowanych zbiorach danych"""
+
+        names = get_registry().names()
+        if len(names) < 2:
+            print()
+            print("Do porównania potrzebne są co najmniej dwa zbiory danych zarejestrowane w pliku "
+                  "'zbiory_danych.txt'.")
+            print('*' * 80)
+            return
+
+        try:
+            names, months, stacked = load_and_stack(names)
+            if get_registry().get(names[0]).get_headers() != self.data.get_headers():
+                raise ValueError(f"Kategorie w zbiorze danych {names[0]} różnią się od kategorii w bieżącym zbiorze "
+                                 f"danych!")
+        except (OSError, ValueError) as error:
+            print()
+            print(error)
+            print('*' * 80)
+            return
+
+        instance = GetUserWeights(self.dataset)
+        self.user_expenses_weights = instance.user_expenses_weights
+        own_inflation = compare_own_inflation(stacked, self.engine.weights_to_vector(self.user_expenses_weights))
+
+        print()
+        print("Za chwilę wyświetlone zostanie okno z wykresem. Aby kontynuować działanie programu zamknij okno.")
+        draw_dataset_comparison(names, months, stacked[:, :, 0], own_inflation)
+        plt.show()
+        print()
+        print('*' * 80)
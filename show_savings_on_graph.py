@@ -1,12 +1,61 @@
 """Moduł zawierający definicję klasy ShowSavingsOnGraph odpowiadającej za stworzenie wykresu przedstawiającego spadek
 realnej wartości oszczędności z powodu inflacji
 
-W celu stworzenia wykresu wykorzystywane są biblioteki: matplotlib oraz numpy.
+W celu stworzenia wykresu wykorzystywana jest biblioteka matplotlib, a wartości oszczędności obliczane są
+przez funkcję calculate_real_savings z modułu savings_engine (dla stałych wartości inflacji podanych przez
+użytkownika) lub przez funkcję simulate_savings z modułu savings_simulation (symulacja Monte Carlo na podstawie
+historycznej inflacji dla wag podanych w klasie GetUserWeights).
+Funkcja draw_simulated_savings tworzy wykres z wynikami symulacji z modułu savings_simulation.
 """
 
+from dataset_registry import get_inflation_data
 from exceptions import NegativeNumber
+from get_user_weights import GetUserWeights
+from instrumentation import instrumented
+from savings_engine import calculate_real_savings
+from savings_simulation import simulate_savings
 import matplotlib.pyplot as plt
-import numpy as np
+
+
+COMPOUNDING = {'roczna': 'annual', 'miesięczna': 'monthly'}
+COMPOUNDING_NAMES = {value: key for key, value in COMPOUNDING.items()}
+
+SIMULATED_PERCENTILES = (5, 50, 95)
+
+
+@instrumented
+def draw_simulated_savings(time_axis, bands, percentiles, money_amount):
+    """Tworzy wykres z pasmami percentyli realnej wartości oszczędności uzyskanymi z symulacji Monte Carlo
+
+    Parameters
+    ----------
+    time_axis : numpy.ndarray
+        tablica z czasem oszczędzania w latach
+    bands : numpy.ndarray
+        macierz (percentyle x kroki czasowe) z realną wartością oszczędności
+    percentiles : tuple
+        percentyle odpowiadające kolejnym wierszom macierzy 'bands' (w kolejności rosnącej)
+    money_amount : float
+        początkowa kwota oszczędności
+
+    Returns
+    -------
+    figure : matplotlib.figure.Figure
+        utworzony wykres
+    """
+
+    figure = plt.figure(figsize=[12, 6])
+    plt.fill_between(time_axis, bands[0], bands[-1], color='green', alpha=0.2,
+                     label=f"percentyle {percentiles[0]}-{percentiles[-1]}")
+    for percentile, band in zip(percentiles[1:-1], bands[1:-1]):
+        plt.plot(time_axis, band, color='green', label=f"percentyl {percentile}")
+    plt.grid()
+    plt.xlabel('czas oszczędzania w latach')
+    plt.ylabel('realna wartość oszczędności')
+    plt.title(f"Symulowana realna wartość {money_amount:.0f} zł oszczędności na podstawie historycznej inflacji")
+    plt.legend()
+
+    return figure
 
 
 class ShowSavingsOnGraph:
@@ -16,46 +65,90 @@ class ShowSavingsOnGraph:
 
     Attributes
     ----------
+    dataset : str
+        nazwa zbioru danych lub ścieżka do pliku .csv, na podstawie którego wykonywana jest symulacja
+    simulation : bool
+        określa, czy wykres przedstawia symulację na podstawie historycznej inflacji zamiast stałych wartości inflacji
     inflation : list
         lista przechowująca wartości inflacji podane przez użytkownika
+    user_expenses_weights : dict
+        słownik przechowujący wagi podane przez użytkownika (tylko dla symulacji)
     money_amount : int
         kwota oszczędności wyrażona jako liczba całkowita
     savings_period : int
         czas oszczędzania w latach
+    compounding : str
+        sposób kapitalizacji - 'annual' (roczna) lub 'monthly' (miesięczna)
 
     Methods
     ----------
     print_info()
         wyświetla informację dotyczącą właściwości tworzonego wykresu
+    choose_mode()
+        odczytuje wybór między stałymi wartościami inflacji a symulacją na podstawie historycznej inflacji
     get_parameters()
         odczytuje i waliduje podane przez użytkownika parametry dotyczące tworzonego wykresu
     show_graph()
         tworzy i wyświetla wykres
+    show_simulation()
+        wykonuje symulację na podstawie historycznej inflacji, a następnie tworzy i wyświetla wykres
     """
 
-    def __init__(self):
-        """Odpowiada za działanie komponentu programu"""
+    def __init__(self, dataset=None):
+        """Odpowiada za działanie komponentu programu
+
+        Parameters
+        ----------
+        dataset : str
+            nazwa zarejestrowanego zbioru danych lub ścieżka do pliku .csv (domyślnie 'dane_inflacja.csv')
+        """
 
+        self.dataset = dataset
+        self.simulation = False
         self.inflation = []
+        self.user_expenses_weights = {}
         self.money_amount = None
         self.savings_period = None
+        self.compounding = None
 
         self.print_info()
+        self.choose_mode()
         self.get_parameters()
-        self.show_graph()
+        if self.simulation:
+            self.show_simulation()
+        else:
+            self.show_graph()
 
     @staticmethod
     def print_info():
         """Wyświetla informację dotyczącą właściwości tworzonego wykresu"""
 
         print("\nTworzony wykres przedstwia spadek wartości oszczędności w czasie przy założonej dynamice inflacji\n"
-              "oraz przy założonej kwocie oszczędności. Konieczne będzie zatem podanie tych dwóch parametrów oraz\n"
-              "czasu (liczonego w latach) jaki ma obejmować wykres.")
+              "oraz przy założonej kwocie oszczędności. Konieczne będzie zatem podanie tych dwóch parametrów,\n"
+              "czasu (liczonego w latach) jaki ma obejmować wykres oraz sposobu kapitalizacji (rocznej lub\n"
+              "miesięcznej).\n"
+              "Zamiast stałej inflacji możesz wybrać symulację, w której inflacja w kolejnych miesiącach\n"
+              "losowana jest z historii danych GUS dla wag twoich wydatków - wykres przedstawia wtedy\n"
+              "percentyle 5/50/95 realnej wartości oszczędności.")
+
+    def choose_mode(self):
+        """Odczytuje wybór między stałymi wartościami inflacji a symulacją na podstawie historycznej inflacji"""
+
+        print()
+        while True:
+            user_choice = input("Czy chcesz wykonać symulację na podstawie historycznej inflacji? "
+                                "Wpisz 'tak' lub 'nie': ")
+            if user_choice in ('tak', 'nie'):
+                self.simulation = user_choice == 'tak'
+                break
+            else:
+                print("Możesz wpisać tylko 'tak' lub 'nie'!")
 
     def get_parameters(self):
         """Odczytuje i waliduje podane przez użytkownika parametry dotyczące tworzonego wykresu
 
-        Po zwalidowaniu parametrów przypisuje je do odpowiednich atrybutów instancji
+        Po zwalidowaniu parametrów przypisuje je do odpowiednich atrybutów instancji. W przypadku symulacji
+        zamiast wartości inflacji i sposobu kapitalizacji odczytywane są wagi wydatków (klasa GetUserWeights).
 
         Raises
         ----------
@@ -65,8 +158,11 @@ class ShowSavingsOnGraph:
             Jeśli podana liczba jest mniejsza lub równa 0
         """
 
+        if self.simulation:
+            self.user_expenses_weights = GetUserWeights(self.dataset).user_expenses_weights
+
         print()
-        while True:
+        while not self.simulation:
             try:
                 inflation = float(input("Podaj wartość inflacji rok do roku wyrażoną w procentach: "))
                 self.inflation.append(inflation)
@@ -112,42 +208,59 @@ class ShowSavingsOnGraph:
             except NegativeNumber:
                 print("Podana liczba musi być większa od 0!")
 
+        if self.simulation:
+            return
+
+        print()
+        while True:
+            user_choice = input("Podaj sposób kapitalizacji. Wpisz 'roczna' lub 'miesięczna': ")
+            if user_choice in COMPOUNDING:
+                self.compounding = COMPOUNDING[user_choice]
+                break
+            else:
+                print("Możesz wpisać tylko 'roczna' lub 'miesięczna'!")
+
+    @instrumented
     def show_graph(self):
         """Odpowiada za stworzenie i wyświetlenie wykresu"""
 
         print("\nZa chwilę wyświetlone zostanie okno z wykresem, aby kontynuować działanie programu zamknij okno.")
 
-        x_axis = np.linspace(0, self.savings_period, self.savings_period + 1)
-
-        def calculate_savings_value(x, inflation):
-            """Odpowiada za obliczenie wartości oszczędności w czasie przy określonej wartości inflacji
-
-            Parameters
-            ----------
-            x : int
-                odzwierciedla kolejne lata z danego okresu oszczędzania
-            inflation : float
-                wartość inflacji rok do roku wyrażona w procentach
-            Returns
-            ----------
-            realna wartość oszczędności po x latach oszczędzania przy inflacji równej parametrowi inflation
-            """
-
-            return self.money_amount * (1 - inflation/100) ** x
+        x_axis, savings_values = calculate_real_savings(self.money_amount, self.inflation, self.savings_period,
+                                                        self.compounding)
+        marker = 'o' if self.compounding == 'annual' else None
 
         plt.figure(figsize=[12, 6])
 
-        for inflation in self.inflation:
-            y_axis = np.array([calculate_savings_value(x, inflation) for x in x_axis])
+        for inflation, y_axis in zip(self.inflation, savings_values):
+            plt.plot(x_axis, y_axis, marker=marker, label=f"{inflation}%")
 
-            plt.plot(x_axis, y_axis, marker='o', label=f"{inflation}%")
-
-        default_x_ticks = range(len(x_axis))
-        plt.xticks(default_x_ticks, [int(x) for x in x_axis])
+        plt.xticks(range(self.savings_period + 1))
         plt.grid()
         plt.xlabel('czas oszczędzania w latach')
         plt.ylabel('wartość początkowej kwoty oszczędności po x latach oszczędzania')
         plt.title(f"Realna wartość {self.money_amount} zł oszczędności w czasie {self.savings_period} lat oszczędzania"
-                  f"\nprzy określonej wartości inflacji")
+                  f"\nprzy określonej wartości inflacji (kapitalizacja {COMPOUNDING_NAMES[self.compounding]})")
         plt.legend(title='Wartość inflacji')
         plt.show()
+
+    @instrumented
+    def show_simulation(self):
+        """Odpowiada za wykonanie symulacji na podstawie historycznej inflacji oraz stworzenie i wyświetlenie wykresu"""
+
+        print("\nTrwa symulacja realnej wartości oszczędności na podstawie historycznej inflacji.")
+
+        try:
+            time_axis, bands = simulate_savings(get_inflation_data(self.dataset), self.user_expenses_weights,
+                                                self.money_amount, self.savings_period * 12,
+                                                percentiles=SIMULATED_PERCENTILES)
+        except ValueError as error:
+            print(error)
+            return
+
+        print(f"Realna wartość {self.money_amount} zł po {self.savings_period} latach (percentyle "
+              f"{'/'.join(map(str, SIMULATED_PERCENTILES))}): {' / '.join(f'{band[-1]:.2f}' for band in bands)} zł")
+        print("\nZa chwilę wyświetlone zostanie okno z wykresem, aby kontynuować działanie programu zamknij okno.")
+
+        draw_simulated_savings(time_axis / 12, bands, SIMULATED_PERCENTILES, self.money_amount)
+        plt.show()
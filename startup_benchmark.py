@@ -0,0 +1,114 @@
+"""Skrypt mierzący czas uruchamiania programu w ścieżce obliczania 'własnej' inflacji (bez tworzenia wykresów)
+
+Czas importowania poszczególnych modułów odczytywany jest z wyniku działania interpretera uruchomionego z opcją
+'-X importtime'. Skrypt kończy się błędem (kod wyjścia 1), jeśli czas importowania przekracza zadany budżet
+lub jeśli w ścieżce tekstowej importowany jest któryś z modułów tworzących wykresy. Przykład użycia:
+
+    python startup_benchmark.py --budget-ms 300 --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+TEXT_PATH_STATEMENT = 'import main'
+FORBIDDEN_MODULES = ['matplotlib', 'show_inflation_on_graph', 'show_savings_on_graph']
+
+
+def parse_import_times(output):
+    """Odczytuje czasy importowania modułów z wyniku działania opcji '-X importtime'
+
+    Parameters
+    ----------
+    output : str
+        tekst wypisany przez interpreter na standardowe wyjście błędów
+
+    Returns
+    -------
+    import_times : dict
+        słownik, którego kluczami są nazwy modułów, a wartościami tuple z czasem własnym i czasem łącznym
+        importowania wyrażonymi w mikrosekundach
+    """
+
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        import_times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+
+    return import_times
+
+
+def measure_startup(statement=TEXT_PATH_STATEMENT, directory=None):
+    """Uruchamia interpreter z opcją '-X importtime' i mierzy czas importowania modułów
+
+    Parameters
+    ----------
+    statement : str
+        instrukcja wykonywana przez interpreter
+    directory : str
+        katalog roboczy interpretera (domyślnie katalog, w którym znajduje się ten skrypt)
+
+    Returns
+    -------
+    słownik z czasami importowania modułów (taki sam jak zwracany przez funkcję parse_import_times)
+    """
+
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=directory,
+                            capture_output=True, text=True, check=True)
+
+    return parse_import_times(result.stderr)
+
+
+def main(argv=None):
+    """Mierzy czas uruchamiania programu i porównuje go z budżetem
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    parser = argparse.ArgumentParser(description="Mierzy czas importowania modułów w ścieżce tekstowej programu.")
+    parser.add_argument('--budget-ms', type=float, default=300.0, help="dopuszczalny czas importowania w ms")
+    parser.add_argument('--runs', type=int, default=5, help="liczba pomiarów")
+    parser.add_argument('--top', type=int, default=15, help="liczba wyświetlanych najwolniejszych modułów")
+    args = parser.parse_args(argv)
+
+    runs = [measure_startup() for _ in range(args.runs)]
+    totals = [run['main'][1] / 1000 for run in runs]
+    median_total = statistics.median(totals)
+
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    print(f"{'moduł':<50}{'własny [ms]':>14}{'łączny [ms]':>14}")
+    for module, (self_time, cumulative_time) in slowest:
+        print(f"{module:<50}{self_time / 1000:>14.2f}{cumulative_time / 1000:>14.2f}")
+    print()
+    print(f"Czas importowania modułu main (mediana z {args.runs} pomiarów): {median_total:.1f} ms, "
+          f"budżet: {args.budget_ms:.1f} ms.")
+
+    failed = False
+    imported_forbidden = sorted(module for module in runs[-1] if module.split('.')[0] in FORBIDDEN_MODULES)
+    if imported_forbidden:
+        print(f"BŁĄD: w ścieżce tekstowej zaimportowano moduły tworzące wykresy: {imported_forbidden}")
+        failed = True
+    if median_total > args.budget_ms:
+        print("BŁĄD: przekroczono budżet czasu uruchamiania.")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
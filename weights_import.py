@@ -0,0 +1,200 @@
+"""Moduł umożliwiający import wielu plików z wagami jednocześnie wraz z ich walidacją
+
+Pliki tekstowe w formacie 'kategoria -> waga' odczytywane są porcjami w puli procesów. Każdy proces zwraca
+macierz (pliki x kategorie) z wagami uporządkowanymi według kategorii z pliku .csv, w której brakujące wagi
+oznaczone są wartością NaN. Walidacja wszystkich zestawów wag (kompletność względem nagłówka pliku .csv, zakres
+0-100 oraz suma równa 100) wykonywana jest wektorowo na połączonej macierzy. Odrzucone pliki opisywane są w raporcie
+błędów, który można zapisać do pliku JSON. Przykład użycia:
+
+    python weights_import.py katalog_z_wagami --store profile_wag.sqlite3 --report bledy.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from dataset_registry import get_inflation_data
+from get_user_weights import read_weights_file
+
+
+FILES_PER_TASK = 256
+
+
+def _parse_files(task):
+    """Odczytuje porcję plików z wagami (funkcja wykonywana w procesach puli)
+
+    Parameters
+    ----------
+    task : tuple
+        lista ścieżek do plików oraz lista z nazwami kategorii
+
+    Returns
+    -------
+    matrix : numpy.ndarray
+        macierz (pliki x kategorie) z wagami, w której brakujące wagi oznaczone są wartością NaN
+    unknown : list
+        lista list z nazwami nieznanych kategorii w kolejnych plikach
+    parse_errors : dict
+        słownik, którego kluczami są numery plików w porcji, a wartościami opisy błędów odczytu
+    """
+
+    paths, categories = task
+    positions = {category: position for position, category in enumerate(categories)}
+
+    matrix = np.full((len(paths), len(categories)), np.nan)
+    unknown = [[] for _ in paths]
+    parse_errors = {}
+
+    for row, path in enumerate(paths):
+        try:
+            weights = read_weights_file(path)
+        except (OSError, ValueError) as error:
+            parse_errors[row] = str(error)
+            continue
+        for category, weight in weights.items():
+            position = positions.get(category)
+            if position is None:
+                unknown[row].append(category)
+            else:
+                matrix[row, position] = weight
+
+    return matrix, unknown, parse_errors
+
+
+def validate_weight_matrix(matrix):
+    """Waliduje wektorowo wszystkie zestawy wag
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        macierz (zestawy wag x kategorie) z wagami, w której brakujące wagi oznaczone są wartością NaN
+
+    Returns
+    -------
+    słownik, którego kluczami są rodzaje błędów ('missing', 'range', 'sum'), a wartościami tablice logiczne
+    wskazujące zestawy wag z danym błędem
+    """
+
+    missing = np.isnan(matrix)
+    filled = np.where(missing, 0, matrix)
+
+    return {'missing': missing.any(axis=1),
+            'range': ((filled < 0) | (filled > 100)).any(axis=1),
+            'sum': filled.sum(axis=1) != 100}
+
+
+def import_weight_files(paths, categories, workers=None):
+    """Odczytuje i waliduje wiele plików z wagami
+
+    Parameters
+    ----------
+    paths : list
+        lista ścieżek do plików tekstowych z wagami
+    categories : list
+        lista z nazwami kategorii towarów i usług (nagłówek pliku .csv)
+    workers : int
+        liczba procesów (domyślnie liczba rdzeni procesora, 1 - odczyt w bieżącym procesie)
+
+    Returns
+    -------
+    names : list
+        lista nazw poprawnych zestawów wag (nazwy plików bez rozszerzenia)
+    weights : numpy.ndarray
+        macierz (poprawne zestawy wag x kategorie) z wagami
+    errors : list
+        lista słowników opisujących odrzucone pliki (klucze 'path', 'reasons' oraz 'message')
+    """
+
+    paths = list(paths)
+    tasks = [(paths[start:start + FILES_PER_TASK], categories) for start in range(0, len(paths), FILES_PER_TASK)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        results = [_parse_files(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_parse_files, tasks))
+
+    matrix = np.concatenate([result[0] for result in results]) if results else np.empty((0, len(categories)))
+    unknown = [row_unknown for result in results for row_unknown in result[1]]
+    parse_errors = {start + row: message for start, result in zip(range(0, len(paths), FILES_PER_TASK), results)
+                    for row, message in result[2].items()}
+
+    checks = validate_weight_matrix(matrix)
+    checks['unknown'] = np.array([bool(row_unknown) for row_unknown in unknown], dtype=bool)
+    checks['parse'] = np.zeros(len(paths), dtype=bool)
+    checks['parse'][list(parse_errors)] = True
+
+    rejected = np.logical_or.reduce(list(checks.values())) if paths else np.zeros(0, dtype=bool)
+
+    messages = {'missing': "Brak wag dla części kategorii",
+                'range': "Wagi muszą być większe lub równe 0 oraz mniejsze lub równe 100",
+                'sum': "Suma wag nie jest równa 100"}
+
+    errors = []
+    for row in np.flatnonzero(rejected).tolist():
+        if checks['parse'][row]:
+            errors.append({'path': paths[row], 'reasons': ['parse'], 'message': parse_errors[row]})
+            continue
+        reasons = [reason for reason in ('missing', 'unknown', 'range', 'sum') if checks[reason][row]]
+        errors.append({'path': paths[row], 'reasons': reasons,
+                       'message': '; '.join(f"Nieznane kategorie: {unknown[row]}" if reason == 'unknown'
+                                            else messages[reason] for reason in reasons) + '!'})
+
+    accepted = np.flatnonzero(~rejected).tolist()
+    names = [os.path.splitext(os.path.basename(paths[row]))[0] for row in accepted]
+
+    return names, np.ascontiguousarray(matrix[accepted]), errors
+
+
+def main(argv=None):
+    """Odczytuje argumenty wiersza poleceń, importuje pliki z wagami i zapisuje raport błędów
+
+    Parameters
+    ----------
+    argv : list
+        lista argumentów wiersza poleceń (domyślnie sys.argv[1:])
+
+    Returns
+    -------
+    kod wyjścia programu
+    """
+
+    from weights_store import WeightsStore
+
+    parser = argparse.ArgumentParser(description="Import i walidacja wielu plików z wagami.")
+    parser.add_argument('directory', help="katalog z plikami .txt z wagami")
+    parser.add_argument('--store', help="plik bazy danych, do którego zapisywane są poprawne zestawy wag")
+    parser.add_argument('--report', help="plik JSON, do którego zapisywany jest raport błędów")
+    parser.add_argument('--workers', type=int, help="liczba procesów (domyślnie liczba rdzeni procesora)")
+    parser.add_argument('--data', default="dane_inflacja.csv", help="plik .csv z danymi dotyczącymi inflacji")
+    args = parser.parse_args(argv)
+
+    try:
+        categories = get_inflation_data(args.data).get_categories()
+        paths = sorted(entry.path for entry in os.scandir(args.directory)
+                       if entry.is_file() and entry.name.endswith('.txt'))
+        names, weights, errors = import_weight_files(paths, categories, args.workers)
+        if args.store:
+            with WeightsStore(args.store, categories) as store:
+                store.save_many(zip(names, weights))
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(f"Poprawne zestawy wag: {len(names)}, odrzucone pliki: {len(errors)}.")
+    for error in errors[:10]:
+        print(f"{error['path']}: {error['message']}", file=sys.stderr)
+
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(errors, file, indent=2, ensure_ascii=False)
+        print(f"Raport błędów zapisano w pliku {args.report}.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,338 @@
+"""Moduł zawierający definicję klasy WeightsStore, która przechowuje zestawy wag w lokalnej bazie danych SQLite
+
+Każdy zestaw wag zapisywany jest jako jeden wiersz tabeli 'profiles': unikalna (indeksowana) nazwa oraz wagi
+w postaci tablicy float64 (BLOB) w kolejności kategorii zapisanej w tabeli 'categories'. Dzięki temu wiele
+zestawów wag może zostać odczytanych bezpośrednio do macierzy (zestawy wag x kategorie) bez otwierania osobnych
+plików i bez parsowania tekstu. Zapis i odczyt wielu zestawów wag wykonywane są w jednej transakcji.
+
+Pliki tekstowe w formacie 'kategoria -> waga' mogą być importowane do bazy danych i eksportowane z niej.
+"""
+
+import os
+import sqlite3
+import numpy as np
+from get_user_weights import write_weights_file
+from weights_import import import_weight_files
+
+
+DEFAULT_STORE_PATH = "profile_wag.sqlite3"
+
+WEIGHTS_DTYPE = np.dtype('<f8')
+
+SQLITE_MAX_VARIABLES = 900
+
+
+class WeightsStore:
+    """
+    Klasa reprezentująca bazę danych z zestawami wag
+
+    Attributes
+    ----------
+    path : str
+        ścieżka do pliku bazy danych
+    categories : list
+        lista z nazwami kategorii towarów i usług w kolejności, w jakiej zapisywane są wagi
+
+    Methods
+    ----------
+    save(name, weights)
+        zapisuje (lub nadpisuje) jeden zestaw wag
+    save_many(profiles)
+        zapisuje wiele zestawów wag w jednej transakcji
+    load(name)
+        odczytuje jeden zestaw wag jako słownik
+    load_many(names)
+        odczytuje wiele zestawów wag jako macierz
+    iter_matrices(chunk_size)
+        zwraca kolejne porcje wszystkich zestawów wag jako macierze
+    names()
+        zwraca listę nazw zapisanych zestawów wag
+    delete(name)
+        usuwa zestaw wag
+    import_text_files(paths, workers)
+        importuje zestawy wag z plików tekstowych
+    export_text_files(directory, names)
+        eksportuje zestawy wag do plików tekstowych
+    close()
+        zamyka połączenie z bazą danych
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, categories=None):
+        """Otwiera bazę danych (tworząc ją w razie potrzeby)
+
+        Parameters
+        ----------
+        path : str
+            ścieżka do pliku bazy danych
+        categories : list
+            lista z nazwami kategorii towarów i usług; wymagana przy tworzeniu nowej bazy danych, a w przypadku
+            istniejącej bazy musi być zgodna z zapisaną w niej listą kategorii
+
+        Raises
+        -------
+        ValueError
+            Jeśli nie podano kategorii dla nowej bazy danych lub podane kategorie różnią się od zapisanych w bazie
+        """
+
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS categories "
+                                     "(position INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS profiles "
+                                     "(id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, weights BLOB NOT NULL)")
+
+        stored = [row[0] for row in self._connection.execute("SELECT name FROM categories ORDER BY position")]
+        if not stored:
+            if not categories:
+                self.close()
+                raise ValueError(f"Baza danych {path} nie zawiera listy kategorii - należy ją podać!")
+            with self._connection:
+                self._connection.executemany("INSERT INTO categories (position, name) VALUES (?, ?)",
+                                             enumerate(categories))
+            stored = list(categories)
+        elif categories is not None and list(categories) != stored:
+            self.close()
+            raise ValueError(f"Kategorie w bazie danych {path} różnią się od kategorii w pliku z danymi!")
+
+        self.categories = stored
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def _to_blob(self, weights):
+        """Zamienia słownik lub tablicę z wagami na tablicę float64 zapisaną jako bajty
+
+        Raises
+        -------
+        ValueError
+            Jeśli w słowniku brakuje wagi dla którejś z kategorii lub tablica ma niepoprawną długość
+        """
+
+        if isinstance(weights, dict):
+            try:
+                weights = [weights[category] for category in self.categories]
+            except KeyError as error:
+                raise ValueError(f"Brak wagi dla kategorii {error}!")
+
+        vector = np.asarray(weights, dtype=WEIGHTS_DTYPE)
+        if vector.shape != (len(self.categories),):
+            raise ValueError(f"Liczba wag musi być równa liczbie kategorii ({len(self.categories)})!")
+
+        return vector.tobytes()
+
+    def _to_matrix(self, blobs):
+        """Zamienia listę tablic zapisanych jako bajty na macierz (zestawy wag x kategorie)"""
+
+        return np.frombuffer(b''.join(blobs), dtype=WEIGHTS_DTYPE).reshape(len(blobs), len(self.categories))
+
+    def save(self, name, weights):
+        """Zapisuje (lub nadpisuje) jeden zestaw wag
+
+        Parameters
+        ----------
+        name : str
+            nazwa zestawu wag
+        weights : dict, numpy.ndarray
+            słownik z wagami lub tablica z wagami w kolejności atrybutu 'categories'
+        """
+
+        self.save_many([(name, weights)])
+
+    def save_many(self, profiles):
+        """Zapisuje (lub nadpisuje) wiele zestawów wag w jednej transakcji
+
+        Parameters
+        ----------
+        profiles : iterable
+            tuple z nazwą zestawu wag oraz słownikiem lub tablicą z wagami
+
+        Returns
+        -------
+        liczba zapisanych zestawów wag
+
+        Raises
+        -------
+        ValueError
+            Jeśli któryś z zestawów wag nie odpowiada kategoriom (żaden zestaw nie zostaje wtedy zapisany)
+        """
+
+        rows = [(name, self._to_blob(weights)) for name, weights in profiles]
+        with self._connection:
+            self._connection.executemany("INSERT INTO profiles (name, weights) VALUES (?, ?) "
+                                         "ON CONFLICT (name) DO UPDATE SET weights = excluded.weights", rows)
+
+        return len(rows)
+
+    def load(self, name):
+        """Odczytuje jeden zestaw wag
+
+        Parameters
+        ----------
+        name : str
+            nazwa zestawu wag
+
+        Returns
+        -------
+        weights : dict
+            słownik, którego kluczami są nazwy kategorii, a wartościami wagi
+
+        Raises
+        -------
+        KeyError
+            Jeśli w bazie danych nie ma zestawu wag o podanej nazwie
+        """
+
+        row = self._connection.execute("SELECT weights FROM profiles WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+
+        vector = np.frombuffer(row[0], dtype=WEIGHTS_DTYPE)
+        weights = {category: int(weight) if weight.is_integer() else weight
+                   for category, weight in zip(self.categories, vector.tolist())}
+
+        return weights
+
+    def load_many(self, names):
+        """Odczytuje wiele zestawów wag w jednej transakcji
+
+        Parameters
+        ----------
+        names : list
+            lista nazw zestawów wag
+
+        Returns
+        -------
+        macierz (zestawy wag x kategorie) z wagami w kolejności podanych nazw
+
+        Raises
+        -------
+        KeyError
+            Jeśli w bazie danych nie ma któregoś z zestawów wag
+        """
+
+        found = {}
+        with self._connection:
+            for start in range(0, len(names), SQLITE_MAX_VARIABLES):
+                chunk = names[start:start + SQLITE_MAX_VARIABLES]
+                query = f"SELECT name, weights FROM profiles WHERE name IN ({', '.join('?' * len(chunk))})"
+                found.update(self._connection.execute(query, chunk))
+
+        missing = [name for name in names if name not in found]
+        if missing:
+            raise KeyError(f"Brak zestawów wag w bazie danych: {missing}")
+
+        return self._to_matrix([found[name] for name in names])
+
+    def iter_matrices(self, chunk_size=1024):
+        """Zwraca kolejne porcje wszystkich zestawów wag (w kolejności nazw)
+
+        Parameters
+        ----------
+        chunk_size : int
+            maksymalna liczba zestawów wag w jednej porcji
+
+        Yields
+        -------
+        names : list
+            lista nazw zestawów wag
+        weights : numpy.ndarray
+            macierz (zestawy wag x kategorie) z wagami
+        """
+
+        cursor = self._connection.execute("SELECT name, weights FROM profiles ORDER BY name")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            names, blobs = zip(*rows)
+            yield list(names), self._to_matrix(blobs)
+
+    def names(self):
+        """
+        Returns
+        ----------
+        lista nazw zapisanych zestawów wag (w kolejności alfabetycznej)
+        """
+
+        return [row[0] for row in self._connection.execute("SELECT name FROM profiles ORDER BY name")]
+
+    def delete(self, name):
+        """Usuwa zestaw wag
+
+        Parameters
+        ----------
+        name : str
+            nazwa zestawu wag
+
+        Raises
+        -------
+        KeyError
+            Jeśli w bazie danych nie ma zestawu wag o podanej nazwie
+        """
+
+        with self._connection:
+            if self._connection.execute("DELETE FROM profiles WHERE name = ?", (name,)).rowcount == 0:
+                raise KeyError(name)
+
+    def import_text_files(self, paths, workers=None):
+        """Importuje zestawy wag z plików tekstowych w formacie 'kategoria -> waga'
+
+        Pliki odczytywane i walidowane są w puli procesów (funkcja import_weight_files). Nazwą zestawu wag jest
+        nazwa pliku bez rozszerzenia. Poprawne zestawy wag zapisywane są w jednej transakcji, a pliki z błędami
+        są pomijane.
+
+        Parameters
+        ----------
+        paths : iterable
+            ścieżki do plików tekstowych z wagami
+        workers : int
+            liczba procesów (domyślnie liczba rdzeni procesora, 1 - odczyt w bieżącym procesie)
+
+        Returns
+        -------
+        imported : int
+            liczba zaimportowanych zestawów wag
+        errors : list
+            lista słowników opisujących pominięte pliki (klucze 'path', 'reasons' oraz 'message')
+        """
+
+        names, weights, errors = import_weight_files(paths, self.categories, workers)
+
+        return self.save_many(zip(names, weights)), errors
+
+    def export_text_files(self, directory, names=None):
+        """Eksportuje zestawy wag do plików tekstowych w formacie 'kategoria -> waga'
+
+        Parameters
+        ----------
+        directory : str
+            katalog, w którym zapisywane są pliki (nazwa pliku to nazwa zestawu wag z rozszerzeniem .txt)
+        names : list
+            lista nazw eksportowanych zestawów wag (domyślnie wszystkie zestawy wag)
+
+        Returns
+        -------
+        liczba wyeksportowanych zestawów wag
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        names = self.names() if names is None else names
+
+        for name in names:
+            write_weights_file(os.path.join(directory, f"{name}.txt"), self.load(name))
+
+        return len(names)
+
+    def close(self):
+        """Zamyka połączenie z bazą danych"""
+
+        self._connection.close()